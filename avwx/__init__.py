@@ -1,14 +1,52 @@
 """.. include:: ../docs/launch.md"""
 
-# ruff: noqa: F401
-
-from avwx.current.airsigmet import AirSigManager, AirSigmet
-from avwx.current.metar import Metar
-from avwx.current.notam import Notams
-from avwx.current.pirep import Pireps
-from avwx.current.taf import Taf
-from avwx.forecast.gfs import Mav, Mex
-from avwx.forecast.nbm import Nbe, Nbh, Nbs, Nbx
-from avwx.station import Station
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from avwx.load_utils import submodule_getattr
+
+if TYPE_CHECKING:
+    from avwx.current.airsigmet import AirSigManager, AirSigmet
+    from avwx.current.metar import Metar
+    from avwx.current.notam import Notams
+    from avwx.current.pirep import Pireps
+    from avwx.current.taf import Taf
+    from avwx.forecast.gfs import Mav, Mex
+    from avwx.forecast.nbm import Nbe, Nbh, Nbs, Nbx
+    from avwx.station import Station
+
+# Report classes are imported on first access so that importing the package
+# only loads the modules a caller actually uses
+_LAZY_IMPORTS = {
+    "AirSigManager": "avwx.current.airsigmet",
+    "AirSigmet": "avwx.current.airsigmet",
+    "Metar": "avwx.current.metar",
+    "Notams": "avwx.current.notam",
+    "Pireps": "avwx.current.pirep",
+    "Taf": "avwx.current.taf",
+    "Mav": "avwx.forecast.gfs",
+    "Mex": "avwx.forecast.gfs",
+    "Nbe": "avwx.forecast.nbm",
+    "Nbh": "avwx.forecast.nbm",
+    "Nbs": "avwx.forecast.nbm",
+    "Nbx": "avwx.forecast.nbm",
+    "Station": "avwx.station",
+}
+
+_submodule = submodule_getattr(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    value = getattr(import_module(module), name) if module else _submodule(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 # NOTE: __all__ is not implemented here due to pdoc build
@@ -8,9 +8,11 @@ from abc import ABCMeta, abstractmethod
 from contextlib import suppress
 from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 # module
 from avwx.exceptions import BadStation
+from avwx.service.base import run
 from avwx.station import Station
 
 if TYPE_CHECKING:
@@ -22,6 +24,14 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+#: In-flight report updates shared by concurrent callers, kept per event loop
+_INFLIGHT: WeakKeyDictionary[
+    aio.AbstractEventLoop, dict[tuple, aio.Task[tuple[ManagedReport, str | None, bool]]]
+] = WeakKeyDictionary()
+
+# Report attributes that identify the object rather than hold fetched data
+_IDENTITY_ATTRS = frozenset(("code", "station", "service"))
+
 
 def find_station(report: str) -> Station | None:
     """Returns the first Station found in a report string"""
@@ -148,13 +158,39 @@ class ManagedReport(AVWXBase, metaclass=ABCMeta):
         """
         report = self.service.fetch(self.code, timeout=timeout)  # type: ignore
         self.source = self.service.root
-        return aio.run(self._update(report, None, disable_post=disable_post))
+        return run(self._update(report, None, disable_post=disable_post))
 
     async def async_update(self, timeout: int = 10, *, disable_post: bool = False) -> bool:
         """Async update report data by fetching and parsing the report.
 
+        Concurrent updates for the same report type and station share a single
+        fetch and parse. Waiting reports copy the result and share its parsed
+        data objects.
+
         Returns True if a new report is available, else False.
         """
+        key = (self.__class__, self.code, self.service.__class__, self.service.report_type, disable_post)
+        inflight = _INFLIGHT.setdefault(aio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is None:
+            task = aio.ensure_future(self._fetch_update(timeout, disable_post=disable_post))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared update
+        leader, report, updated = await aio.shield(task)
+        if leader is self:
+            return updated
+        return self._copy_update(leader, report)
+
+    async def _fetch_update(self, timeout: int, *, disable_post: bool) -> tuple[Self, str | None, bool]:
         report = await self.service.async_fetch(self.code, timeout=timeout)  # type: ignore
         self.source = self.service.root
-        return await self._update(report, None, disable_post=disable_post)
+        return self, report, await self._update(report, None, disable_post=disable_post)
+
+    def _copy_update(self, other: Self, report: str | None) -> bool:
+        """Copy the fetched report data from another report of the same type and station."""
+        self.source = other.source
+        if not report or report == self.raw:
+            return False
+        self.__dict__.update({k: v for k, v in vars(other).items() if k not in _IDENTITY_ATTRS})
+        return True
@@ -0,0 +1,3 @@
+from avwx.load_utils import submodule_getattr
+
+__getattr__ = submodule_getattr(__name__)
@@ -25,18 +25,15 @@ import re
 from contextlib import suppress
 from datetime import date, datetime, timezone
 from itertools import chain
-from typing import TypeAlias
-
-# library
-from geopy.distance import distance as geo_distance  # type: ignore
+from typing import TYPE_CHECKING, Any
 
 # module
 from avwx import exceptions
 from avwx.base import AVWXBase
-from avwx.exceptions import MissingExtraModule
 from avwx.flight_path import to_coordinates
 from avwx.load_utils import LazyLoad
 from avwx.parsing import core
+from avwx.service.base import run
 from avwx.service.bulk import NoaaBulk, NoaaIntl, Service
 from avwx.static.airsigmet import BULLETIN_TYPES, INTENSITY, WEATHER_TYPES
 from avwx.static.core import CARDINAL_DEGREES, CARDINALS
@@ -50,12 +47,14 @@ from avwx.structs import (
     Number,
     Timestamp,
     Units,
+    _import_shapely,
 )
 
-try:
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from shapely import STRtree
     from shapely.geometry import LineString
-except ModuleNotFoundError:
-    LineString = TypeAlias  # type: ignore
 
 
 class AirSigmet(AVWXBase):
@@ -96,15 +95,12 @@ class AirSigmet(AVWXBase):
 
     def intersects(self, path: LineString) -> bool:
         """Returns True if the report area intersects a flight path"""
-        if LineString is None:
-            extra = "shape"
-            raise MissingExtraModule(extra)
         if not self.data:
             return False
         for data in (self.data.observation, self.data.forecast):
             if data:
-                poly = data.poly
-                if poly and path.intersects(poly):
+                poly = data.prepared_poly
+                if poly and poly.intersects(path):
                     return True
         return False
 
@@ -114,8 +110,8 @@ class AirSigmet(AVWXBase):
             return False
         for data in (self.data.observation, self.data.forecast):
             if data:
-                poly = data.poly
-                if poly and coord.point.within(poly):
+                poly = data.prepared_poly
+                if poly and poly.contains(coord.point):
                     return True
         return False
 
@@ -144,17 +140,57 @@ class AirSigManager:
     >>> manager.reports[0].data.type
     'AIRMET SIERRA FOR IFR AND MTN OBSCN'
     ```
+
+    Parsed reports are kept between updates and keyed by their raw string and
+    source, so only newly seen reports are parsed on each update. The reports
+    added and removed by the most recent update are available as `added` and
+    `removed`. Set `incremental` to False to parse every report on each update.
+
+    Parsing runs inside the event loop by default. Supply an executor to run
+    report parsing off the loop instead.
+
+    ```python
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> manager = AirSigManager(ProcessPoolExecutor(4))
+    >>> await manager.async_update()
+    True
+    >>> len(manager.added), len(manager.removed)
+    (4, 2)
+    ```
     """
 
     _services: list[Service]
     _raw: list[tuple[str, str | None]]
+    _parsed: dict[tuple[str, str | None], AirSigmet]
+    _executor: Executor | None
+    _index: tuple[STRtree, list[AirSigmet]] | None = None
+    _reports: list[AirSigmet] | None = None
+    incremental: bool
     last_updated: datetime | None = None
     raw: list[str]
-    reports: list[AirSigmet] | None = None
+    added: list[AirSigmet]
+    removed: list[AirSigmet]
 
-    def __init__(self):  # type: ignore
+    def __init__(self, executor: Executor | None = None, *, incremental: bool = True) -> None:
         self._services = [NoaaBulk("airsigmet"), NoaaIntl("airsigmet")]
         self._raw, self.raw = [], []
+        self._parsed = {}
+        self._executor = executor
+        self.incremental = incremental
+        self.added, self.removed = [], []
+
+    @property
+    def reports(self) -> list[AirSigmet] | None:
+        """Parsed reports from the most recent update.
+
+        Assign a new list rather than editing it in place to update the spatial index.
+        """
+        return self._reports
+
+    @reports.setter
+    def reports(self, value: list[AirSigmet] | None) -> None:
+        self._reports = value
+        self._index = None
 
     async def _update(self, index: int, timeout: int) -> list[tuple[str, str | None]]:
         source = self._services[index].root
@@ -162,9 +198,38 @@ class AirSigManager:
         raw: list[tuple[str, str | None]] = [(report, source) for report in reports if report]
         return raw
 
+    async def _parse(self, raw: list[tuple[str, str | None]]) -> list[AirSigmet]:
+        """Parse new raw reports and evict expired ones from the parsed cache."""
+        previous = self._parsed if self.incremental else {}
+        loop = aio.get_running_loop()
+        keys = list(dict.fromkeys(raw))
+        results: dict[tuple[str, str | None], AirSigmet | Exception | None] = {}
+        pending = {}
+        for key in keys:
+            if key in previous:
+                results[key] = previous[key]
+            elif self._executor is None:
+                results[key] = _parse_report(*key)
+            else:
+                pending[key] = loop.run_in_executor(self._executor, _parse_report, *key)
+        if pending:
+            parsed = await aio.gather(*pending.values())
+            results.update(zip(pending.keys(), parsed, strict=True))
+        current: dict[tuple[str, str | None], AirSigmet] = {}
+        for key in keys:
+            result = results[key]
+            if isinstance(result, Exception):
+                exceptions.exception_intercept(result, raw={"report": key[0]})
+            elif result:
+                current[key] = result
+        self.added = [r for k, r in current.items() if k not in self._parsed]
+        self.removed = [r for k, r in self._parsed.items() if k not in current]
+        self._parsed = current
+        return [current[key] for key in raw if key in current]
+
     def update(self, timeout: int = 10, *, disable_post: bool = False) -> bool:
         """Updates fetched reports and returns whether they've changed"""
-        return aio.run(self.async_update(timeout, disable_post=disable_post))
+        return run(self.async_update(timeout, disable_post=disable_post))
 
     async def async_update(self, timeout: int = 10, *, disable_post: bool = False) -> bool:
         """Updates fetched reports and returns whether they've changed"""
@@ -178,32 +243,73 @@ class AirSigManager:
         self.last_updated = datetime.now(tz=timezone.utc)
         # Parse reports if not disabled
         if not disable_post:
-            parsed = []
-            for report, source in raw:
-                try:
-                    if obj := AirSigmet.from_report(report):
-                        obj.source = source
-                        parsed.append(obj)
-                except Exception as exc:  # noqa: BLE001
-                    exceptions.exception_intercept(exc, raw={"report": report})
-            self.reports = parsed
+            self.reports = await self._parse(raw)
+            with suppress(ModuleNotFoundError):
+                self._spatial_index()
         return True
 
+    def _spatial_index(self) -> tuple[STRtree, list[AirSigmet]]:
+        """Return an R-tree of report polygons and the report owning each polygon.
+
+        The tree is built on first use after the reports are assigned.
+        """
+        if self._index is None:
+            shapely = _import_shapely()
+            polys, owners = [], []
+            for report in self._reports or []:
+                if not report.data:
+                    continue
+                for data in (report.data.observation, report.data.forecast):
+                    if data and (poly := data.poly):
+                        polys.append(poly)
+                        owners.append(report)
+            self._index = shapely.STRtree(polys), owners
+        return self._index
+
+    def _query(self, geometry: Any, predicate: str) -> list[list[AirSigmet]]:
+        """Return the reports matching the predicate for each geometry in an array."""
+        tree, owners = self._spatial_index()
+        hits: list[set[int]] = [set() for _ in range(len(geometry))]
+        for source, target in zip(*tree.query(geometry, predicate=predicate), strict=True):
+            hits[source].add(target)
+        # Polygons are indexed in report order, so sorting keeps the reports in order
+        return [list(dict.fromkeys(owners[i] for i in sorted(found))) for found in hits]
+
     def along(self, coords: list[Coord]) -> list[AirSigmet]:
         """Returns available reports the intersect a flight path"""
-        if LineString is None:
-            extra = "shape"
-            raise MissingExtraModule(extra)
         if self.reports is None:
             return []
-        path = LineString([c.pair for c in coords])
-        return [r for r in self.reports if r.intersects(path)]
+        path = _import_shapely().LineString([c.pair for c in coords])
+        return self._query([path], "intersects")[0]
 
     def contains(self, coord: Coord) -> list[AirSigmet]:
         """Returns available reports that contain a coordinate"""
         if self.reports is None:
             return []
-        return [r for r in self.reports if r.contains(coord)]
+        return self._query([coord.point], "within")[0]
+
+    def contains_many(self, coords: list[Coord]) -> list[list[AirSigmet]]:
+        """Returns available reports that contain each coordinate"""
+        if self.reports is None:
+            return [[] for _ in coords]
+        if not coords:
+            return []
+        points = _import_shapely().points([c.pair for c in coords])
+        return self._query(points, "within")
+
+
+def _parse_report(report: str, source: str | None) -> AirSigmet | Exception | None:
+    """Parse a report string, returning any raised exception to intercept later.
+
+    Defined at the module level so it can be sent to a process pool.
+    """
+    try:
+        obj = AirSigmet.from_report(report)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+    if obj:
+        obj.source = source
+    return obj
 
 
 # N1429 W09053 - N1427 W09052 - N1411 W09139 - N1417 W09141
@@ -431,6 +537,8 @@ def _coords_from_text(report: str, start: int) -> tuple[str, list[Coord], int]:
 
 def _coords_from_navaids(report: str, start: int) -> tuple[str, list[Coord], int]:
     """Extract navaid referenced coordinates from report Ex: 30SSW BNA"""
+    from geopy.distance import distance as geo_distance  # type: ignore
+
     coords, navs = [], []
     for match in _NAVAID_PATTERN.finditer(_pre_break(report)):
         group, start = _info_from_match(match, start)
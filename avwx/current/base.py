@@ -9,12 +9,20 @@ from typing import TYPE_CHECKING
 # module
 from avwx.base import ManagedReport
 from avwx.service import get_service
+from avwx.service.base import run
+from avwx.service.scrape import NoaaApi
 from avwx.static.core import WX_TRANSLATIONS
 from avwx.structs import Code, Coord, ReportData, ReportTrans, Sanitization, Units
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable
     from datetime import date
 
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
 
 def wx_code(code: str) -> Code | str:
     """Translate weather codes into readable strings.
@@ -73,6 +81,93 @@ class Report(ManagedReport):
             service = get_service(code, self.station.country)
             self.service = service(self.__class__.__name__.lower())  # type: ignore
 
+    @classmethod
+    def update_many(
+        cls,
+        codes: Iterable[str],
+        timeout: int = 10,
+        chunk_size: int = 100,
+        *,
+        disable_post: bool = False,
+    ) -> list[Self | Exception]:
+        """Create and update reports for many stations.
+
+        See `async_update_many` for details.
+        """
+        return run(cls.async_update_many(codes, timeout, chunk_size, disable_post=disable_post))
+
+    @classmethod
+    async def async_update_many(
+        cls,
+        codes: Iterable[str],
+        timeout: int = 10,
+        chunk_size: int = 100,
+        *,
+        disable_post: bool = False,
+    ) -> list[Self | Exception]:
+        """Async create and update reports for many stations.
+
+        Stations served by NOAA are fetched together in chunks of `chunk_size`
+        stations per request. Other stations update from their regional service.
+        Returns the report objects in the order of the given codes. If a station
+        fails to load or update, its place holds the raised exception instead
+        so that one failure doesn't discard the other reports.
+
+        ```python
+        >>> from avwx import Metar
+        >>> reports = Metar.update_many(["KJFK", "KLGA", "EWR", "NOPE"])
+        >>> [getattr(r.data, "flight_rules", r) for r in reports]
+        ['VFR', 'VFR', 'MVFR', BadStation('Could not find station with ident NOPE')]
+        ```
+        """
+        results: list[Self | Exception] = []
+        for code in codes:
+            try:
+                results.append(cls(code))
+            except Exception as exc:  # noqa: BLE001
+                results.append(exc)
+        updates: dict[int, Awaitable[bool]] = {}
+        batch: dict[int, str] = {}
+        for i, report in enumerate(results):
+            if isinstance(report, Exception):
+                continue
+            if not isinstance(report.service, NoaaApi):
+                updates[i] = report.async_update(timeout, disable_post=disable_post)
+                continue
+            # NOAA returns reports by ICAO even when given an IATA or local ident
+            try:
+                batch[i] = report.station.lookup_code  # type: ignore
+            except Exception as exc:  # noqa: BLE001
+                results[i] = exc
+        if batch:
+            service = NoaaApi(cls.__name__.lower())
+            idents = list(dict.fromkeys(batch.values()))
+            chunks = [idents[i : i + chunk_size] for i in range(0, len(idents), chunk_size)]
+            coros = [service.async_fetch_many(chunk, timeout, chunk_size) for chunk in chunks]
+            fetched: dict[str, str | BaseException] = {}
+            for chunk, found in zip(chunks, await aio.gather(*coros, return_exceptions=True), strict=True):
+                fetched.update({c: found if isinstance(found, BaseException) else found.get(c, "") for c in chunk})
+            for i, ident in batch.items():
+                raw = fetched[ident]
+                if isinstance(raw, BaseException):
+                    results[i] = _as_exception(raw)
+                    continue
+                report = results[i]
+                report.source = service.root  # type: ignore
+                updates[i] = report._update(raw, None, disable_post=disable_post)  # type: ignore
+        done = await aio.gather(*updates.values(), return_exceptions=True)
+        for i, result in zip(updates, done, strict=True):
+            if isinstance(result, BaseException):
+                results[i] = _as_exception(result)
+        return results
+
+
+def _as_exception(error: BaseException) -> Exception:
+    """Return an update error to the caller but re-raise cancellation and exits."""
+    if isinstance(error, Exception):
+        return error
+    raise error
+
 
 class Reports(ManagedReport):
     """Base class containing multiple reports."""
@@ -133,7 +228,7 @@ class Reports(ManagedReport):
 
         Returns True if new reports are available, else False
         """
-        return aio.run(self.async_update(timeout, disable_post=disable_post))
+        return run(self.async_update(timeout, disable_post=disable_post))
 
     async def async_update(self, timeout: int = 10, *, disable_post: bool = False) -> bool:
         """Async update report data by fetching and parsing the report."""
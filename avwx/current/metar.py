@@ -11,9 +11,13 @@ from __future__ import annotations
 
 from contextlib import suppress
 from datetime import date, datetime, timedelta, timezone
+from itertools import repeat
+from typing import TYPE_CHECKING
 
 # module
+from avwx.base import find_station
 from avwx.current.base import Report, get_wx_codes
+from avwx.exceptions import BadStation
 from avwx.parsing import core, remarks, speech, summary
 from avwx.parsing.sanitization.metar import clean_metar_list, clean_metar_string
 from avwx.parsing.translate.metar import translate_metar
@@ -32,6 +36,9 @@ from avwx.structs import (
     Units,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class Metar(Report):
     """The Metar class offers an object-oriented approach to managing METAR data
@@ -110,18 +117,7 @@ class Metar(Report):
         """Add the pressure and density altitudes to data if all fields are available."""
         if self.data is None or self.station is None or self.units is None:
             return
-        # Select decimal temperature if available
-        temp = self.data.temperature
-        if self.data.remarks_info is not None:
-            temp = self.data.remarks_info.temperature_decimal or temp
-        alt = self.data.altimeter
-        if temp is None or temp.value is None or alt is None or alt.value is None:
-            return
-        elev = self.station.elevation_ft
-        if elev is None:
-            return
-        self.data.pressure_altitude = core.pressure_altitude(alt.value, elev, self.units.altimeter)
-        self.data.density_altitude = core.density_altitude(alt.value, temp.value, elev, self.units)
+        calculate_altitudes(self.data, self.units, self.station.elevation_ft)
 
     async def _post_update(self) -> None:
         if self.code is None or self.raw is None:
@@ -211,8 +207,7 @@ def _parse_rvr_number(value: str) -> Number | None:
         value = value[1:]
     number = core.make_number(value, raw)
     if number is not None and prefix is not None:
-        number.spoken = f"{prefix} {number.spoken}"
-        number.value = None
+        number = core.replace_number(number, value=None, speak_prefix=f"{prefix} ")
     return number
 
 
@@ -346,6 +341,21 @@ def get_relative_humidity(
     return core.relative_humidity(temp.value, dew.value, units.temperature)
 
 
+def calculate_altitudes(data: MetarData, units: Units, elevation_ft: int | None) -> None:
+    """Add the pressure and density altitudes to data if all fields are available."""
+    # Select decimal temperature if available
+    temp = data.temperature
+    if data.remarks_info is not None:
+        temp = data.remarks_info.temperature_decimal or temp
+    alt = data.altimeter
+    if temp is None or temp.value is None or alt is None or alt.value is None:
+        return
+    if elevation_ft is None:
+        return
+    data.pressure_altitude = core.pressure_altitude(alt.value, elevation_ft, units.altimeter)
+    data.density_altitude = core.density_altitude(alt.value, temp.value, elevation_ft, units)
+
+
 def sanitize(report: str) -> tuple[str, str, list[str], Sanitization]:
     """Return a sanitized report, remarks, and elements ready for parsing."""
     sans = Sanitization()
@@ -472,3 +482,53 @@ def parse_in(report: str, issued: date | None = None) -> tuple[MetarData, Units,
         wx_codes=wx_codes,
     )
     return struct, units, sans
+
+
+ParseResult = tuple[MetarData, Units, Sanitization]
+
+
+def _parse_one(report: str, issued: date | None = None) -> ParseResult | Exception:
+    """Parse a single report string, returning any raised exception instead."""
+    report = report.strip()
+    try:
+        station = find_station(report)
+        if station is None:
+            msg = f"Could not find a station in report: {report}"
+            return BadStation(msg)
+        data, units, sans = parse(station.lookup_code, report, issued)
+        if data is None or units is None or sans is None:
+            return ValueError("Cannot parse an empty report")
+        calculate_altitudes(data, units, station.elevation_ft)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+    return data, units, sans
+
+
+def parse_many(
+    reports: Iterable[str],
+    issued: date | None = None,
+    workers: int | None = None,
+    chunksize: int = 64,
+) -> list[ParseResult | Exception]:
+    """Parse many METAR strings, such as those from a `NoaaBulk` fetch.
+
+    This skips creating a `Metar` object and service for each report. Results
+    are returned in the same order as the given reports. Items that could not
+    be parsed are returned as the raised exception rather than stopping the batch.
+
+    Reports are parsed in a process pool when `workers` is greater than one.
+
+    ```python
+    >>> from avwx.current.metar import parse_many
+    >>> from avwx.service.bulk import NoaaBulk
+    >>> reports = NoaaBulk("metar").fetch()
+    >>> results = parse_many(reports, workers=4)
+    >>> data, units, sans = results[0]
+    ```
+    """
+    if not workers or workers < 2:
+        return [_parse_one(report, issued) for report in reports]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_one, reports, repeat(issued), chunksize=chunksize))
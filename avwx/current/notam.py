@@ -29,9 +29,6 @@ import re
 from contextlib import suppress
 from datetime import datetime, timezone
 
-# library
-from dateutil.tz import gettz
-
 # module
 from avwx import exceptions
 from avwx.current.base import Reports
@@ -318,6 +315,8 @@ def _tz_offset_for(name: str | None) -> timezone | None:
     """Generate a timezone from tz string name."""
     if not name:
         return None
+    from dateutil.tz import gettz
+
     if tz := gettz(name):  # noqa: SIM102
         if offset := tz.utcoffset(datetime.now(timezone.utc)):
             return timezone(offset)
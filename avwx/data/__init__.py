@@ -17,10 +17,13 @@ True
 ```
 
 This updates all package data files and
-`avwx.station.meta.__STATIONS_UPDATED__` date. Due to how this data is managed,
-you should only run updates prior to starting your primary Python application.
-Doing so during an existing run may still use old data depending on the
-architecture of your program.
+`avwx.station.meta.__STATIONS_UPDATED__` date. Station info is saved as JSON
+along with a binary store that is memory-mapped at runtime. If the store is
+missing or older than the JSON, stations are loaded from the JSON instead.
+
+Station data already in use is not replaced automatically. Call
+`avwx.station.reload` after updating to swap in the new station data without
+restarting. Navaid and aircraft updates still require a restart.
 """
 
 from avwx.data.build_aircraft import main as update_aircraft
@@ -5,6 +5,9 @@ http://ourairports.com/data/
 
 Source file for stations.txt can be downloaded from
 https://www.aviationweather.gov/docs/metar/stations.txt
+
+The JSON output is the source format. A binary station store is built from it
+for fast memory-mapped lookups at runtime.
 """
 
 # stdlib
@@ -23,6 +26,7 @@ import httpx
 
 # module
 from avwx.data.mappers import FILE_REPLACE, SURFACE_TYPES
+from avwx.load_utils import write_station_store
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -40,6 +44,7 @@ _FILE_DIR = Path(__file__).parent
 _DATA = _FILE_DIR / "files"
 GOOD_PATH = _DATA / "good_stations.txt"
 OUTPUT_PATH = _DATA / "stations.json"
+STORE_PATH = _DATA / "stations.bin"
 
 
 DATA_ROOT = "https://davidmegginson.github.io/ourairports-data/"
@@ -263,6 +268,14 @@ def save_station_data(stations: dict) -> None:
         json.dump(stations, fout, sort_keys=True, indent=1, ensure_ascii=False)
 
 
+def save_station_store(stations: dict | None = None) -> None:
+    """Save stations to the binary station store, loading the JSON output if not given."""
+    if stations is None:
+        with OUTPUT_PATH.open(encoding="utf8") as fin:
+            stations = json.load(fin)
+    write_station_store(stations, STORE_PATH)
+
+
 def main() -> int:
     """Build/update the stations.json main file."""
     log.info("Fetching")
@@ -281,6 +294,7 @@ def main() -> int:
     stations = add_runways(stations, code_map)
     log.info("Saving")
     save_station_data(stations)
+    save_station_store(stations)
     log.info("Updating station date")
     update_station_info_date()
     return len(stations)
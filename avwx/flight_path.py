@@ -2,9 +2,6 @@
 
 from __future__ import annotations
 
-# library
-from geopy.distance import great_circle  # type: ignore
-
 # module
 from avwx.exceptions import BadStation
 from avwx.load_utils import LazyLoad
@@ -16,6 +13,8 @@ QCoord = Coord | list[Coord]
 
 
 def _distance(near: Coord, far: Coord) -> float:
+    from geopy.distance import great_circle  # type: ignore
+
     circle = great_circle(near.pair, far.pair).nm
     if not isinstance(circle, float):
         msg = "Could not evaluate great circle distance"
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import json
+import math
+import mmap
+import struct
+from bisect import bisect_left
+from collections.abc import ItemsView, Mapping, ValuesView
+from contextlib import suppress
+from copy import copy
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, ItemsView, Iterator, KeysView, ValuesView
+    from collections.abc import Callable, Iterable, Iterator, KeysView, Sequence
+
+    from avwx.station.spatial import CoordTree
 
 
 class LazyLoad:
@@ -60,6 +71,560 @@ class LazyLoad:
         return self.data.values()
 
 
+# Binary station store
+#
+# Layout: header, string offsets, UTF-8 string data, sorted fixed-width station
+# keys, station records in key order, runway records, sorted fixed-width codes,
+# code records, coordinates, coordinate flags, and a serialized coordinate tree
+# for each filter flag combination. Records are fixed
+# width and reference interned strings by index so a single station can be
+# decoded without reading the rest.
+
+_STORE_MAGIC = b"AVWXSTN\x00"
+_STORE_VERSION = 5
+# magic, version, station/runway/string counts, key width, code count, code width, then section offsets
+_HEADER = struct.Struct("<8s7I13Q")
+_NO_STR = 0xFFFFFFFF
+_NO_INT = -(2**31)
+_OFFSETS = struct.Struct("<2I")
+
+_STATION_STRS = (
+    "city",
+    "country",
+    "gps",
+    "iata",
+    "icao",
+    "local",
+    "name",
+    "note",
+    "state",
+    "type",
+    "website",
+    "wiki",
+)
+# string fields, lat, lon, elevation ft/m, first runway, runway count, reporting, has runways
+_STATION = struct.Struct(f"<{len(_STATION_STRS)}IddiiIHBB")
+# length, width, surface, ident1, ident2, bearing1, bearing2, lights
+_RUNWAY = struct.Struct("<iiIIIddB")
+# station index for each code type
+_CODES = struct.Struct("<4I")
+# lookup code, lat, lon
+_COORD = struct.Struct("<Idd")
+
+# Bits in the coordinate flags used to filter nearest station queries
+COORD_AIRPORT = 1
+COORD_REPORTING = 2
+# Every combination of coordinate flags has its own coordinate tree
+COORD_FILTERS = range(4)
+
+
+class StationCodes(NamedTuple):
+    """Station keys that use a code as each code type.
+
+    Fields are in the order used by `Station.from_code`.
+    """
+
+    icao: str | None
+    gps: str | None
+    iata: str | None
+    local: str | None
+
+
+CODE_TYPES = StationCodes._fields
+
+
+def build_code_index(items: Iterable[tuple[str, dict[str, Any]]]) -> dict[str, StationCodes]:
+    """Map every station code to the station keys using it in a single pass."""
+    index: dict[str, list[str | None]] = {}
+    for key, station in items:
+        for i, kind in enumerate(CODE_TYPES):
+            if code := station[kind]:
+                index.setdefault(code, [None] * len(CODE_TYPES))[i] = key
+    return {code: StationCodes(*keys) for code, keys in index.items()}
+
+
+def build_coords(values: Iterable[dict[str, Any]]) -> list[tuple[str | None, float, float]]:
+    """Return the lookup code and coordinates for each station."""
+    return [
+        (
+            s["icao"] or s["gps"] or s["iata"] or s["local"],
+            s["latitude"],
+            s["longitude"],
+        )
+        for s in values
+    ]
+
+
+def build_coord_flags(values: Iterable[dict[str, Any]]) -> bytes:
+    """Return the airport and reporting filter bits for each station in coordinate order."""
+    return bytes(
+        (COORD_AIRPORT if "airport" in s["type"] else 0) | (COORD_REPORTING if s["reporting"] is True else 0)
+        for s in values
+    )
+
+
+def build_coord_tree(points: Sequence[tuple[float, float]], flags: bytes, required: int = 0) -> CoordTree:
+    """Return a coordinate tree of the points whose flags include every required bit.
+
+    Tree results are indexes into the full points sequence.
+    """
+    # Imported here since the station package loads its data from this module
+    from avwx.station.spatial import CoordTree
+
+    ids = [i for i, bits in enumerate(flags) if bits & required == required]
+    return CoordTree([points[i] for i in ids], ids=ids)
+
+
+def _pack_int(value: int | None) -> int:
+    return _NO_INT if value is None else value
+
+
+def _unpack_int(value: int) -> int | None:
+    return None if value == _NO_INT else value
+
+
+def _pack_float(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _unpack_float(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _pad_keys(keys: list[str]) -> tuple[int, bytes]:
+    """Return the width and bytes of sorted keys NUL-padded to a fixed width.
+
+    Padding with NUL keeps the byte order of the keys sortable.
+    """
+    encoded = [key.encode("utf8") for key in keys]
+    width = max(map(len, encoded), default=0)
+    return width, b"".join(key.ljust(width, b"\0") for key in encoded)
+
+
+def write_station_store(stations: dict[str, dict[str, Any]], path: Path) -> None:
+    """Write station info dicts to a binary station store file.
+
+    The file is written to a temporary path and moved into place so open
+    readers keep a consistent view.
+    """
+    strings: set[str] = set()
+    for station in stations.values():
+        strings.update(v for k in _STATION_STRS if isinstance(v := station[k], str))
+        for runway in station["runways"] or ():
+            strings.update(v for k in ("surface", "ident1", "ident2") if isinstance(v := runway[k], str))
+    table = sorted(strings)
+    lookup = {value: i for i, value in enumerate(table)}
+
+    def index(value: str | None) -> int:
+        return _NO_STR if value is None else lookup[value]
+
+    encoded = [value.encode("utf8") for value in table]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    keys = sorted(stations)
+    positions = {key: i for i, key in enumerate(keys)}
+    station_records: list[bytes] = []
+    runway_records: list[bytes] = []
+    for key in keys:
+        station = stations[key]
+        runways = station["runways"]
+        station_records.append(
+            _STATION.pack(
+                *(index(station[k]) for k in _STATION_STRS),
+                _pack_float(station["latitude"]),
+                _pack_float(station["longitude"]),
+                _pack_int(station["elevation_ft"]),
+                _pack_int(station["elevation_m"]),
+                len(runway_records),
+                len(runways or ()),
+                station["reporting"],
+                runways is not None,
+            )
+        )
+        runway_records.extend(
+            _RUNWAY.pack(
+                runway["length_ft"],
+                runway["width_ft"],
+                index(runway["surface"]),
+                index(runway["ident1"]),
+                index(runway["ident2"]),
+                _pack_float(runway["bearing1"]),
+                _pack_float(runway["bearing2"]),
+                runway["lights"],
+            )
+            for runway in runways or ()
+        )
+    code_index = build_code_index((key, stations[key]) for key in keys)
+    codes = sorted(code_index)
+    code_records = [_CODES.pack(*(_NO_STR if k is None else positions[k] for k in code_index[code])) for code in codes]
+    coord_records = [
+        _COORD.pack(index(code), _pack_float(lat), _pack_float(lon))
+        for code, lat, lon in build_coords(stations[key] for key in keys)
+    ]
+    flags = build_coord_flags(stations[key] for key in keys)
+    points = [(stations[key]["latitude"], stations[key]["longitude"]) for key in keys]
+    key_width, key_bytes = _pad_keys(keys)
+    code_width, code_bytes = _pad_keys(codes)
+    sections = [
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        b"".join(encoded),
+        key_bytes,
+        b"".join(station_records),
+        b"".join(runway_records),
+        code_bytes,
+        b"".join(code_records),
+        b"".join(coord_records),
+        flags,
+        *(build_coord_tree(points, flags, required).to_bytes() for required in COORD_FILTERS),
+    ]
+    starts = [_HEADER.size]
+    for section in sections[:-1]:
+        starts.append(starts[-1] + len(section))
+    header = _HEADER.pack(
+        _STORE_MAGIC,
+        _STORE_VERSION,
+        len(station_records),
+        len(runway_records),
+        len(table),
+        key_width,
+        len(codes),
+        code_width,
+        *starts,
+    )
+    temp = path.with_name(f"{path.name}.tmp")
+    with temp.open("wb") as fout:
+        for chunk in (header, *sections):
+            fout.write(chunk)
+    temp.replace(path)
+
+
+class _StoreItems(ItemsView):
+    _mapping: StationStore
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        store = self._mapping
+        for i in range(len(store)):
+            yield store._key(i), store._record(i)
+
+
+class _StoreValues(ValuesView):
+    _mapping: StationStore
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        store = self._mapping
+        for i in range(len(store)):
+            yield store._record(i)
+
+
+class _StoreCodes(Mapping[str, StationCodes]):
+    """Read-only mapping of codes to station keys from a station store."""
+
+    def __init__(self, store: StationStore):
+        self._store = store
+
+    def __getitem__(self, code: str) -> StationCodes:
+        store = self._store
+        index = store._bisect(store._code_keys, store._code_width, store._code_count, code)
+        if index == -1:
+            raise KeyError(code)
+        positions = _CODES.unpack_from(store._map, store._codes + index * _CODES.size)
+        return StationCodes(*(None if i == _NO_STR else store._key(i) for i in positions))
+
+    def __len__(self) -> int:
+        return self._store._code_count
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._store
+        for i in range(store._code_count):
+            yield store._fixed(store._code_keys, store._code_width, i).rstrip(b"\0").decode("utf8")
+
+
+class StationStore(Mapping[str, dict[str, Any]]):
+    """Read-only mapping of station info dicts from a memory-mapped binary store.
+
+    Records are decoded on access. The file is mapped read-only so its pages
+    are shared between processes using the same store.
+    """
+
+    path: Path
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as fin:
+            self._map = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size or _HEADER.unpack_from(self._map)[:2] != (_STORE_MAGIC, _STORE_VERSION):
+            msg = f"{path} is not a supported station store"
+            raise ValueError(msg)
+        self._count: int
+        self._code_count: int
+        (
+            _,
+            _,
+            self._count,
+            _,
+            string_count,
+            self._key_width,
+            self._code_count,
+            self._code_width,
+            self._string_index,
+            self._string_data,
+            self._keys,
+            self._stations,
+            self._runways,
+            self._code_keys,
+            self._codes,
+            self._coords,
+            self._flags,
+            *trees,
+        ) = _HEADER.unpack_from(self._map)
+        self._trees: list[int] = trees
+        if self._string_data - self._string_index != (string_count + 1) * 4:
+            msg = f"{path} has a malformed string table"
+            raise ValueError(msg)
+        # Decoded strings are reused so records share the same str objects
+        self._strings: dict[int, str] = {}
+
+    def _string(self, index: int) -> str | None:
+        if index == _NO_STR:
+            return None
+        try:
+            return self._strings[index]
+        except KeyError:
+            start, end = _OFFSETS.unpack_from(self._map, self._string_index + index * 4)
+            value = self._map[self._string_data + start : self._string_data + end].decode("utf8")
+            self._strings[index] = value
+            return value
+
+    def _fixed(self, section: int, width: int, index: int) -> bytes:
+        start = section + index * width
+        return self._map[start : start + width]
+
+    def _bisect(self, section: int, width: int, count: int, key: str) -> int:
+        """Return the index of a key in a sorted fixed-width section or -1 if not found."""
+        target = key.encode("utf8")
+        if not target or len(target) > width:
+            return -1
+        target = target.ljust(width, b"\0")
+        index = bisect_left(range(count), target, key=lambda i: self._fixed(section, width, i))
+        if index < count and self._fixed(section, width, index) == target:
+            return index
+        return -1
+
+    def _key(self, index: int) -> str:
+        return self._fixed(self._keys, self._key_width, index).rstrip(b"\0").decode("utf8")
+
+    def _find(self, key: str) -> int:
+        """Return the record index for a station key or -1 if not found."""
+        return self._bisect(self._keys, self._key_width, self._count, key)
+
+    def _record(self, index: int) -> dict[str, Any]:
+        values = _STATION.unpack_from(self._map, self._stations + index * _STATION.size)
+        strings, values = values[: len(_STATION_STRS)], values[len(_STATION_STRS) :]
+        lat, lon, elev_ft, elev_m, first, count, reporting, has_runways = values
+        runways = None
+        if has_runways:
+            runways = [self._runway(i) for i in range(first, first + count)]
+        return {
+            **{k: self._string(v) for k, v in zip(_STATION_STRS, strings, strict=True)},
+            "elevation_ft": _unpack_int(elev_ft),
+            "elevation_m": _unpack_int(elev_m),
+            "latitude": _unpack_float(lat),
+            "longitude": _unpack_float(lon),
+            "reporting": bool(reporting),
+            "runways": runways,
+        }
+
+    def _runway(self, index: int) -> dict[str, Any]:
+        length, width, surface, ident1, ident2, bearing1, bearing2, lights = _RUNWAY.unpack_from(
+            self._map, self._runways + index * _RUNWAY.size
+        )
+        return {
+            "length_ft": length,
+            "width_ft": width,
+            "surface": self._string(surface),
+            "lights": bool(lights),
+            "ident1": self._string(ident1),
+            "ident2": self._string(ident2),
+            "bearing1": _unpack_float(bearing1),
+            "bearing2": _unpack_float(bearing2),
+        }
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        index = self._find(key) if isinstance(key, str) else -1
+        if index == -1:
+            raise KeyError(key)
+        return self._record(index)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) != -1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key(i)
+
+    def items(self) -> ItemsView[str, dict[str, Any]]:
+        return _StoreItems(self)
+
+    def values(self) -> ValuesView[dict[str, Any]]:
+        return _StoreValues(self)
+
+    @property
+    def codes(self) -> Mapping[str, StationCodes]:
+        """Mapping of every station code to the station keys using it."""
+        return _StoreCodes(self)
+
+    def coords(self) -> list[tuple[str | None, float, float]]:
+        """Return the lookup code and coordinates for each station."""
+        end = self._coords + self._count * _COORD.size
+        return [(self._string(code), lat, lon) for code, lat, lon in _COORD.iter_unpack(self._map[self._coords : end])]
+
+    def coord_flags(self) -> bytes:
+        """Return the airport and reporting filter bits for each station in coordinate order."""
+        return self._map[self._flags : self._flags + self._count]
+
+    def coord_tree(self, required: int = 0) -> CoordTree:
+        """Return the coordinate tree of stations with every required flag bit.
+
+        Tree results are indexes into `coords`.
+        """
+        from avwx.station.spatial import CoordTree
+
+        # Views keep the tree arrays in the shared mapping instead of copying them
+        view = memoryview(self._map)[self._trees[required] :]
+        return CoordTree.from_bytes(view[: CoordTree.size(view)])
+
+
+class LazyStationStore(LazyLoad):
+    """Lazy load stations from the binary store, falling back to the JSON source.
+
+    The JSON file is used if the store is missing, unsupported, or older than
+    the JSON. Code and coordinate indexes are then built from the JSON data.
+
+    Call `reload` to replace the data and indexes while the application runs.
+    """
+
+    store: Path
+    _codes: Mapping[str, StationCodes] | None = None
+    _coords: list[tuple[str | None, float, float]] | None = None
+    _flags: bytes | None = None
+    _trees: dict[int, CoordTree] | None = None
+
+    def __init__(self, filename: str):
+        super().__init__(filename)
+        self.store = self.source.with_suffix(".bin")
+
+    @property
+    def _store_current(self) -> bool:
+        try:
+            store_time = self.store.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        try:
+            return store_time >= self.source.stat().st_mtime
+        except FileNotFoundError:
+            return True
+
+    def _load(self) -> None:
+        if self._store_current:
+            with suppress(ValueError):
+                self._data = StationStore(self.store)  # type: ignore[assignment]
+                return
+        super()._load()
+
+    @property
+    def codes(self) -> Mapping[str, StationCodes]:
+        """Mapping of every station code to the station keys using it."""
+        if self._codes is None:
+            self._check()
+            if isinstance(self._data, StationStore):
+                self._codes = self._data.codes
+            else:
+                self._codes = build_code_index(self.items())
+        return self._codes
+
+    def coords(self) -> list[tuple[str | None, float, float]]:
+        """Return the lookup code and coordinates for each station."""
+        if self._coords is None:
+            self._check()
+            if isinstance(self._data, StationStore):
+                self._coords = self._data.coords()
+            else:
+                self._coords = build_coords(self.values())
+        return self._coords
+
+    def coord_flags(self) -> bytes:
+        """Return the airport and reporting filter bits for each station in coordinate order."""
+        if self._flags is None:
+            self._check()
+            if isinstance(self._data, StationStore):
+                self._flags = self._data.coord_flags()
+            else:
+                self._flags = build_coord_flags(self.values())
+        return self._flags
+
+    def coord_tree(self, required: int = 0) -> CoordTree:
+        """Return the coordinate tree of stations with every required flag bit.
+
+        Tree results are indexes into `coords`.
+        """
+        if self._trees is None:
+            self._trees = {}
+        if required not in self._trees:
+            self._check()
+            if isinstance(self._data, StationStore):
+                tree = self._data.coord_tree(required)
+            else:
+                tree = build_coord_tree([c[1:] for c in self.coords()], self.coord_flags(), required)
+            self._trees[required] = tree
+        return self._trees[required]
+
+    def coord_index(self, required: int = 0) -> tuple[list[tuple[str | None, float, float]], CoordTree]:
+        """Return the coordinates and filtered coordinate tree from the same station data."""
+        self.coords()
+        self.coord_tree(required)
+        # Read both from one state in case a reload swapped it between the calls above
+        state = vars(self)
+        return state["_coords"], state["_trees"][required]
+
+    def prepare(self, path: Path | None = None) -> LazyStationStore:
+        """Return a new instance with the station data and every index already loaded.
+
+        Loads the binary store or JSON file at path if given, else uses the
+        same sources as this instance.
+        """
+        new = copy(self)
+        for attr in ("_data", "_codes", "_coords", "_flags", "_trees"):
+            vars(new).pop(attr, None)
+        if path is None:
+            new._load()
+        elif path.suffix == ".bin":
+            new._data = StationStore(path)  # type: ignore[assignment]
+        else:
+            with path.open(encoding="utf8") as fin:
+                new._data = json.load(fin)
+        new.codes  # noqa: B018
+        for required in COORD_FILTERS:
+            new.coord_index(required)
+        return new
+
+    def reload(self, path: Path | None = None) -> None:
+        """Replace the station data and indexes in one step.
+
+        The new data is fully loaded before the swap, so lookups keep using the
+        current data until then.
+        """
+        self.swap(self.prepare(path))
+
+    def swap(self, other: LazyStationStore) -> None:
+        """Replace this instance's data and indexes with those from a prepared instance."""
+        # Replacing the instance dict is a single assignment
+        self.__dict__ = vars(copy(other))
+
+
 # LazyCalc lets us avoid the global keyword
 class LazyCalc:
     """Delay data calculation until needed."""
@@ -75,3 +640,27 @@ class LazyCalc:
         if self._value is None:
             self._value = self._func()
         return self._value
+
+    @property
+    def calculated(self) -> bool:
+        """Whether the value has been calculated."""
+        return self._value is not None
+
+    def reset(self, value: Any | None = None) -> None:
+        """Replace the calculated value or clear it to recalculate on next use."""
+        self._value = value
+
+
+def submodule_getattr(package: str) -> Callable[[str], Any]:
+    """Create a module __getattr__ that imports submodules on first attribute access.
+
+    Keeps chains like avwx.parsing.core working after a plain `import avwx`.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if not name.startswith("_") and find_spec(f"{package}.{name}") is not None:
+            return import_module(f"{package}.{name}")
+        msg = f"module {package!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    return __getattr__
@@ -9,10 +9,9 @@ import re
 from calendar import monthrange
 from contextlib import suppress
 from copy import copy
-from typing import TYPE_CHECKING, Any
-
-# library
-from dateutil.relativedelta import relativedelta
+from dataclasses import fields
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 # module
 from avwx.static.core import (
@@ -41,10 +40,44 @@ def dedupe(items: Iterable[Any], *, only_neighbors: bool = False) -> list[Any]:
     return ret
 
 
-def is_unknown(value: str) -> bool:
-    """Return True if val represents and unknown value."""
-    if not isinstance(value, str):
-        raise TypeError
+#: Distinct tokens memoized by `classify`, `make_cloud`, and `make_number`
+TOKEN_CACHE_SIZE = 8192
+
+
+class TokenKinds(NamedTuple):
+    """The kinds of report element a single token could be."""
+
+    unknown: bool
+    timestamp: bool
+    timerange: bool
+    possible_temp: bool
+    wind: bool
+    variable_wind_direction: bool
+    altitude: bool
+    runway_visibility: bool
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def classify(item: str) -> TokenKinds:
+    """Return every kind a report token matches.
+
+    Reports reuse a small set of tokens like BKN020 or 10SM, so each distinct
+    token is only checked once. The `is_*` token checks read from this result.
+    """
+    return TokenKinds(
+        unknown=_is_unknown(item),
+        timestamp=_is_timestamp(item),
+        timerange=_is_timerange(item),
+        possible_temp=_is_possible_temp(item),
+        wind=_is_wind(item),
+        variable_wind_direction=_is_variable_wind_direction(item),
+        altitude=_is_altitude(item),
+        runway_visibility=_is_runway_visibility(item),
+    )
+
+
+def _is_unknown(value: str) -> bool:
+    """Uncached check used by `classify` for `is_unknown`."""
     if not value or value.upper() in {"UNKN", "UNK", "UKN"}:
         return True
     for char in value:
@@ -55,6 +88,13 @@ def is_unknown(value: str) -> bool:
     return False
 
 
+def is_unknown(value: str) -> bool:
+    """Return True if val represents and unknown value."""
+    if not isinstance(value, str):
+        raise TypeError
+    return classify(value).unknown
+
+
 def get_digit_list(data: list[str], from_index: int) -> tuple[list[str], list[str]]:
     """Return a list of items removed from a given list of strings
     that are all digits from 'from_index' until hitting a non-digit item.
@@ -119,6 +159,34 @@ def spoken_number(num: str, *, literal: bool = False) -> str:
     return " and ".join(ret)
 
 
+def _spoken_text(num: str, prefix: str = "", *, literal: bool = False) -> str:
+    return prefix + spoken_number(num, literal=literal)
+
+
+def _defer_spoken(num: str, prefix: str = "", *, literal: bool = False) -> str:
+    """Return a spoken value that is only built when the struct field is first read."""
+    return partial(_spoken_text, num, prefix, literal=literal)  # type: ignore[return-value]
+
+
+_NumberT = TypeVar("_NumberT", bound=Number)
+
+
+def _prefixed_spoken(prefix: str, number: Number) -> str:
+    return prefix + number.spoken
+
+
+def replace_number(number: _NumberT, *, speak_prefix: str = "", **changes: Any) -> _NumberT:
+    """Return a copy of a Number or Fraction with new field values.
+
+    Unlike dataclasses.replace, unread spoken text stays deferred.
+    """
+    values = {item.name: number.__dict__[item.name] for item in fields(number)}
+    if speak_prefix:
+        values["spoken"] = partial(_prefixed_spoken, speak_prefix, number)
+    values.update(changes)
+    return type(number)(**values)
+
+
 def make_fraction(
     num: str,
     repr: str | None = None,  # noqa: A002
@@ -140,10 +208,19 @@ def make_fraction(
         numerator = int(num_str)
     value = numerator / denominator
     unpacked = unpack_fraction(num)
-    spoken = speak_prefix + spoken_number(unpacked, literal=literal)
+    spoken = _defer_spoken(unpacked, speak_prefix, literal=literal)
     return Fraction(repr or num, value, spoken, numerator, denominator, unpacked)
 
 
+def _special_number(repr: str, item: Any, *, literal: bool) -> Number:  # noqa: A002
+    if isinstance(item, tuple):
+        value, spoken = item
+    else:
+        value = item
+        spoken = _defer_spoken(str(value), literal=literal)
+    return Number(repr, value, spoken)
+
+
 def make_number(
     num: str | None,
     repr: str | None = None,  # noqa: A002
@@ -157,19 +234,50 @@ def make_number(
 
     If literal, spoken string will not convert to hundreds/thousands.
 
+    Returned values are immutable and may be shared between calls.
+
     NOTE: Numerators are assumed to have a single digit. Additional are whole numbers.
     """
     if not num or is_unknown(num):
         return None
+    # Check caller specials here since dicts can't be part of the cache key
+    if special and (item := special.get(num)):
+        return _special_number(repr or num, item, literal=literal)
+    return _make_number(num, repr, speak, literal, m_minus)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _make_number(
+    num: str,
+    repr: str | None,  # noqa: A002
+    speak: str | None,
+    literal: bool,  # noqa: FBT001
+    m_minus: bool,  # noqa: FBT001
+) -> Number | Fraction | None:
+    """Cached make_number body for hashable arguments."""
     # Check special
-    with suppress(KeyError):
-        item = (special or {}).get(num) or SPECIAL_NUMBERS[num]
-        if isinstance(item, tuple):
-            value, spoken = item
-        else:
-            value = item
-            spoken = spoken_number(str(value), literal=literal)
+    if item := SPECIAL_NUMBERS.get(num):
+        return _special_number(repr or num, item, literal=literal)
+    # Plain integers like 10 or 9999 are most calls and need no cleanup
+    if num.isdecimal() and num.isascii():
+        value: int | None = int(num)
+        spoken = _defer_spoken(speak or str(value), literal=literal)
+        # Null the value if "greater than"/"less than"
+        if not m_minus and repr and repr.startswith(("M", "P")):
+            value = None
         return Number(repr or num, value, spoken)
+    return _parse_number(num, repr, speak, literal=literal, m_minus=m_minus)
+
+
+def _parse_number(
+    num: str,
+    repr: str | None,  # noqa: A002
+    speak: str | None,
+    *,
+    literal: bool,
+    m_minus: bool,
+) -> Number | Fraction | None:
+    """Clean a non-integer number string and create its Number or Fraction."""
     # Check cardinal direction
     if num in CARDINALS:
         if not repr:
@@ -220,11 +328,11 @@ def make_number(
         val_str = val_str.replace(",", "")
         # Overwrite float 0 due to "0.0" literal
         value = float(val_str) or 0 if "." in num else int(val_str)
-        spoken = speak_prefix + spoken_number(speak or str(value), literal=literal)
+        spoken = _defer_spoken(speak or str(value), speak_prefix, literal=literal)
         ret = Number(repr or num, value, spoken)
     # Null the value if "greater than"/"less than"
     if ret and not m_minus and repr and repr.startswith(("M", "P")):
-        ret.value = None
+        ret = replace_number(ret, value=None)
     return ret
 
 
@@ -240,19 +348,34 @@ def find_first_in_list(txt: str, str_list: list[str]) -> int:
     return start if len(txt) + 1 > start > -1 else -1
 
 
+def _is_timestamp(item: str) -> bool:
+    """Uncached check used by `classify` for `is_timestamp`."""
+    return len(item) == 7 and item[-1] == "Z" and item[:-1].isdigit()
+
+
 def is_timestamp(item: str) -> bool:
     """Return True if the item matches the timestamp format."""
-    return len(item) == 7 and item[-1] == "Z" and item[:-1].isdigit()
+    return classify(item).timestamp
+
+
+def _is_timerange(item: str) -> bool:
+    """Uncached check used by `classify` for `is_timerange`."""
+    return len(item) == 9 and item[4] == "/" and item[:4].isdigit() and item[5:].isdigit()
 
 
 def is_timerange(item: str) -> bool:
     """Return True if the item is a TAF to-from time range."""
-    return len(item) == 9 and item[4] == "/" and item[:4].isdigit() and item[5:].isdigit()
+    return classify(item).timerange
+
+
+def _is_possible_temp(temp: str) -> bool:
+    """Uncached check used by `classify` for `is_possible_temp`."""
+    return all((char.isdigit() or char == "M") for char in temp)
 
 
 def is_possible_temp(temp: str) -> bool:
     """Return True if all characters are digits or 'M' for minus."""
-    return all((char.isdigit() or char == "M") for char in temp)
+    return classify(temp).possible_temp
 
 
 _Numeric = int | float
@@ -309,8 +432,8 @@ def get_station_and_time(
     return data, station, r_time
 
 
-def is_wind(text: str) -> bool:
-    """Return True if the text is likely a normal wind element."""
+def _is_wind(text: str) -> bool:
+    """Uncached check used by `classify` for `is_wind`."""
     # Ignore wind shear
     if text.startswith("WS"):
         return False
@@ -326,16 +449,26 @@ def is_wind(text: str) -> bool:
     return text[:5].isdigit() or (text.startswith("VRB") and text[3:5].isdigit())
 
 
+def is_wind(text: str) -> bool:
+    """Return True if the text is likely a normal wind element."""
+    return classify(text).wind
+
+
 VARIABLE_DIRECTION_PATTERN = re.compile(r"\d{3}V\d{3}")
 
 
-def is_variable_wind_direction(text: str) -> bool:
-    """Return True if element looks like 350V040."""
+def _is_variable_wind_direction(text: str) -> bool:
+    """Uncached check used by `classify` for `is_variable_wind_direction`."""
     if len(text) < 7:
         return False
     return VARIABLE_DIRECTION_PATTERN.match(text[:7]) is not None
 
 
+def is_variable_wind_direction(text: str) -> bool:
+    """Return True if element looks like 350V040."""
+    return classify(text).variable_wind_direction
+
+
 def separate_wind(text: str) -> tuple[str, str, str]:
     """Extract the direction, speed, and gust from a wind element."""
     direction, speed, gust = "", "", ""
@@ -457,10 +590,12 @@ def _null_or_int(val: str | None) -> int | None:
 _TOP_OFFSETS = ("-TOPS", "-TOP")
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def make_cloud(cloud: str) -> Cloud:
     """Return a Cloud dataclass for a cloud string.
 
-    This function assumes the input is potentially valid.
+    This function assumes the input is potentially valid. Clouds are immutable,
+    so the same layer string returns a shared Cloud.
     """
     raw_cloud = cloud
     cloud_type = ""
@@ -561,8 +696,8 @@ def get_ceiling(clouds: list[Cloud]) -> Cloud | None:
     return next((c for c in clouds if c.base and c.type in {"OVC", "BKN", "VV"}), None)
 
 
-def is_altitude(value: str) -> bool:
-    """Return True if the value is a possible altitude."""
+def _is_altitude(value: str) -> bool:
+    """Uncached check used by `classify` for `is_altitude`."""
     if len(value) < 5:
         return False
     if value.startswith("SFC/"):
@@ -573,6 +708,11 @@ def is_altitude(value: str) -> bool:
     return bool(first[-2:] == "FT" and first[-5:-2].isdigit())
 
 
+def is_altitude(value: str) -> bool:
+    """Return True if the value is a possible altitude."""
+    return classify(value).altitude
+
+
 def make_altitude(
     value: str,
     units: Units,
@@ -597,6 +737,13 @@ def make_altitude(
     return make_number(value, repr=raw), units
 
 
+def _shift_month(value: dt.datetime, months: int) -> dt.datetime:
+    """Shift a datetime by whole months, clamping the day to the new month's length."""
+    year, month = divmod(value.year * 12 + value.month - 1 + months, 12)
+    month += 1
+    return value.replace(year=year, month=month, day=min(value.day, monthrange(year, month)[1]))
+
+
 def parse_date(
     date: str,
     hour_threshold: int = 200,
@@ -635,7 +782,7 @@ def parse_date(
     # Shifted value makes sure that a month shift doesn't happen twice
     shifted = False
     if day > monthrange(target.year, target.month)[1]:
-        target += relativedelta(months=-1)
+        target = _shift_month(target, -1)
         shifted = True
     try:
         guess = target.replace(
@@ -654,9 +801,9 @@ def parse_date(
     if not shifted:
         hourdiff = (guess - target) / dt.timedelta(minutes=1) / 60
         if hourdiff > hour_threshold:
-            guess += relativedelta(months=-1)
+            guess = _shift_month(guess, -1)
         elif hourdiff < -hour_threshold:
-            guess += relativedelta(months=+1)
+            guess = _shift_month(guess, 1)
     return guess
 
 
@@ -673,8 +820,8 @@ def make_timestamp(
     return Timestamp(timestamp, date_obj)
 
 
-def is_runway_visibility(item: str) -> bool:
-    """Return True if the item is a runway visibility range string."""
+def _is_runway_visibility(item: str) -> bool:
+    """Uncached check used by `classify` for `is_runway_visibility`."""
     return (
         len(item) > 4
         and item[0] == "R"
@@ -682,3 +829,8 @@ def is_runway_visibility(item: str) -> bool:
         and item[1:3].isdigit()
         and "CLRD" not in item  # R28/CLRD70 Runway State
     )
+
+
+def is_runway_visibility(item: str) -> bool:
+    """Return True if the item is a runway visibility range string."""
+    return classify(item).runway_visibility
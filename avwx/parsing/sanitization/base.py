@@ -1,9 +1,13 @@
 """Core sanitiation functions that accept report-specific elements."""
 
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, NoReturn
 
 from avwx.parsing.core import dedupe, is_variable_wind_direction, is_wind
 from avwx.parsing.sanitization.cleaners.base import (
+    Cleaner,
     CleanerListType,
     CleanItem,
     CleanPair,
@@ -16,10 +20,52 @@ from avwx.parsing.sanitization.cleaners.wind import sanitize_wind
 from avwx.structs import Sanitization
 
 
+def _key_trie(keys: Iterable[str]) -> dict:
+    """Return a character trie of keys where None marks a complete key."""
+    root: dict = {}
+    for key in keys:
+        node = root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[None] = True
+    return root
+
+
+def _trie_pattern(node: dict) -> str:
+    """Return a regex matching any key in a trie.
+
+    Shared prefixes are matched once, so the regex engine only tries the keys
+    that start with the current character. A complete key ends the branch
+    since any longer key containing it is also a hit.
+    """
+    if None in node:
+        return ""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items())]
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+def _any_key_pattern(keys: Iterable[str]) -> re.Pattern | None:
+    """Return a compiled regex that finds whether any key is in a string.
+
+    Returns None if there are no keys or an empty key that matches everything.
+    """
+    trie = _key_trie(keys)
+    if not trie or None in trie:
+        return None
+    return re.compile(_trie_pattern(trie))
+
+
 def sanitize_string_with(
     replacements: dict[str, str],
 ) -> Callable[[str, Sanitization], str]:
-    """Return a function to sanitize the report string with a given list of replacements."""
+    """Return a function to sanitize the report string with a given list of replacements.
+
+    The replacement keys are compiled into a single regex when the function is
+    created. Most reports contain none of the keys and are checked in one pass.
+    Reports with a hit apply every replacement in key order, since one
+    replacement can create or remove a later key.
+    """
+    any_key = _any_key_pattern(replacements)
 
     def sanitize_report_string(text: str, sans: Sanitization) -> str:
         """Provide sanitization for operations that work better when the report is a string."""
@@ -31,10 +77,11 @@ def sanitize_string_with(
         # Prevent changes to station ID
         stid, text = text[:4], text[4:]
         # Replace invalid key-value pairs
-        for key, rep in replacements.items():
-            if key in text:
-                text = text.replace(key, rep)
-                sans.log(key, rep)
+        if any_key is None or any_key.search(text):
+            for key, rep in replacements.items():
+                if key in text:
+                    text = text.replace(key, rep)
+                    sans.log(key, rep)
         separated = separate_cloud_layers(text)
         if text != separated:
             sans.extra_spaces_needed = True
@@ -43,49 +90,158 @@ def sanitize_string_with(
     return sanitize_report_string
 
 
+_COMBINE, _SPLIT, _PAIR, _REMOVE, _CLEAN, _CHECK = range(6)
+_SINGLE_KINDS = (_SPLIT, _REMOVE, _CLEAN, _CHECK)
+
+#: Distinct tokens and token pairs memoized per cleaner pipeline
+_CACHE_SIZE = 4096
+
+_Step = tuple[int, Any]
+
+#: Step value for checks that raised, so the error surfaces only if the step is reached
+_RAISED = object()
+
+
+def _cleaner_kind(cleaner: Cleaner) -> int:
+    """Return the dispatch kind for a cleaner instance."""
+    if isinstance(cleaner, CombineItems):
+        return _COMBINE
+    if isinstance(cleaner, SplitItem):
+        return _SPLIT
+    if isinstance(cleaner, CleanPair):
+        return _PAIR
+    if isinstance(cleaner, RemoveItem):
+        return _REMOVE
+    # Other single item cleaners only stop later cleaners
+    return _CLEAN if isinstance(cleaner, CleanItem) else _CHECK
+
+
+class _CleanerPipeline:
+    """Cleaners compiled into kind-dispatched steps.
+
+    Cleaners are pure checks on their string inputs, so the matching cleaners
+    for a token or neighboring pair are found once and memoized. Tokens only
+    run the cleaners that handle them, in the original cleaner order.
+    """
+
+    def __init__(self, cleaners: CleanerListType):
+        self.cleaners = tuple(o() for o in cleaners)
+        self.kinds = tuple(_cleaner_kind(c) for c in self.cleaners)
+        self._single = tuple(i for i, kind in enumerate(self.kinds) if kind in _SINGLE_KINDS)
+        self._double = tuple(i for i, kind in enumerate(self.kinds) if kind not in _SINGLE_KINDS)
+        self.single_steps = lru_cache(maxsize=_CACHE_SIZE)(self._single_steps)
+        self.pair_steps = lru_cache(maxsize=_CACHE_SIZE)(self._pair_steps)
+
+    def _single_steps(self, item: str) -> tuple[_Step, ...]:
+        """Return single item cleaners that handle an item with any split index."""
+        steps: list[_Step] = []
+        for pos in self._single:
+            cleaner = self.cleaners[pos]
+            try:
+                if self.kinds[pos] == _SPLIT:
+                    if index := cleaner.split_at(item):  # type: ignore[union-attr]
+                        steps.append((pos, index))
+                elif cleaner.can_handle(item):  # type: ignore[union-attr]
+                    steps.append((pos, None))
+            except Exception:  # noqa: BLE001
+                steps.append((pos, _RAISED))
+        return tuple(steps)
+
+    def _pair_steps(self, first: str, second: str) -> tuple[_Step, ...]:
+        """Return pair cleaners that handle two neighboring items."""
+        steps: list[_Step] = []
+        for pos in self._double:
+            try:
+                if self.cleaners[pos].can_handle(first, second):  # type: ignore[union-attr]
+                    steps.append((pos, None))
+            except Exception:  # noqa: BLE001
+                steps.append((pos, _RAISED))
+        return tuple(steps)
+
+    def _steps(self, item: str, previous: str | None, after: int = -1) -> list[_Step]:
+        """Return the ordered cleaner steps for an item after a cleaner position."""
+        steps = self.single_steps(item)
+        if previous is not None:
+            steps += self.pair_steps(previous, item)
+        return sorted(step for step in steps if step[0] > after)
+
+    def _recheck(self, pos: int, item: str, previous: str | None) -> NoReturn:
+        """Rerun a check that raised when it was memoized so the error is raised here."""
+        cleaner = self.cleaners[pos]
+        if self.kinds[pos] == _SPLIT:
+            cleaner.split_at(item)  # type: ignore[union-attr]
+        elif self.kinds[pos] in _SINGLE_KINDS:
+            cleaner.can_handle(item)  # type: ignore[union-attr]
+        else:
+            cleaner.can_handle(previous, item)  # type: ignore[union-attr]
+        msg = f"{cleaner.__class__.__name__} check did not raise again"
+        raise RuntimeError(msg)
+
+    def __call__(self, wxdata: list[str], sans: Sanitization) -> list[str]:
+        """Clean a report list from the end, matching in-place pop/insert cleaning.
+
+        Items before the current index are only changed by pair cleaners, so
+        they are kept in a working copy. The current item and everything after
+        it are kept as a reversed stack where the top is the current index.
+        """
+        original = tuple(wxdata)
+        head = list(wxdata)
+        tail: list[str] = []
+        for i in range(len(head) - 1, -1, -1):
+            item = original[i]
+            tail.append(head[i])
+            steps = self._steps(item, head[i - 1] if i else None)
+            step = 0
+            while step < len(steps):
+                pos, value = steps[step]
+                step += 1
+                kind, cleaner = self.kinds[pos], self.cleaners[pos]
+                if value is _RAISED:
+                    self._recheck(pos, item, head[i - 1] if i else None)
+                if kind == _COMBINE:
+                    head[i - 1] += tail.pop()
+                    sans.extra_spaces_found = True
+                    if cleaner.should_break:
+                        break
+                    steps, step = self._steps(item, head[i - 1], pos), 0
+                elif kind == _SPLIT:
+                    tail.insert(-1, item[value:])
+                    tail[-1] = item[:value]
+                    sans.extra_spaces_needed = True
+                    if cleaner.should_break:
+                        break
+                elif kind == _PAIR:
+                    clean_first, clean_second = cleaner.clean(head[i - 1], item)  # type: ignore[union-attr]
+                    if head[i - 1] != clean_first:
+                        sans.log(head[i - 1], clean_first)
+                        head[i - 1] = clean_first
+                        steps, step = self._steps(item, clean_first, pos), 0
+                    if item != clean_second:
+                        sans.log(item, clean_second)
+                        tail[-1] = clean_second
+                        break
+                else:
+                    if kind == _REMOVE:
+                        sans.log(tail.pop())
+                    elif kind == _CLEAN:
+                        cleaned = cleaner.clean(item)  # type: ignore[union-attr]
+                        tail[-1] = cleaned
+                        sans.log(item, cleaned)
+                    if cleaner.should_break:
+                        break
+        tail.reverse()
+        return tail
+
+
 def sanitize_list_with(
     cleaners: CleanerListType,
 ) -> Callable[[list[str], Sanitization], list[str]]:
     """Return a function to sanitize the report list with a given list of cleaners."""
-    _cleaners = [o() for o in cleaners]
+    pipeline = _CleanerPipeline(cleaners)
 
     def sanitize_report_list(wxdata: list[str], sans: Sanitization) -> list[str]:
         """Provide sanitization for operations that work better when the report is a list."""
-        for i, item in reversed(list(enumerate(wxdata))):
-            for cleaner in _cleaners:
-                # TODO: Py3.10 change to match/case on type
-                if isinstance(cleaner, CombineItems):
-                    if i and cleaner.can_handle(wxdata[i - 1], item):
-                        wxdata[i - 1] += wxdata.pop(i)
-                        sans.extra_spaces_found = True
-                        if cleaner.should_break:
-                            break
-                elif isinstance(cleaner, SplitItem):
-                    if index := cleaner.split_at(item):
-                        wxdata.insert(i + 1, item[index:])
-                        wxdata[i] = item[:index]
-                        sans.extra_spaces_needed = True
-                        if cleaner.should_break:
-                            break
-                elif isinstance(cleaner, CleanPair):
-                    if i and cleaner.can_handle(wxdata[i - 1], item):
-                        clean_first, clean_second = cleaner.clean(wxdata[i - 1], item)
-                        if wxdata[i - 1] != clean_first:
-                            sans.log(wxdata[i - 1], clean_first)
-                            wxdata[i - 1] = clean_first
-                        if item != clean_second:
-                            sans.log(item, clean_second)
-                            wxdata[i] = clean_second
-                            break
-                elif cleaner.can_handle(item):
-                    if isinstance(cleaner, RemoveItem):
-                        sans.log(wxdata.pop(i))
-                    elif isinstance(cleaner, CleanItem):
-                        cleaned = cleaner.clean(item)
-                        wxdata[i] = cleaned
-                        sans.log(item, cleaned)
-                    if cleaner.should_break:
-                        break
+        wxdata = pipeline(wxdata, sans)
 
         # TODO: Replace with above syntax after testing?
         # May wish to keep since some elements could be checked after space needed...but so could the others?
@@ -1,8 +1,9 @@
 """Cleaners for wind elements."""
 
 import re
+from functools import lru_cache
 
-from avwx.parsing.core import is_unknown
+from avwx.parsing.core import TOKEN_CACHE_SIZE, is_unknown
 from avwx.parsing.sanitization.base import CleanItem, RemoveItem
 
 WIND_REMV = ("/", "-", "{", "}", "(N)", "(E)", "(S)", "(W)")
@@ -38,6 +39,7 @@ WIND_VRB = ("WBB",)
 KT_PATTERN = re.compile(r"\b[\w\d]*\d{2}K[^T]\b")
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def sanitize_wind(text: str) -> str:
     """Fix rare wind issues that may be too broad otherwise."""
     for rep in WIND_REMV:
@@ -1,7 +1,9 @@
 """.. include:: ../../docs/service.md"""
 
-from avwx.service.base import Service
+from avwx.service.base import CLIENTS, HTTPClients, Service
+from avwx.service.cache import ResponseCache
 from avwx.service.files import NoaaGfs, NoaaNbm
+from avwx.service.pool import UpdatePool, UpdateResult
 from avwx.service.scrape import (
     Amo,
     Aubom,
@@ -15,16 +17,21 @@ from avwx.service.scrape import (
 )
 
 __all__ = (
+    "CLIENTS",
     "get_service",
     "Amo",
     "Aubom",
     "Avt",
+    "HTTPClients",
     "Mac",
     "Nam",
     "Noaa",
     "NoaaGfs",
     "NoaaNbm",
     "Olbs",
+    "ResponseCache",
     "Service",
+    "UpdatePool",
+    "UpdateResult",
     # "FaaNotam",
 )
@@ -3,35 +3,125 @@
 # stdlib
 from __future__ import annotations
 
+import asyncio as aio
+from functools import cache
+from importlib.util import find_spec
 from socket import gaierror
-from typing import TYPE_CHECKING, Any, ClassVar
-
-import httpcore
-
-# library
-import httpx
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
+from weakref import WeakKeyDictionary
 
 # module
 from avwx.exceptions import SourceError
 
-_TIMEOUT_ERRORS = (
-    httpx.ConnectTimeout,
-    httpx.ReadTimeout,
-    httpx.WriteTimeout,
-    httpx.PoolTimeout,
-    httpcore.ReadTimeout,
-    httpcore.WriteTimeout,
-    httpcore.PoolTimeout,
-)
-_CONNECTION_ERRORS = (gaierror, httpcore.ConnectError, httpx.ConnectError)
-_NETWORK_ERRORS = (
-    httpcore.ReadError,
-    httpcore.NetworkError,
-    httpcore.RemoteProtocolError,
-)
-
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Coroutine
+
+    import httpx
+
+_T = TypeVar("_T")
+
+
+class _HTTPErrors(NamedTuple):
+    timeout: tuple[type[BaseException], ...]
+    connection: tuple[type[BaseException], ...]
+    network: tuple[type[BaseException], ...]
+
+
+@cache
+def _http_errors() -> _HTTPErrors:
+    """Return the grouped request exceptions, importing httpx on first use."""
+    import httpcore
+    import httpx
+
+    return _HTTPErrors(
+        timeout=(
+            httpx.ConnectTimeout,
+            httpx.ReadTimeout,
+            httpx.WriteTimeout,
+            httpx.PoolTimeout,
+            httpcore.ReadTimeout,
+            httpcore.WriteTimeout,
+            httpcore.PoolTimeout,
+        ),
+        connection=(gaierror, httpcore.ConnectError, httpx.ConnectError),
+        network=(
+            httpcore.ReadError,
+            httpcore.NetworkError,
+            httpcore.RemoteProtocolError,
+        ),
+    )
+
+
+class HTTPClients:
+    """Registry of shared HTTP clients for all `CallsHTTP` services.
+
+    httpx clients are bound to the event loop that created them, so one client
+    is kept per running loop. Each client pools keep-alive connections by host
+    and uses HTTP/2 if the `h2` package is installed.
+
+    Long-running applications should close the client before their event loop
+    ends.
+
+    ```python
+    >>> from avwx.service import CLIENTS
+    >>> await CLIENTS.aclose()
+    ```
+    """
+
+    _clients: WeakKeyDictionary[aio.AbstractEventLoop, httpx.AsyncClient]
+    _limits: httpx.Limits | None
+    http2: bool
+
+    def __init__(self, limits: httpx.Limits | None = None, *, http2: bool | None = None):
+        self._clients = WeakKeyDictionary()
+        self._limits = limits
+        self.http2 = find_spec("h2") is not None if http2 is None else http2
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection limits applied to new clients."""
+        if self._limits is None:
+            import httpx
+
+            self._limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        return self._limits
+
+    @limits.setter
+    def limits(self, value: httpx.Limits) -> None:
+        self._limits = value
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the shared client for the running event loop."""
+        loop = aio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            import httpx
+
+            client = httpx.AsyncClient(follow_redirects=True, http2=self.http2, limits=self.limits)
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared client for the running event loop."""
+        client = self._clients.pop(aio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+#: Shared client registry used by CallsHTTP services
+CLIENTS = HTTPClients()
+
+
+def run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine in a new event loop, closing its shared HTTP client after."""
+
+    async def _run() -> _T:
+        try:
+            return await coro
+        finally:
+            await CLIENTS.aclose()
+
+    return aio.run(_run())
 
 
 class Service:
@@ -57,9 +147,14 @@ class Service:
 
 
 class CallsHTTP:
-    """Service mixin supporting HTTP requests."""
+    """Service mixin supporting HTTP requests.
+
+    Requests use the shared client from `CLIENTS` unless a client is assigned
+    to the service's `client` attribute.
+    """
 
     method: ClassVar[str] = "GET"
+    client: httpx.AsyncClient | None = None
 
     async def _call(
         self,
@@ -72,34 +167,32 @@ class CallsHTTP:
         formatter: Callable[[bytes], bytes | str] | None = None,
     ) -> str:
         name = self.__class__.__name__
+        client = self.client or CLIENTS.get()
+        errors = _http_errors()
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout,
-                follow_redirects=True,
-            ) as client:
-                for _ in range(retries):
-                    if self.method.lower() == "post":
-                        resp = await client.post(url, params=params, headers=headers, data=data)
-                    else:
-                        resp = await client.get(url, params=params, headers=headers)
-                    if resp.status_code == 200:
-                        break
-                    if resp.status_code == 204:
-                        return ""
-                    # Skip retries if remote server error
-                    if resp.status_code >= 500:
-                        msg = f"{name} server returned {resp.status_code}"
-                        raise SourceError(msg)
+            for _ in range(retries):
+                if self.method.lower() == "post":
+                    resp = await client.post(url, params=params, headers=headers, data=data, timeout=timeout)
                 else:
+                    resp = await client.get(url, params=params, headers=headers, timeout=timeout)
+                if resp.status_code == 200:
+                    break
+                if resp.status_code == 204:
+                    return ""
+                # Skip retries if remote server error
+                if resp.status_code >= 500:
                     msg = f"{name} server returned {resp.status_code}"
                     raise SourceError(msg)
-        except _TIMEOUT_ERRORS as timeout_error:
+            else:
+                msg = f"{name} server returned {resp.status_code}"
+                raise SourceError(msg)
+        except errors.timeout as timeout_error:
             msg = f"Timeout from {name} server"
             raise TimeoutError(msg) from timeout_error
-        except _CONNECTION_ERRORS as connect_error:
+        except errors.connection as connect_error:
             msg = f"Unable to connect to {name} server"
             raise ConnectionError(msg) from connect_error
-        except _NETWORK_ERRORS as network_error:
+        except errors.network as network_error:
             msg = f"Unable to read data from {name} server"
             raise ConnectionError(msg) from network_error
         if formatter:
@@ -8,13 +8,10 @@ The `fetch` and `async_fetch` methods are identical except they return
 `list[str]` instead.
 """
 
-import asyncio as aio
 import gzip
 from typing import ClassVar
 
-from xmltodict import parse as parsexml
-
-from avwx.service.base import CallsHTTP, Service
+from avwx.service.base import CallsHTTP, Service, run
 
 
 class NoaaBulk(Service, CallsHTTP):
@@ -33,12 +30,14 @@ class NoaaBulk(Service, CallsHTTP):
         super().__init__(self._rtype_map.get(report_type, report_type))
 
     def _extract(self, raw: str) -> list[str]:
+        from xmltodict import parse as parsexml
+
         target = self._targets.get(self.report_type, self.report_type.upper())
         return [t["raw_text"] for t in parsexml(raw)["response"]["data"][target]]
 
     def fetch(self, timeout: int = 10) -> list[str]:
         """Bulk fetch report strings from the service."""
-        return aio.run(self.async_fetch(timeout))
+        return run(self.async_fetch(timeout))
 
     async def async_fetch(self, timeout: int = 10) -> list[str]:
         """Asynchronously bulk fetch report strings from the service."""
@@ -69,7 +68,7 @@ class NoaaIntl(Service, CallsHTTP):
 
     def fetch(self, timeout: int = 10) -> list[str]:
         """Bulk fetch report strings from the service."""
-        return aio.run(self.async_fetch(timeout))
+        return run(self.async_fetch(timeout))
 
     async def async_fetch(self, timeout: int = 10) -> list[str]:
         """Asynchronously bulk fetch report strings from the service."""
@@ -0,0 +1,139 @@
+"""
+Optional response caching for station scrape services. Fetched report strings
+are kept for a short time, and concurrent requests for the same report share a
+single upstream call.
+"""
+
+# stdlib
+from __future__ import annotations
+
+import asyncio as aio
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from avwx.service.base import Service
+
+
+class CacheStore(metaclass=ABCMeta):
+    """Storage backend interface for `ResponseCache`.
+
+    Subclass this to keep responses in an external store shared between
+    processes. Methods are async so network-backed stores don't block.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Return the stored value or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value that expires after ttl seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a stored value if present."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all stored values."""
+
+
+class MemoryStore(CacheStore):
+    """In-memory LRU store with per-item expiration."""
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored value or None if missing or expired."""
+        try:
+            expires, value = self._data[key]
+        except KeyError:
+            return None
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value that expires after ttl seconds."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove a stored value if present."""
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all stored values."""
+        self._data.clear()
+
+
+class ResponseCache:
+    """Caches service responses and coalesces identical in-flight requests.
+
+    Assign to a service's `cache` attribute to enable caching for that
+    service, or to the `StationScrape` class to enable it for all of them.
+
+    ```python
+    >>> from avwx.service.cache import ResponseCache
+    >>> from avwx.service.scrape import StationScrape
+    >>> StationScrape.cache = ResponseCache(ttl=60)
+    ```
+    """
+
+    store: CacheStore
+    ttl: float
+
+    def __init__(self, store: CacheStore | None = None, ttl: float = 60):
+        self.store = store or MemoryStore()
+        self.ttl = ttl
+        # Tasks are bound to their event loop, so in-flight calls are kept per loop
+        self._inflight: WeakKeyDictionary[aio.AbstractEventLoop, dict[str, aio.Task[str]]] = WeakKeyDictionary()
+
+    @staticmethod
+    def make_key(service: Service, station: str) -> str:
+        """Return the cache key for a service's report for a station."""
+        return f"{service.__class__.__name__}:{service.report_type}:{station}"
+
+    async def fetch(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached value for key or await call to fetch and store it.
+
+        Concurrent fetches for the same key wait on the first call. Errors are
+        passed to every waiter and are not cached.
+        """
+        value = await self.store.get(key)
+        if value is not None:
+            return value
+        inflight = self._inflight.setdefault(aio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is None:
+            task = aio.ensure_future(self._fetch(key, call))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await aio.shield(task)
+
+    async def _fetch(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        value = await call()
+        await self.store.set(key, value, self.ttl)
+        return value
+
+    async def clear(self) -> None:
+        """Remove all cached responses."""
+        await self.store.clear()
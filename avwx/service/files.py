@@ -20,9 +20,6 @@ from pathlib import Path
 from socket import gaierror
 from typing import TYPE_CHECKING, ClassVar, TextIO
 
-# library
-import httpx
-
 # module
 from avwx.service.base import Service
 from avwx.station import valid_station
@@ -34,9 +31,6 @@ _TEMP_DIR = tempfile.TemporaryDirectory()
 _TEMP = Path(_TEMP_DIR.name)
 
 
-_HTTPX_EXCEPTIONS = (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError)
-
-
 @atexit.register
 def _cleanup() -> None:
     """Deletes temporary files and directory at Python exit."""
@@ -107,6 +101,8 @@ class FileService(Service):
 
     async def _update_file(self, timeout: int) -> bool:
         """Find and save the most recent file."""
+        import httpx
+
         # Find the most recent file
         async with httpx.AsyncClient(timeout=timeout) as client:
             for url in self._urls:
@@ -114,7 +110,7 @@ class FileService(Service):
                     resp = await client.get(url)
                     if resp.status_code == 200:
                         break
-                except _HTTPX_EXCEPTIONS:
+                except (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError):
                     return False
                 except gaierror:
                     return False
@@ -0,0 +1,154 @@
+"""Concurrency-limited updates for many report objects at once."""
+
+# stdlib
+from __future__ import annotations
+
+import asyncio as aio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+# module
+from avwx.service.base import run
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from avwx.base import ManagedReport
+    from avwx.service.base import Service
+
+DEFAULT_TIMEOUT = 10
+
+
+@dataclass
+class UpdateResult:
+    """Outcome of updating a single report in an `UpdatePool`."""
+
+    code: str | None
+    report: ManagedReport
+    updated: bool = False
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _HostLimiter:
+    """Spaces request start times for a single host."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        loop = aio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await aio.sleep(start - now)
+
+
+class UpdatePool:
+    """Update many `ManagedReport` objects with bounded concurrency.
+
+    Updates are limited by a global semaphore, a semaphore per service class,
+    and an optional request rate per host. Each update is cut off after its
+    service's `default_timeout` so one slow source can't stall the rest.
+
+    ```python
+    >>> from avwx import Metar
+    >>> from avwx.service import UpdatePool
+    >>> reports = [Metar(code) for code in ("KJFK", "EGLL", "SBGR")]
+    >>> for result in UpdatePool(max_concurrency=10).update(reports):
+    ...     print(result.code, result.updated, result.error)
+    ```
+    """
+
+    max_concurrency: int
+    per_service: int
+    per_host_rate: float | None
+    service_limits: dict[str, int]
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        per_service: int = 4,
+        per_host_rate: float | None = 5,
+        service_limits: dict[str, int] | None = None,
+    ):
+        if max_concurrency < 1 or per_service < 1:
+            msg = "Concurrency limits must be at least 1"
+            raise ValueError(msg)
+        if per_host_rate is not None and per_host_rate <= 0:
+            msg = "per_host_rate must be positive or None"
+            raise ValueError(msg)
+        self.max_concurrency = max_concurrency
+        self.per_service = per_service
+        self.per_host_rate = per_host_rate
+        self.service_limits = service_limits or {}
+
+    @staticmethod
+    def _timeout(service: Service) -> int:
+        timeout: int = getattr(service, "default_timeout", DEFAULT_TIMEOUT)
+        return timeout
+
+    def update(
+        self,
+        reports: Iterable[ManagedReport],
+        timeout: int | None = None,
+        *,
+        disable_post: bool = False,
+    ) -> list[UpdateResult]:
+        """Update all reports and return a result for each in the given order."""
+        return run(self.async_update(reports, timeout, disable_post=disable_post))
+
+    async def async_update(
+        self,
+        reports: Iterable[ManagedReport],
+        timeout: int | None = None,
+        *,
+        disable_post: bool = False,
+    ) -> list[UpdateResult]:
+        """Asynchronously update all reports and return a result for each in the given order.
+
+        If timeout is None, each update uses its service's `default_timeout`.
+        Errors and timeouts are returned in the result rather than raised.
+        """
+        # Async primitives are bound to a loop, so they are created per call
+        total = aio.Semaphore(self.max_concurrency)
+        services: dict[str, aio.Semaphore] = {}
+        hosts: dict[str, _HostLimiter] = {}
+
+        async def _one(report: ManagedReport) -> UpdateResult:
+            service = report.service
+            name = service.__class__.__name__
+            if name not in services:
+                services[name] = aio.Semaphore(self.service_limits.get(name, self.per_service))
+            limiter = None
+            if self.per_host_rate and (host := service.root):
+                limiter = hosts.setdefault(host, _HostLimiter(self.per_host_rate))
+            wait = self._timeout(service) if timeout is None else timeout
+            result = UpdateResult(report.code, report)
+            async with services[name]:
+                # Wait for the host outside the global limit so other hosts can use the slot
+                if limiter is not None:
+                    await limiter.wait()
+                async with total:
+                    start = aio.get_running_loop().time()
+                    try:
+                        result.updated = await aio.wait_for(
+                            report.async_update(wait, disable_post=disable_post),
+                            wait,
+                        )
+                    except aio.TimeoutError as exc:
+                        # asyncio.TimeoutError is only an alias of the builtin from Python 3.11
+                        msg = f"{name} update timed out after {wait} seconds"
+                        result.error = exc if isinstance(exc, TimeoutError) else TimeoutError(msg)
+                    except Exception as exc:  # noqa: BLE001
+                        result.error = exc
+                    result.elapsed = aio.get_running_loop().time() - start
+            return result
+
+        return await aio.gather(*[_one(report) for report in reports])
@@ -1,6 +1,7 @@
 """
 These services request reports via HTML scraping or direct API requests.
-Requests are ephemeral and will call the selected service each time.
+Requests are ephemeral and will call the selected service each time unless a
+response cache is assigned to the service.
 """
 
 # stdlib
@@ -12,17 +13,16 @@ import secrets
 from contextlib import suppress
 from typing import TYPE_CHECKING, ClassVar, TypeVar
 
-# library
-from xmltodict import parse as parsexml
-
-from avwx.exceptions import InvalidRequest
-
 # module
+from avwx.exceptions import InvalidRequest
 from avwx.parsing.core import dedupe
-from avwx.service.base import CallsHTTP, Service
+from avwx.service.base import CallsHTTP, Service, run
 from avwx.station import Station, valid_station
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from avwx.service.cache import ResponseCache
     from avwx.structs import Coord
 
 _T = TypeVar("_T")
@@ -71,7 +71,12 @@ class ScrapeService(Service, CallsHTTP):
 
 
 class StationScrape(ScrapeService):
-    """Service class fetching reports from a station code."""
+    """Service class fetching reports from a station code.
+
+    Responses are cached by the `cache` attribute if one is assigned.
+    """
+
+    cache: ResponseCache | None = None
 
     def _make_url(self, station: str) -> tuple[str, dict]:  # noqa: ARG002
         """Return a formatted URL and parameters."""
@@ -109,7 +114,7 @@ class StationScrape(ScrapeService):
         timeout: int | None = None,
     ) -> str:
         """Fetches a report string from the service"""
-        return aio.run(self.async_fetch(station, timeout))
+        return run(self.async_fetch(station, timeout))
 
     async def async_fetch(self, station: str, timeout: int | None = None) -> str:
         """Asynchronously fetch a report string from the service."""
@@ -117,7 +122,10 @@ class StationScrape(ScrapeService):
             timeout = self.default_timeout
         valid_station(station)
         url, params = self._make_url(station)
-        return await self._fetch(station, url, params, timeout)
+        if self.cache is None:
+            return await self._fetch(station, url, params, timeout)
+        key = self.cache.make_key(self, station)
+        return await self.cache.fetch(key, lambda: self._fetch(station, url, params, timeout))
 
 
 # Multiple sources for NOAA data
@@ -139,6 +147,62 @@ class NoaaApi(StationScrape):
         """Extract the report message from JSON response."""
         return raw.strip()
 
+    def _extract_many(self, raw: str, stations: list[str]) -> dict[str, str]:
+        """Extract the first report for each station from a multi-station response."""
+        reports: list[str] = []
+        for line in raw.strip().splitlines():
+            if not line.strip():
+                continue
+            # Indented lines continue the previous report. Ex: TAF FM groups
+            if line[0].isspace() and reports:
+                reports[-1] += f" {line}"
+            else:
+                reports.append(line)
+        targets = set(stations)
+        ret: dict[str, str] = {}
+        for report in reports:
+            # Station follows any report type and modifier prefix. Ex: TAF AMD KJFK
+            for item in report.split()[:4]:
+                if item in targets:
+                    ret.setdefault(item, self._clean_report(report))
+                    break
+        return ret
+
+    def fetch_many(
+        self,
+        stations: Iterable[str],
+        timeout: int | None = None,
+        chunk_size: int = 100,
+    ) -> dict[str, str]:
+        """Fetch report strings for many stations in as few requests as possible."""
+        return run(self.async_fetch_many(stations, timeout, chunk_size))
+
+    async def async_fetch_many(
+        self,
+        stations: Iterable[str],
+        timeout: int | None = None,
+        chunk_size: int = 100,
+    ) -> dict[str, str]:
+        """Asynchronously fetch report strings for many stations.
+
+        Stations are requested in concurrent chunks of comma-separated idents.
+        Returns a dict of station to report. Stations without a current report
+        are not included.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        codes = list(dict.fromkeys(s.strip().upper() for s in stations))
+        for code in codes:
+            valid_station(code)
+        url = self._url.format(self.report_type)
+        headers = self._make_headers()
+        chunks = [codes[i : i + chunk_size] for i in range(0, len(codes), chunk_size)]
+        coros = [self._call(url, params={"ids": ",".join(c)}, headers=headers, timeout=timeout) for c in chunks]
+        ret: dict[str, str] = {}
+        for chunk, text in zip(chunks, await aio.gather(*coros), strict=True):
+            ret.update(self._extract_many(text, chunk))
+        return ret
+
 
 class NoaaFtp(StationScrape):
     """Request data from NOAA via FTP."""
@@ -187,7 +251,7 @@ class NoaaApiList(ScrapeService):
         timeout: int | None = None,
     ) -> list[str]:
         """Fetche a report string from the service."""
-        return aio.run(self.async_fetch(icao, coord, radius, timeout))
+        return run(self.async_fetch(icao, coord, radius, timeout))
 
     async def async_fetch(
         self,
@@ -231,6 +295,8 @@ class Amo(StationScrape):
 
     def _extract(self, raw: str, station: str) -> str:  # noqa: ARG002
         """Extract the report message from XML response."""
+        from xmltodict import parse as parsexml
+
         resp = parsexml(raw)
         try:
             report = resp["response"]["body"]["items"]["item"][f"{self.report_type.lower()}Msg"]
@@ -460,7 +526,7 @@ class Avt(StationScrape):
 #         timeout: int = 10,
 #     ) -> list[str]:
 #         """Fetch NOTAM list from the service via ICAO, coordinate, or ident path."""
-#         return aio.run(self.async_fetch(icao, coord, path, radius, timeout))
+#         return run(self.async_fetch(icao, coord, path, radius, timeout))
 
 #     async def async_fetch(
 #         self,
@@ -555,7 +621,7 @@ class Avt(StationScrape):
 #         timeout: int = 10,
 #     ) -> list[str]:
 #         """Fetch NOTAM list from the service via ICAO, coordinate, or ident path"""
-#         return aio.run(self.async_fetch(icao, coord, path, radius, timeout))
+#         return run(self.async_fetch(icao, coord, path, radius, timeout))
 
 #     async def async_fetch(
 #         self,
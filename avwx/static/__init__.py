@@ -1 +1,5 @@
 """Contains static objects for internal and external use."""
+
+from avwx.load_utils import submodule_getattr
+
+__getattr__ = submodule_getattr(__name__)
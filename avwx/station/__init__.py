@@ -13,14 +13,18 @@ not associated with airports like weather buouys.
 """
 
 from avwx.station.meta import __LAST_UPDATED__, station_list, uses_na_format, valid_station
-from avwx.station.search import search
-from avwx.station.station import Station, nearest
+from avwx.station.reload import reload
+from avwx.station.search import search, search_prefix
+from avwx.station.station import Station, nearest, nearest_many
 
 __all__ = (
     "Station",
     "station_list",
     "nearest",
+    "nearest_many",
+    "reload",
     "search",
+    "search_prefix",
     "uses_na_format",
     "valid_station",
     "__LAST_UPDATED__",
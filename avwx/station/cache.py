@@ -0,0 +1,169 @@
+"""
+Bounded caches for station lookups. Cached functions keep a limited number of
+recent results, can expire them after a set time, and report usage counts.
+Every cache can be cleared at once when station data changes.
+
+```python
+>>> from avwx.station.cache import cache_stats
+>>> from avwx.station.search import search
+>>> search.cache.maxsize = 512
+>>> cache_stats()["avwx.station.search.search"]
+CacheInfo(hits=0, misses=0, evictions=0, expired=0, size=0, maxsize=512)
+```
+"""
+
+# stdlib
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar, cast
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+# Unique sentinel for missing cache entries
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Usage counts for a `MemoCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expired: int
+    size: int
+    maxsize: int
+
+
+class MemoCache:
+    """Thread-safe LRU cache with optional per-item expiration.
+
+    If precision is set, float arguments are rounded to that many decimal
+    places before calling the function, so nearby coordinates share one entry.
+    """
+
+    maxsize: int
+    ttl: float | None
+    precision: int | None
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None, precision: int | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.precision = precision
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def quantize(self, args: tuple, kwargs: dict[str, Any]) -> tuple[tuple, dict[str, Any]]:
+        """Return args and kwargs with floats rounded to the cache precision."""
+        if self.precision is None:
+            return args, kwargs
+        args = tuple(round(v, self.precision) if isinstance(v, float) else v for v in args)
+        kwargs = {k: round(v, self.precision) if isinstance(v, float) else v for k, v in kwargs.items()}
+        return args, kwargs
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value or a missing sentinel and update usage counts."""
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value and evict the least recently used if over the size limit."""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached values. Usage counts are kept."""
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """Return the current usage counts."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.expired, len(self._data), self.maxsize)
+
+
+# Caches by function path, cleared together when station data changes
+_CACHES: WeakValueDictionary[str, MemoCache] = WeakValueDictionary()
+
+
+class CachedFunction(Protocol[T_co]):
+    """Function that stores results in a `MemoCache`."""
+
+    cache: MemoCache
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T_co: ...
+
+    def cache_info(self) -> CacheInfo:
+        """Return the current usage counts."""
+
+    def cache_clear(self) -> None:
+        """Remove all cached values."""
+
+
+def memoize(
+    maxsize: int = 1024,
+    ttl: float | None = None,
+    precision: int | None = None,
+) -> Callable[[Callable[..., T]], CachedFunction[T]]:
+    """Cache a function's results in a bounded `MemoCache` registered under its module path."""
+
+    def decorator(func: Callable[..., T]) -> CachedFunction[T]:
+        cache = MemoCache(maxsize, ttl, precision)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            args, kwargs = cache.quantize(args, kwargs)
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value  # type: ignore[no-any-return]
+
+        wrapped = cast("CachedFunction[T]", wrapper)
+        wrapped.cache = cache
+        wrapped.cache_info = cache.info  # type: ignore[method-assign]
+        wrapped.cache_clear = cache.clear  # type: ignore[method-assign]
+        _CACHES[f"{func.__module__}.{func.__qualname__}"] = cache
+        return wrapped
+
+    return decorator
+
+
+def cache_stats() -> dict[str, CacheInfo]:
+    """Return the usage counts of every station cache by function path, like "avwx.station.search.search"."""
+    return {name: cache.info() for name, cache in _CACHES.items()}
+
+
+def clear_caches() -> None:
+    """Clear every station cache. Call this after station data changes."""
+    for cache in list(_CACHES.values()):
+        cache.clear()
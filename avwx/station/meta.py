@@ -7,13 +7,13 @@ from functools import lru_cache
 
 # module
 from avwx.exceptions import BadStation
-from avwx.load_utils import LazyLoad
+from avwx.load_utils import LazyStationStore
 from avwx.static.core import IN_REGIONS, M_IN_REGIONS, M_NA_REGIONS, NA_REGIONS
 
 __LAST_UPDATED__ = "2026-02-16"
 
 # Lazy data loading to speed up import times for unused features
-STATIONS = LazyLoad("stations")
+STATIONS = LazyStationStore("stations")
 
 
 # maxsize = 2 ** number of boolean options
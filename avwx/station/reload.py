@@ -0,0 +1,40 @@
+"""Reload station data while the application is running."""
+
+# stdlib
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# module
+from avwx.station.cache import clear_caches
+from avwx.station.meta import STATIONS, station_list
+from avwx.station.search import _INDEX, _build_index
+from avwx.station.station import Station
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def reload(path: Path | None = None) -> None:
+    """Reload station data and replace it and every derived index and cache.
+
+    Loads the binary store or JSON file at path if given, else the package
+    data files. Indexes already in use are rebuilt before the swap, so lookups
+    keep using the current data until the new data is ready. This can be
+    called from a background thread after updating the station data.
+
+    ```python
+    >>> from avwx.data import update_stations
+    >>> from avwx.station import reload
+    >>> update_stations()
+    >>> reload()
+    ```
+    """
+    stations = STATIONS.prepare(path)
+    # Only rebuild the search index if it was already in use
+    index = _build_index(stations) if _INDEX.calculated else None
+    STATIONS.swap(stations)
+    _INDEX.reset(index)
+    Station._from_code.cache_clear()
+    station_list.cache_clear()
+    clear_caches()
@@ -3,19 +3,24 @@
 # stdlib
 from __future__ import annotations
 
+import heapq
+import re
+from bisect import bisect_left
 from contextlib import suppress
-from functools import cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 # module
 from avwx.exceptions import MissingExtraModule
 from avwx.load_utils import LazyCalc
+from avwx.station.cache import memoize
 from avwx.station.meta import STATIONS
-from avwx.station.station import Station, station_filter
+from avwx.station.station import Station, _filter_flags
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from avwx.load_utils import LazyStationStore
+
 # Catch import error only if user attemps a text search
 with suppress(ModuleNotFoundError):
     from rapidfuzz import fuzz, process, utils
@@ -32,6 +37,15 @@ TYPE_ORDER = [
 ]
 
 
+_SEARCH_KEYS = ("icao", "iata", "gps", "local", "city", "state", "name")
+_CODE_KEYS = ("icao", "iata", "gps", "local")
+_WORD_KEYS = ("city", "state", "name")
+_SEPARATORS = re.compile(r"[\W_]+")
+
+# Token kinds in rank order
+_EXACT_CODE, _CODE, _EXACT_WORD, _WORD = range(4)
+
+
 def _format_search(airport: dict, keys: Iterable[str]) -> str | None:
     values = [airport.get(k) for k in keys]
     code = values[0] or values[2]
@@ -41,24 +55,102 @@ def _format_search(airport: dict, keys: Iterable[str]) -> str | None:
     return " - ".join(k for k in values if k)
 
 
-def _build_corpus() -> list[str]:
-    keys = ("icao", "iata", "gps", "local", "city", "state", "name")
-    return [text for s in STATIONS.values() if (text := _format_search(s, keys))]
-
-
-_CORPUS = LazyCalc(_build_corpus)
-
-
-def _sort_key(result: tuple[Station, int]) -> tuple[int, ...]:
-    station, score = result
+def _tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _SEPARATORS.sub(" ", text.lower()).split()
+
+
+class _SearchIndex(NamedTuple):
+    """Search text and sorted code and word tokens for every searchable station."""
+
+    keys: list[str]
+    texts: list[str]
+    type_orders: list[int]
+    flags: bytes
+    tokens: list[str]
+    # Token is a code and station entry index for each token
+    refs: list[tuple[bool, int]]
+
+    def prefix(self, prefix: str) -> dict[int, int]:
+        """Return the best token kind for each entry with a token starting with prefix."""
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        found: dict[int, int] = {}
+        for token, (is_code, entry) in zip(self.tokens[start:end], self.refs[start:end], strict=True):
+            exact = token == prefix
+            kind = (_EXACT_CODE if exact else _CODE) if is_code else (_EXACT_WORD if exact else _WORD)
+            if kind < found.get(entry, _WORD + 1):
+                found[entry] = kind
+        return found
+
+    def matches(self, tokens: list[str], required: int) -> dict[int, int]:
+        """Return the summed token kinds of entries matching every token prefix and required flags."""
+        found: dict[int, int] | None = None
+        for token in tokens:
+            kinds = self.prefix(token)
+            if found is None:
+                found = {i: kind for i, kind in kinds.items() if self.flags[i] & required == required}
+            else:
+                found = {i: kind + kinds[i] for i, kind in found.items() if i in kinds}
+        return found or {}
+
+    def candidates(self, tokens: list[str], required: int, count: int) -> list[int]:
+        """Return at least count entries likely to match the tokens if possible.
+
+        Starts with entries matching every token prefix, then any token prefix,
+        then shorter prefixes, and finally every entry.
+        """
+        found = set(self.matches(tokens, required))
+        while len(found) < count and any(tokens):
+            for token in tokens:
+                if token:
+                    found.update(self.matches([token], required))
+            tokens = [token[:-1] for token in tokens]
+        if len(found) < count:
+            return [i for i, flags in enumerate(self.flags) if flags & required == required]
+        return sorted(found)
+
+
+def _type_order(station_type: str) -> int:
     try:
-        type_order = TYPE_ORDER.index(station.type)
+        return TYPE_ORDER.index(station_type)
     except ValueError:
-        type_order = 10
-    return (score, 10 - type_order)
-
-
-@cache
+        return 10
+
+
+def _build_index(stations: LazyStationStore = STATIONS) -> _SearchIndex:
+    keys: list[str] = []
+    texts: list[str] = []
+    type_orders: list[int] = []
+    flags = bytearray()
+    tokens: set[tuple[str, bool, int]] = set()
+    for key, station in stations.items():
+        if not (text := _format_search(station, _SEARCH_KEYS)):
+            continue
+        entry = len(keys)
+        keys.append(key)
+        texts.append(text)
+        type_orders.append(_type_order(station["type"]))
+        flags.append(_filter_flags(is_airport="airport" in station["type"], reporting=station["reporting"] is True))
+        codes = " ".join(filter(None, (station[field] for field in _CODE_KEYS)))
+        words = " ".join(filter(None, (station[field] for field in _WORD_KEYS)))
+        tokens.update((token, True, entry) for token in _tokenize(codes))
+        tokens.update((token, False, entry) for token in _tokenize(words))
+    ordered = sorted(tokens)
+    return _SearchIndex(
+        keys,
+        texts,
+        type_orders,
+        bytes(flags),
+        [token for token, _, _ in ordered],
+        [(is_code, entry) for _, is_code, entry in ordered],
+    )
+
+
+_INDEX = LazyCalc(_build_index)
+
+
+@memoize(maxsize=1024)
 def search(
     text: str,
     limit: int = 10,
@@ -68,20 +160,48 @@ def search(
 ) -> list[Station]:
     """Text search for stations against codes, name, city, and state.
 
-    Results may be shorter than limit value.
+    Fuzzy scoring only runs on stations found in the code and word prefix
+    index. Results may be shorter than limit value.
     """
     try:
-        results = process.extract(
-            text,
-            _CORPUS.value,
-            limit=limit * 20,
-            scorer=fuzz.token_set_ratio,
-            processor=utils.default_process,
-        )
+        scorer, processor = fuzz.token_set_ratio, utils.default_process
     except NameError as name_error:
         extra = "fuzz"
         raise MissingExtraModule(extra) from name_error
-    results = [(Station.from_code(k[:4]), s) for k, s, _ in results]
-    results.sort(key=_sort_key, reverse=True)
-    results = [s for s, _ in results if station_filter(s, is_airport=is_airport, reporting=sends_reports)]
-    return results[:limit] if len(results) > limit else results
+    index = _INDEX.value
+    required = _filter_flags(is_airport=is_airport, reporting=sends_reports)
+    entries = index.candidates(_tokenize(text), required, limit)
+    results = process.extract(
+        text,
+        [index.texts[i] for i in entries],
+        limit=limit * 20,
+        scorer=scorer,
+        processor=processor,
+    )
+    # Sort is stable, so equal scores stay in corpus order
+    ranked = sorted(
+        ((score, 10 - index.type_orders[entries[i]], entries[i]) for _, score, i in results),
+        key=lambda x: x[:2],
+        reverse=True,
+    )
+    return [Station.from_code(index.keys[entry]) for _, _, entry in ranked[:limit]]
+
+
+def search_prefix(
+    text: str,
+    limit: int = 10,
+    *,
+    is_airport: bool = False,
+    sends_reports: bool = True,
+) -> list[Station]:
+    """Typeahead search for stations by code and word prefixes.
+
+    Every word in text must start a station code or a word in its name,
+    city, or state. Exact code matches are returned first, then code prefixes, then word
+    matches. Ties prefer larger airports. Does not require the fuzz extra.
+    """
+    index = _INDEX.value
+    required = _filter_flags(is_airport=is_airport, reporting=sends_reports)
+    found = index.matches(_tokenize(text), required)
+    best = heapq.nsmallest(limit, found, key=lambda i: (found[i], index.type_orders[i], index.keys[i]))
+    return [Station.from_code(index.keys[entry]) for entry in best]
@@ -0,0 +1,297 @@
+"""
+Nearest-neighbor search over coordinates on a sphere.
+
+Coordinates are converted to 3D unit vectors and stored in a static KD-tree.
+The straight-line chord between two unit vectors increases with their
+great-circle angle, so the tree gives true great-circle neighbors including
+across the antimeridian and near the poles. NumPy speeds up building the tree
+if installed but is not required.
+"""
+
+# stdlib
+from __future__ import annotations
+
+import heapq
+import math
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from scipy.spatial import cKDTree
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+_MAGIC = b"AVWXKDT\x00"
+_VERSION = 1
+# magic, version, point count, leaf size
+_HEADER = struct.Struct("<8sIII")
+# Marks nodes that are leaves in the axes array
+_LEAF = 255
+# Serialized item sizes of the ids and coordinate arrays
+_ID_SIZE = array("I").itemsize
+_FLOAT_SIZE = array("d").itemsize
+
+
+def to_xyz(lat: float, lon: float) -> tuple[float, float, float]:
+    """Convert a lat,lon pair in degrees to a 3D unit vector."""
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
+def chord_to_degrees(chord: float) -> float:
+    """Convert a unit sphere chord length to the great-circle angle in degrees."""
+    return math.degrees(2 * math.asin(min(chord / 2, 1)))
+
+
+def degrees_to_chord(degrees: float) -> float:
+    """Convert a great-circle angle in degrees to the unit sphere chord length."""
+    return 2 * math.sin(math.radians(min(degrees, 180)) / 2)
+
+
+def _split_python(coords: list[list[float]], order: list[int], axes: bytearray, leafsize: int) -> None:
+    """Arrange order into an implicit KD-tree using list sorts."""
+    stack = [(0, len(order))]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo <= leafsize:
+            continue
+        spreads = []
+        for values in coords:
+            part = [values[i] for i in order[lo:hi]]
+            spreads.append(max(part) - min(part))
+        axis = spreads.index(max(spreads))
+        values = coords[axis]
+        order[lo:hi] = sorted(order[lo:hi], key=values.__getitem__)
+        mid = (lo + hi) // 2
+        axes[mid] = axis
+        stack += [(lo, mid), (mid + 1, hi)]
+
+
+def _split_numpy(coords: list[list[float]], order: list[int], axes: bytearray, leafsize: int) -> None:
+    """Arrange order into an implicit KD-tree using NumPy partitions."""
+    points = np.array(coords).T
+    index = np.arange(len(order))
+    stack = [(0, len(order))]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo <= leafsize:
+            continue
+        part = points[index[lo:hi]]
+        axis = int(np.argmax(part.max(axis=0) - part.min(axis=0)))
+        mid = (lo + hi) // 2
+        index[lo:hi] = index[lo:hi][np.argpartition(part[:, axis], mid - lo)]
+        axes[mid] = axis
+        stack += [(lo, mid), (mid + 1, hi)]
+    order[:] = index.tolist()
+
+
+class CoordTree:
+    """Static KD-tree of lat,lon coordinates queried by great-circle distance.
+
+    Results are the index of each coordinate in the original sequence and its
+    great-circle angle from the target in degrees. Pass ids to return a
+    different index for each coordinate, like when indexing a subset.
+
+    ```python
+    >>> tree = CoordTree([(40.64, -73.78), (51.47, -0.46)])
+    >>> tree.query(40.7, -74.0, 1)
+    [(0, 0.1782...)]
+    ```
+    """
+
+    leafsize: int
+
+    def __init__(
+        self,
+        coords: Sequence[tuple[float, float]],
+        leafsize: int = 16,
+        ids: Sequence[int] | None = None,
+    ):
+        self.leafsize = leafsize
+        xyz = [to_xyz(lat, lon) for lat, lon in coords]
+        values = [[p[i] for p in xyz] for i in range(3)]
+        order = list(range(len(xyz)))
+        # Nodes are the midpoint of each range and leaves are ranges <= leafsize
+        axes = bytearray([_LEAF]) * len(xyz)
+        split = _split_python if np is None else _split_numpy
+        split(values, order, axes, leafsize)
+        values = [[v[i] for i in order] for v in values]
+        self._set(order if ids is None else [ids[i] for i in order], bytes(axes), values)
+
+    def _set(self, ids: Sequence[int], axes: bytes | memoryview, values: list[Sequence[float]]) -> None:
+        self._ids = ids
+        self._axes = axes
+        self._xs, self._ys, self._zs = values
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def query(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        max_degrees: float = 180,
+    ) -> list[tuple[int, float]]:
+        """Return up to k nearest coordinate indexes and angles within max_degrees, closest first."""
+        if k < 1 or not self._ids:
+            return []
+        target = to_xyz(lat, lon)
+        qx, qy, qz = target
+        ids, xs, ys, zs, axes, leafsize = self._ids, self._xs, self._ys, self._zs, self._axes, self.leafsize
+        limit = degrees_to_chord(max_degrees) ** 2
+        # Max-heap of the k best as (-squared chord, position)
+        best: list[tuple[float, int]] = []
+        bound = limit
+
+        def check(i: int) -> None:
+            nonlocal bound
+            dist = (xs[i] - qx) ** 2 + (ys[i] - qy) ** 2 + (zs[i] - qz) ** 2
+            if dist > bound:
+                return
+            if len(best) < k:
+                heapq.heappush(best, (-dist, i))
+            else:
+                heapq.heapreplace(best, (-dist, i))
+            if len(best) == k:
+                bound = min(limit, -best[0][0])
+
+        stack = [(0, len(self._ids))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= leafsize:
+                for i in range(lo, hi):
+                    check(i)
+                continue
+            mid = (lo + hi) // 2
+            axis = axes[mid]
+            diff = target[axis] - (xs, ys, zs)[axis][mid]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            check(mid)
+            # Far side is pushed first so the near side is searched first
+            if diff * diff <= bound:
+                stack.append(far)
+            stack.append(near)
+        ret = sorted((-d, i) for d, i in best)
+        return [(ids[i], chord_to_degrees(math.sqrt(d))) for d, i in ret]
+
+    def _batch_tree(self) -> cKDTree | None:
+        """SciPy tree over the same unit vectors for batch queries, if installed."""
+        if "_batch" not in self.__dict__:
+            try:
+                from scipy.spatial import cKDTree
+            except ModuleNotFoundError:
+                self._batch = None
+            else:
+                self._batch = cKDTree(np.column_stack((self._xs, self._ys, self._zs)))
+        return self._batch
+
+    def batch_query(
+        self,
+        coords: Sequence[tuple[float, float]] | np.ndarray,
+        k: int = 1,
+        max_degrees: float = 180,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return id and angle arrays for each lat,lon pair from one vectorized SciPy query.
+
+        Each row holds up to k results, closest first. Rows are padded with -1 ids
+        and infinite angles. Returns None if the scipy extra is not installed.
+        """
+        tree = self._batch_tree() if len(coords) and k > 0 and len(self._ids) else None
+        if tree is None:
+            return None
+        lats, lons = np.radians(np.asarray(coords, dtype=float)).T
+        cos_lat = np.cos(lats)
+        points = np.column_stack((cos_lat * np.cos(lons), cos_lat * np.sin(lons), np.sin(lats)))
+        # SciPy's bound is exclusive while query includes points on the limit
+        limit = np.nextafter(degrees_to_chord(max_degrees), np.inf)
+        chords, index = tree.query(points, k=list(range(1, k + 1)), distance_upper_bound=limit)
+        # SciPy marks missing neighbors with an index one past the end
+        ids = np.append(np.asarray(self._ids, dtype=np.int64), -1)[index]
+        degrees = np.degrees(2 * np.arcsin(np.minimum(chords / 2, 1)))
+        degrees[ids < 0] = np.inf
+        return ids, degrees
+
+    def query_many(
+        self,
+        coords: Sequence[tuple[float, float]] | np.ndarray,
+        k: int = 1,
+        max_degrees: float = 180,
+    ) -> list[list[tuple[int, float]]]:
+        """Return `query` results for each lat,lon pair.
+
+        Runs a single vectorized SciPy query for all pairs when the scipy extra is
+        installed, else queries each pair in turn.
+        """
+        batch = self.batch_query(coords, k, max_degrees)
+        if batch is None:
+            return [self.query(lat, lon, k, max_degrees) for lat, lon in coords]
+        ids, degrees = batch
+        return [
+            [(i, d) for i, d in zip(row, dists, strict=True) if i >= 0]
+            for row, dists in zip(ids.tolist(), degrees.tolist(), strict=True)
+        ]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the tree to bytes."""
+        count = len(self._ids)
+        parts = [_HEADER.pack(_MAGIC, _VERSION, count, self.leafsize)]
+        parts.append(array("I", self._ids).tobytes())
+        parts.append(self._axes)
+        parts.extend(array("d", values).tobytes() for values in (self._xs, self._ys, self._zs))
+        return b"".join(parts)
+
+    @staticmethod
+    def size(data: bytes | memoryview) -> int:
+        """Return the serialized length of the tree at the start of data."""
+        magic, version, count, _ = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            msg = "Data is not a supported coordinate tree"
+            raise ValueError(msg)
+        return _HEADER.size + count * (_ID_SIZE + 1 + 3 * _FLOAT_SIZE)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> Self:
+        """Load a tree serialized by `to_bytes`.
+
+        The tree reads its ids and coordinates from views of data rather than
+        copying them, so a tree loaded from a memory-mapped file shares its pages.
+        """
+        size = cls.size(data)
+        if len(data) < size:
+            msg = "Coordinate tree data is truncated"
+            raise ValueError(msg)
+        _, _, count, leafsize = _HEADER.unpack_from(data)
+        view = memoryview(data)[_HEADER.size : size]
+        ids, view = view[: count * _ID_SIZE].cast("I"), view[count * _ID_SIZE :]
+        axes, view = view[:count], view[count:]
+        values = []
+        for _ in range(3):
+            values.append(view[: count * _FLOAT_SIZE].cast("d"))
+            view = view[count * _FLOAT_SIZE :]
+        tree = cls.__new__(cls)
+        tree.leafsize = leafsize
+        tree._set(ids, axes, values)
+        return tree
+
+    def save(self, path: Path) -> None:
+        """Write the serialized tree to a file."""
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """Load a tree from a file written by `save`."""
+        return cls.from_bytes(path.read_bytes())
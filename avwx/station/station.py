@@ -3,22 +3,26 @@
 # stdlib
 from __future__ import annotations
 
+import math
 from contextlib import suppress
-from copy import copy
 from dataclasses import dataclass
-from functools import cache
-from typing import Any
-
-# library
-import httpx
-from geopy.distance import Distance, great_circle  # type: ignore
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 # module
-from avwx.exceptions import BadStation, MissingExtraModule
-from avwx.load_utils import LazyCalc
+from avwx.exceptions import BadStation
+from avwx.load_utils import COORD_AIRPORT, COORD_REPORTING
+from avwx.station.cache import memoize
 from avwx.station.meta import STATIONS
 from avwx.structs import Coord
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from geopy.distance import Distance  # type: ignore
+
+    from avwx.load_utils import StationCodes
+
 try:
     from typing import Self
 except ImportError:
@@ -27,11 +31,13 @@ except ImportError:
 
 def _get_ip_location() -> Coord:
     """Return the current location according to ipinfo.io."""
+    import httpx
+
     lat, lon = httpx.get("https://ipinfo.io/loc").text.strip().split(",")
     return Coord(float(lat), float(lon))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Runway:
     """Represent a runway at an airport."""
 
@@ -45,18 +51,20 @@ class Runway:
     bearing2: float
 
 
-_ICAO = LazyCalc(lambda: {v["icao"]: k for k, v in STATIONS.items() if v["icao"]})
-_IATA = LazyCalc(lambda: {v["iata"]: k for k, v in STATIONS.items() if v["iata"]})
-_GPS = LazyCalc(lambda: {v["gps"]: k for k, v in STATIONS.items() if v["gps"]})
-_LOCAL = LazyCalc(lambda: {v["local"]: k for k, v in STATIONS.items() if v["local"]})
+def _codes(ident: str) -> StationCodes:
+    """Return the station keys using an ident as each code type."""
+    return STATIONS.codes[ident.upper()]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Station:
     """
     The Station dataclass stores basic info about the desired station and
     available Runways.
 
+    Stations are immutable. Recent lookups are cached, so loading the same
+    station again returns the same object.
+
     The easiest way to get a station is to supply the ICAO, IATA, or GPS code.
     The example below uses `from_code` which checks against all three types,
     but you can also use `from_icao`, `from_iata`, or `from_gps` if you know
@@ -101,19 +109,22 @@ class Station:
     name: str
     note: str | None
     reporting: bool
-    runways: list[Runway]
+    runways: tuple[Runway, ...]
     state: str | None
     type: str
     website: str | None
     wiki: str | None
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_code(cls, ident: str) -> Self:
         try:
-            info: dict[str, Any] = copy(STATIONS[ident])
-            if info["runways"]:
-                info["runways"] = [Runway(**r) for r in info["runways"]]
-            return cls(**info)
+            info: dict[str, Any] = STATIONS[ident]
+            # Tuple since cached Stations are shared between callers
+            runways = info["runways"]
+            if runways is not None:
+                runways = tuple(Runway(**r) for r in runways)
+            return cls(**{**info, "runways": runways})
         except (KeyError, AttributeError) as not_found:
             msg = f"Could not find station with ident {ident}"
             raise BadStation(msg) from not_found
@@ -121,26 +132,40 @@ class Station:
     @classmethod
     def from_code(cls, ident: str) -> Self:
         """Load a Station from ICAO, GPS, or IATA code in that order."""
-        if ident and isinstance(ident, str):
+        if ident and isinstance(ident, str) and (codes := STATIONS.codes.get(ident.upper())):
+            keys: tuple[str | None, ...] = ()
             if len(ident) == 4:
-                with suppress(BadStation):
-                    return cls.from_icao(ident)
-                with suppress(BadStation):
-                    return cls.from_gps(ident)
-            if len(ident) == 3:
-                with suppress(BadStation):
-                    return cls.from_iata(ident)
-            with suppress(BadStation):
-                return cls.from_local(ident)
+                keys = codes.icao, codes.gps
+            elif len(ident) == 3:
+                keys = (codes.iata,)
+            # Single index probe for every code type
+            for key in (*keys, codes.local):
+                if key:
+                    with suppress(BadStation):
+                        return cls._from_code(key)
         msg = f"Could not find station with ident {ident}"
         raise BadStation(msg)
 
+    @classmethod
+    def from_code_many(cls, idents: Iterable[str]) -> dict[str, Self]:
+        """Load Stations for many idents using the same rules as `from_code`.
+
+        Returns a dict of ident to Station. Unknown idents are not included.
+        """
+        ret: dict[str, Self] = {}
+        for ident in idents:
+            if ident in ret:
+                continue
+            with suppress(BadStation):
+                ret[ident] = cls.from_code(ident)
+        return ret
+
     @classmethod
     def from_icao(cls, ident: str) -> Self:
         """Load a Station from an ICAO station ident."""
         try:
-            return cls._from_code(_ICAO.value[ident.upper()])
-        except (KeyError, AttributeError) as not_found:
+            return cls._from_code(_codes(ident).icao or "")
+        except (KeyError, AttributeError, BadStation) as not_found:
             msg = f"Could not find station with ICAO ident {ident}"
             raise BadStation(msg) from not_found
 
@@ -148,8 +173,8 @@ class Station:
     def from_iata(cls, ident: str) -> Self:
         """Load a Station from an IATA code."""
         try:
-            return cls._from_code(_IATA.value[ident.upper()])
-        except (KeyError, AttributeError) as not_found:
+            return cls._from_code(_codes(ident).iata or "")
+        except (KeyError, AttributeError, BadStation) as not_found:
             msg = f"Could not find station with IATA ident {ident}"
             raise BadStation(msg) from not_found
 
@@ -157,8 +182,8 @@ class Station:
     def from_gps(cls, ident: str) -> Self:
         """Load a Station from a GPS code."""
         try:
-            return cls._from_code(_GPS.value[ident.upper()])
-        except (KeyError, AttributeError) as not_found:
+            return cls._from_code(_codes(ident).gps or "")
+        except (KeyError, AttributeError, BadStation) as not_found:
             msg = f"Could not find station with GPS ident {ident}"
             raise BadStation(msg) from not_found
 
@@ -166,8 +191,8 @@ class Station:
     def from_local(cls, ident: str) -> Self:
         """Load a Station from a local code."""
         try:
-            return cls._from_code(_LOCAL.value[ident.upper()])
-        except (KeyError, AttributeError) as not_found:
+            return cls._from_code(_codes(ident).local or "")
+        except (KeyError, AttributeError, BadStation) as not_found:
             msg = f"Could not find station with local ident {ident}"
             raise BadStation(msg) from not_found
 
@@ -183,9 +208,8 @@ class Station:
     ) -> tuple[Self, dict] | None:
         """Load the Station nearest to your location or a lat,lon coordinate pair.
 
-        Returns the Station and distances from source.
-
-        NOTE: Becomes less accurate toward poles and doesn't cross +/-180
+        Returns the Station and distances from source. The max coordinate
+        distance is the great-circle angle in degrees.
         """
         if not (lat and lon):
             lat, lon = _get_ip_location().pair
@@ -233,6 +257,8 @@ class Station:
 
     def distance(self, lat: float, lon: float) -> Distance:
         """Geopy Distance using the great circle method."""
+        from geopy.distance import great_circle  # type: ignore
+
         return great_circle((lat, lon), (self.latitude, self.longitude))
 
     def nearby(
@@ -244,7 +270,7 @@ class Station:
     ) -> list[tuple[Self, dict]]:
         """Return Stations nearest to current station and their distances.
 
-        NOTE: Becomes less accurate toward poles and doesn't cross +/-180
+        The max coordinate distance is the great-circle angle in degrees.
         """
         stations = nearest(
             self.latitude,
@@ -262,73 +288,26 @@ class Station:
 # Coordinate search and resources
 
 
-def _make_coords() -> list[tuple[str, float, float]]:
-    return [
-        (
-            s["icao"] or s["gps"] or s["iata"] or s["local"],
-            s["latitude"],
-            s["longitude"],
-        )
-        for s in STATIONS.values()
-    ]
-
-
-_COORDS = LazyCalc(_make_coords)
+def _filter_flags(*, is_airport: bool, reporting: bool) -> int:
+    """Return the coordinate flags required by the query params."""
+    return (COORD_AIRPORT if is_airport else 0) | (COORD_REPORTING if reporting else 0)
 
 
-def _make_coord_tree():  # type: ignore
-    try:
-        from scipy.spatial import KDTree
+def _query_coords(lat: float, lon: float, n: int, d: float, required: int = 0) -> list[tuple[str, float]]:
+    """Return <= n number of ident, dist tuples <= d great-circle degrees from lat,lon with the required flags."""
+    # Separate trees for each filter combination so queries only touch matching stations
+    coords, tree = STATIONS.coord_index(required)
+    nodes = tree.query(lat, lon, n, d)
+    return [(code, dist) for i, dist in nodes if (code := coords[i][0])]
 
-        return KDTree([c[1:] for c in _COORDS.value])
-    except (NameError, ModuleNotFoundError) as name_error:
-        extra = "scipy"
-        raise MissingExtraModule(extra) from name_error
 
-
-_COORD_TREE = LazyCalc(_make_coord_tree)
-
-
-def _query_coords(lat: float, lon: float, n: int, d: float) -> list[tuple[str, float]]:
-    """Returns <= n number of ident, dist tuples <= d coord distance from lat,lon"""
-    dist, index = _COORD_TREE.value.query([lat, lon], n, distance_upper_bound=d)
-    if n == 1:
-        dist, index = [dist], [index]
-    # NOTE: index == len of list means Tree ran out of items
-    return [(_COORDS.value[i][0], d) for i, d in zip(index, dist, strict=True) if i < len(_COORDS.value)]
-
-
-def station_filter(station: Station, *, is_airport: bool, reporting: bool) -> bool:
-    """Return True if station matches given criteria."""
-    if is_airport and "airport" not in station.type:
-        return False
-    return bool(not reporting or station.sends_reports)
-
-
-@cache
+@memoize(maxsize=1024)
 def _query_filter(
     lat: float, lon: float, n: int, d: float, *, is_airport: bool, reporting: bool
 ) -> list[tuple[Station, float]]:
     """Return <= n number of stations <= d distance from lat,lon matching the query params."""
-    k = n * 20
-    last = 0
-    stations: list[tuple[Station, float]] = []
-    while True:
-        nodes = _query_coords(lat, lon, k, d)[last:]
-        # Ran out of new stations
-        if not nodes:
-            return stations
-        for code, dist in nodes:
-            if not code:
-                continue
-            stn = Station.from_code(code)
-            if station_filter(stn, is_airport=is_airport, reporting=reporting):
-                stations.append((stn, dist))
-            # Reached the desired number of stations
-            if len(stations) >= n:
-                return stations
-        last = k
-        k += n * 100
+    required = _filter_flags(is_airport=is_airport, reporting=reporting)
+    return [(Station.from_code(code), dist) for code, dist in _query_coords(lat, lon, n, d, required)]
 
 
 def nearest(
@@ -342,9 +321,9 @@ def nearest(
 ) -> dict | list[dict]:
     """Find the nearest n Stations to a lat,lon coordinate pair.
 
-    Returns the Station and coordinate distance from source.
-
-    NOTE: Becomes less accurate toward poles and doesn't cross +/-180.
+    Returns the Station and coordinate distance from source. Coordinate
+    distances are great-circle angles in degrees, so results are correct across
+    the antimeridian and near the poles.
     """
     # Default state includes all, no filtering necessary
     if is_airport or sends_reports:
@@ -370,3 +349,66 @@ def nearest(
         return ret[0]
     ret.sort(key=lambda x: x["miles"])
     return ret
+
+
+def nearest_many(
+    lats: Iterable[float],
+    lons: Iterable[float],
+    n: int = 1,
+    *,
+    is_airport: bool = False,
+    sends_reports: bool = True,
+    max_coord_distance: float = 10,
+) -> list[list[dict]]:
+    """Find the nearest n Stations to each lat,lon coordinate pair.
+
+    Takes matching sequences or arrays of latitudes and longitudes and returns
+    a list of results for each pair in the same format as `nearest`, closest
+    first. Each filter combination has its own coordinate tree, so only
+    matching stations are searched and loaded. With the scipy extra installed,
+    every pair is searched in one vectorized query.
+    """
+    from geopy import units  # type: ignore
+    from geopy.distance import EARTH_RADIUS  # type: ignore
+
+    pairs = list(zip(lats, lons, strict=True))
+    required = _filter_flags(is_airport=is_airport, reporting=sends_reports)
+    coords, tree = STATIONS.coord_index(required)
+    # Search angles are great-circle distances, so no separate distance calc is needed
+    batch = tree.batch_query(pairs, n, max_coord_distance)
+    if batch is None:
+        found = tree.query_many(pairs, n, max_coord_distance)
+        ids = [[i for i, _ in nodes] for nodes in found]
+        degrees = [[d for _, d in nodes] for nodes in found]
+        kms = [[math.radians(d) * EARTH_RADIUS for d in row] for row in degrees]
+        nautical = [[units.nautical(kilometers=km) for km in row] for row in kms]
+        miles = [[units.miles(kilometers=km) for km in row] for row in kms]
+    else:
+        import numpy as np
+
+        id_array, degree_array = batch
+        km_array = np.radians(degree_array) * EARTH_RADIUS
+        ids, degrees, kms = id_array.tolist(), degree_array.tolist(), km_array.tolist()
+        nautical = units.nautical(kilometers=km_array).tolist()
+        miles = units.miles(kilometers=km_array).tolist()
+    # Each station is loaded once no matter how many pairs it is near
+    stations: dict[str, Station] = {}
+    ret: list[list[dict]] = []
+    for row in zip(ids, degrees, nautical, miles, kms, strict=True):
+        results = []
+        for i, dist, nm, mi, km in zip(*row, strict=True):
+            if i < 0 or not (code := coords[i][0]):
+                continue
+            if code not in stations:
+                stations[code] = Station.from_code(code)
+            results.append(
+                {
+                    "station": stations[code],
+                    "coordinate_distance": dist,
+                    "nautical_miles": nm,
+                    "miles": mi,
+                    "kilometers": km,
+                }
+            )
+        ret.append(results)
+    return ret
@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from datetime import datetime
+    from types import ModuleType
+
+    from shapely.geometry import Point, Polygon
 
 # module
 from avwx.exceptions import MissingExtraModule
@@ -18,14 +22,44 @@ try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
-try:
-    from shapely.geometry import Point, Polygon
-except ModuleNotFoundError:
-    Point, Polygon = TypeAlias, TypeAlias  # type: ignore
-
 AIRCRAFT = LazyLoad("aircraft")
 
 
+def _import_shapely() -> ModuleType:
+    """Import shapely on first geometry use since it also loads numpy."""
+    try:
+        import shapely
+    except ModuleNotFoundError as exc:
+        extra = "shape"
+        raise MissingExtraModule(extra) from exc
+    return shapely
+
+
+class _Deferred:
+    """Dataclass field that also accepts a zero-argument callable as its value.
+
+    The callable runs the first time the field is read and is replaced by its result.
+    Init, eq, repr, and asdict all read through the descriptor, so output is unchanged.
+    """
+
+    name: str
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            # No class-level default so the dataclass field stays required
+            raise AttributeError(self.name)
+        value = obj.__dict__[self.name]
+        if callable(value):
+            value = obj.__dict__[self.name] = value()
+        return value
+
+    def __set__(self, obj: object, value: Any | Callable[[], Any]) -> None:
+        obj.__dict__[self.name] = value
+
+
 @dataclass
 class Aircraft:
     code: str
@@ -61,14 +95,14 @@ class Units:
         return cls(**NA_UNITS)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Number:
     repr: str
     value: int | float | None
-    spoken: str
+    spoken: str = _Deferred()  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Fraction(Number):
     numerator: int
     denominator: int
@@ -138,12 +172,20 @@ class Coord:
     def pair(self) -> tuple[float, float]:
         return self.lat, self.lon
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Drop the cached Point when the position changes
+        if name in {"lat", "lon"}:
+            self.__dict__.pop("_point", None)
+        super().__setattr__(name, value)
+
     @property
     def point(self) -> Point:
-        if Point is None:
-            extra = "shape"
-            raise MissingExtraModule(extra)
-        return Point(self.lat, self.lon)
+        """Shapely Point cached until lat or lon is assigned."""
+        # Cache outside of the dataclass fields to keep asdict and eq unchanged
+        point: Point | None = self.__dict__.get("_point")
+        if point is None:
+            point = self.__dict__["_point"] = _import_shapely().Point(self.lat, self.lon)
+        return point
 
     @staticmethod
     def to_dms(value: float) -> tuple[int, int, int]:
@@ -155,7 +197,7 @@ class Coord:
         return int(degree), int(minute), int(second)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Cloud:
     repr: str
     type: str | None = None
@@ -371,10 +413,27 @@ class AirSigObservation:
 
     @property
     def poly(self) -> Polygon | None:
-        if Polygon is None:
-            extra = "shape"
-            raise MissingExtraModule(extra)
-        return Polygon([c.pair for c in self.coords]) if len(self.coords) > MIN_POLY_SIZE else None
+        """Shapely Polygon cached until the coords change."""
+        # Cache outside of the dataclass fields to keep asdict and eq unchanged
+        key = tuple(c.pair for c in self.coords)
+        if self.__dict__.get("_poly_key") != key:
+            shapely = _import_shapely()
+            self.__dict__["_poly"] = shapely.Polygon(key) if len(key) > MIN_POLY_SIZE else None
+            self.__dict__["_poly_key"] = key
+        poly: Polygon | None = self.__dict__["_poly"]
+        return poly
+
+    @property
+    def prepared_poly(self) -> Polygon | None:
+        """Cached Polygon prepared for fast repeated predicate checks.
+
+        Prepared geometries are only faster as the first predicate argument.
+        For example, use `poly.contains(point)` over `point.within(poly)`.
+        """
+        poly = self.poly
+        if poly is not None:
+            _import_shapely().prepare(poly)
+        return poly
 
 
 @dataclass
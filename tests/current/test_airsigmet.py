@@ -6,18 +6,21 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 # library
 import pytest
-from shapely.geometry import LineString
+from shapely.geometry import LineString, Polygon
 
 # module
 from avwx import structs
 from avwx.current import airsigmet
 from avwx.parsing import core
+from avwx.service.base import Service
 from avwx.static.core import CARDINAL_DEGREES
 from avwx.structs import Coord, Movement, Units
 
@@ -529,6 +532,39 @@ def test_contains(lat: int, lon: int, results: tuple) -> None:
         assert report.contains(coord) == result
 
 
+def test_cached_geometry() -> None:
+    """Test that observation and coordinate geometry is cached until changed."""
+    report = COORD_REPORTS[0]
+    assert report.data is not None
+    obs = report.data.observation
+    assert obs is not None
+    poly = obs.poly
+    assert poly is not None
+    assert obs.poly is poly
+    assert obs.prepared_poly is poly
+    before = asdict(obs)
+    obs.coords.append(Coord(0, -15))
+    assert obs.poly is not poly
+    assert obs.poly.equals(Polygon([c.pair for c in obs.coords]))
+    obs.coords.pop()
+    assert obs.poly.equals(poly)
+    assert asdict(obs) == before
+    changed = obs.poly
+    lat = obs.coords[0].lat
+    obs.coords[0].lat = lat + 1
+    assert obs.poly is not changed
+    assert obs.poly.equals(Polygon([c.pair for c in obs.coords]))
+    obs.coords[0].lat = lat
+    obs.coords = list(obs.coords)
+    assert obs.poly.equals(poly)
+    coord = Coord(5, 5)
+    point = coord.point
+    assert coord.point is point
+    coord.lat = 6
+    assert coord.point.x == 6
+    assert coord == Coord(6, 5)
+
+
 @pytest.mark.parametrize(
     ("coords", "results"),
     [
@@ -582,6 +618,50 @@ def test_manager_contains(lat: int, lon: int, count: int) -> None:
     assert len(manager.contains(coord)) == count
 
 
+def test_manager_contains_many() -> None:
+    """Test filtering reports for many coordinates at once."""
+    manager = airsigmet.AirSigManager()
+    manager.reports = COORD_REPORTS
+    coords = [Coord(5, 5), Coord(5, -15), Coord(5, 15), Coord(5, -5), Coord(0, 0)]
+    results = manager.contains_many(coords)
+    assert [len(r) for r in results] == [2, 0, 1, 1, 1]
+    for coord, reports in zip(coords, results, strict=True):
+        assert reports == manager.contains(coord)
+        assert reports == [r for r in COORD_REPORTS if r.contains(coord)]
+    assert manager.contains_many([]) == []
+
+
+def test_manager_index_rebuild() -> None:
+    """Test that the spatial index follows changes to the reports list."""
+    manager = airsigmet.AirSigManager()
+    assert manager.contains(Coord(5, 5)) == []
+    assert manager.contains_many([Coord(5, 5)]) == [[]]
+    manager.reports = COORD_REPORTS[:1]
+    assert manager.contains(Coord(5, 5)) == COORD_REPORTS[:1]
+    manager.reports = COORD_REPORTS
+    assert manager.contains(Coord(5, 5)) == COORD_REPORTS[:2]
+
+
+def test_manager_index_assignment() -> None:
+    """Test that the spatial index is rebuilt when a new reports list is assigned."""
+    manager = airsigmet.AirSigManager()
+    reports = list(COORD_REPORTS)
+    manager.reports = reports
+    coord = Coord(5, 5)
+    assert manager.contains(coord) == COORD_REPORTS[:2]
+    index = manager._spatial_index()
+    assert manager.contains_many([coord, coord]) == [COORD_REPORTS[:2]] * 2
+    assert manager._spatial_index() is index
+    reports[0], reports[2] = reports[2], reports[0]
+    manager.reports = reports
+    assert manager.contains(coord) == [COORD_REPORTS[1], COORD_REPORTS[0]]
+    manager.reports = [reports[0], COORD_REPORTS[3], reports[2]]
+    assert manager.contains(coord) == [COORD_REPORTS[0]]
+    assert manager.contains_many([coord]) == [[r for r in manager.reports if r.contains(coord)]]
+    manager.reports = None
+    assert manager.contains(coord) == []
+
+
 @pytest.mark.parametrize(
     ("coords", "count"),
     [
@@ -597,3 +677,88 @@ def test_along(coords: tuple, count: int) -> None:
     manager.reports = COORD_REPORTS
     path = [Coord(c[0], c[1]) for c in coords]
     assert len(manager.along(path)) == count
+
+
+class StaticService(Service):
+    """Service stub returning a fixed report list."""
+
+    _url = "https://example.com/airsigmet"
+
+    def __init__(self, reports: list[str]) -> None:
+        super().__init__("airsigmet")
+        self.reports = reports
+
+    async def async_fetch(self, timeout: int = 10) -> list[str]:  # noqa: ARG002
+        return self.reports
+
+
+def _stub_manager(reports: list[str], **kwargs: Any) -> airsigmet.AirSigManager:
+    manager = airsigmet.AirSigManager(**kwargs)
+    manager._services = [StaticService(reports)]
+    return manager
+
+
+@pytest.mark.parametrize("executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_manager_executor(executor_class: type[Executor] | None) -> None:
+    """Test parsing reports with an optional executor."""
+    reports = [_PRE + r for r in _COORD_LOCS]
+    executor = executor_class(2) if executor_class else None  # type: ignore
+    manager = _stub_manager(reports, executor=executor)
+    try:
+        assert await manager.async_update() is True
+    finally:
+        if executor:
+            executor.shutdown()
+    assert manager.reports is not None
+    assert [r.raw for r in manager.reports] == reports
+    assert [r.data for r in manager.reports] == [r.data for r in COORD_REPORTS]
+    assert all(r.source == "example.com" for r in manager.reports)
+    assert await manager.async_update() is False
+
+
+@pytest.mark.parametrize("executor_class", [None, ThreadPoolExecutor])
+async def test_manager_exception_intercept(executor_class: type[Executor] | None) -> None:
+    """Test that parsing errors are passed to the exception interceptor."""
+    executor = executor_class(1) if executor_class else None  # type: ignore
+    manager = _stub_manager(["WAUS43 KKCI"], executor=executor)
+    try:
+        with pytest.raises(IndexError):
+            await manager.async_update()
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+async def test_manager_incremental() -> None:
+    """Test that incremental updates only parse new reports."""
+    reports = [_PRE + r for r in _COORD_LOCS]
+    manager = _stub_manager(reports[:3])
+    assert await manager.async_update() is True
+    assert manager.reports is not None
+    first = manager.reports
+    assert manager.added == first
+    assert manager.removed == []
+    manager._services[0].reports = reports[1:]  # type: ignore
+    assert await manager.async_update() is True
+    assert [r.raw for r in manager.reports] == reports[1:]
+    assert manager.reports[0] is first[1]
+    assert manager.reports[1] is first[2]
+    assert manager.reports[2] not in first
+    assert manager.added == [manager.reports[2]]
+    assert manager.removed == [first[0]]
+    assert len(manager._parsed) == 3
+
+
+async def test_manager_not_incremental() -> None:
+    """Test that all reports are parsed when not incremental."""
+    reports = [_PRE + r for r in _COORD_LOCS]
+    manager = _stub_manager(reports[:2], incremental=False)
+    assert await manager.async_update() is True
+    assert manager.reports is not None
+    first = manager.reports
+    manager._services[0].reports = reports[1:3]  # type: ignore
+    assert await manager.async_update() is True
+    assert manager.reports[0] is not first[1]
+    assert manager.reports[0].data == first[1].data
+    assert [r.raw for r in manager.added] == reports[2:3]
+    assert [r.raw for r in manager.removed] == reports[:1]
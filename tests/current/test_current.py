@@ -4,9 +4,14 @@
 import pytest
 
 # module
-from avwx import current
+from avwx import Metar, Taf, current
+from avwx.exceptions import BadStation, SourceError
+from avwx.service.scrape import NoaaApi
 from avwx.structs import Code
 
+# tests
+from tests.util import stub_server
+
 
 @pytest.mark.parametrize(
     ("code", "value"),
@@ -30,3 +35,77 @@ def test_wxcode(code: str, value: str) -> None:
 )
 def test_unknown_code(code: str, value: str) -> None:
     assert current.base.wx_code(code) == value
+
+
+_STUB_REPORTS = {
+    "metar": {
+        "KJFK": "KJFK 032151Z 16008KT 10SM FEW034 BKN250 27/23 A3013",
+        "KMCO": "KMCO 032153Z 18010KT 10SM FEW030 32/22 A3001",
+        "KCRO": "KCRO 032153Z 32006KT 10SM CLR 36/09 A2988",
+    },
+    "taf": {
+        "KJFK": "TAF KJFK 031730Z 0318/0424 17010KT P6SM FEW040\n  FM040000 19008KT P6SM SCT050",
+    },
+}
+
+
+def _stub_noaa(path: str, query: dict[str, list[str]]) -> str:
+    reports = _STUB_REPORTS[path.rsplit("/", maxsplit=1)[-1]]
+    return "\n".join(reports[i] for i in query["ids"][0].split(",") if i in reports)
+
+
+@pytest.mark.parametrize("report_class", [Metar, Taf])
+def test_update_many(report_class: type[current.base.Report], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test updating many reports with batched NOAA requests."""
+    stations = ["KJFK", "KMCO", "KLGA"]
+    with stub_server(_stub_noaa) as (root, requests):
+        monkeypatch.setattr(NoaaApi, "_url", root + "/api/data/{}")
+        reports = report_class.update_many(stations, chunk_size=2)
+    assert len(requests) == 2
+    assert [r.code for r in reports] == stations
+    expected = _STUB_REPORTS[report_class.__name__.lower()]
+    for report in reports:
+        assert isinstance(report, report_class)
+        if raw := expected.get(report.code or ""):
+            assert report.raw == " ".join(raw.split())
+            assert report.data is not None
+            assert report.data.station == report.code
+            assert report.source == root.removeprefix("http://")
+        else:
+            assert report.raw is None
+            assert report.data is None
+
+
+def test_update_many_idents(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test batched reports match by lookup code and bad idents don't stop the others."""
+    with stub_server(_stub_noaa) as (root, requests):
+        monkeypatch.setattr(NoaaApi, "_url", root + "/api/data/{}")
+        reports = Metar.update_many(["43CN", "NOPE", "KMCO"], disable_post=True)
+    assert len(requests) == 1
+    assert "KCRO" in requests[0]
+    local, nope, mco = reports
+    assert isinstance(local, Metar)
+    assert local.code == "43CN"
+    assert local.raw == _STUB_REPORTS["metar"]["KCRO"]
+    assert isinstance(nope, BadStation)
+    assert isinstance(mco, Metar)
+    assert mco.raw == _STUB_REPORTS["metar"]["KMCO"]
+
+
+def _stub_noaa_error(path: str, query: dict[str, list[str]]) -> str | None:
+    return None if "KMCO" in query["ids"][0] else _stub_noaa(path, query)
+
+
+def test_update_many_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a failed chunk returns its errors while other chunks still update."""
+    stations = ["KJFK", "KLGA", "KMCO"]
+    with stub_server(_stub_noaa_error) as (root, requests):
+        monkeypatch.setattr(NoaaApi, "_url", root + "/api/data/{}")
+        reports = Metar.update_many(stations, chunk_size=2)
+    assert len(requests) == 2
+    jfk, lga, mco = reports
+    assert isinstance(jfk, Metar)
+    assert jfk.raw == _STUB_REPORTS["metar"]["KJFK"]
+    assert isinstance(lga, Metar)
+    assert lga.raw is None
+    assert isinstance(mco, SourceError)
@@ -3,6 +3,7 @@
 # stdlib
 from __future__ import annotations
 
+import pickle
 from dataclasses import asdict
 from datetime import datetime
 
@@ -10,7 +11,7 @@ from datetime import datetime
 import pytest
 
 # module
-from avwx import static, structs
+from avwx import exceptions, static, structs
 from avwx.current import metar
 
 # tests
@@ -234,6 +235,20 @@ def test_parse_runway_visibility(
     assert rvr.trend == trend
 
 
+def test_deferred_speech() -> None:
+    """Test report speech is only built when read and survives asdict and pickle."""
+    report = metar.Metar.from_report("KJFK 101651Z 32012G20KT 10SM R04R/P6000FT/D FEW250 M01/M12 A3012")
+    assert report is not None
+    assert report.data is not None
+    rvr = report.data.runway_visibility[0].visibility
+    assert rvr is not None
+    assert callable(rvr.__dict__["spoken"])
+    copied = pickle.loads(pickle.dumps(report.data))
+    assert asdict(copied) == asdict(report.data)
+    assert rvr.spoken == "greater than six thousand"
+    assert report.speech is not None
+
+
 @pytest.mark.parametrize(
     ("wx", "count"),
     [
@@ -301,3 +316,48 @@ def test_metar_ete(ref: dict, icao: str, issued: datetime) -> None:
     assert asdict(station.translations) == ref["translations"]
     assert station.summary == ref["summary"]
     assert station.speech == ref["speech"]
+
+
+def test_parse_many() -> None:
+    """Test bulk parsing returns results and errors in report order."""
+    reports = [
+        "KJFK 032151Z 16008KT 10SM FEW034 FEW130 BKN250 27/23 A3013 RMK AO2 SLP201",
+        "1 2 3 4",
+        "EGLL 032150Z 24012KT 9999 SCT040 18/09 Q1016",
+    ]
+    results = metar.parse_many(reports)
+    assert len(results) == 3
+    for index in (0, 2):
+        data, units, sans = results[index]  # type: ignore
+        assert isinstance(data, structs.MetarData)
+        assert isinstance(units, structs.Units)
+        assert isinstance(sans, structs.Sanitization)
+        assert data.raw == reports[index]
+        assert data.station == reports[index][:4]
+    assert isinstance(results[1], exceptions.BadStation)
+
+
+def test_parse_many_matches_from_report() -> None:
+    """Test bulk parsing matches the single report output."""
+    report = "KMCO 032153Z 18010KT 10SM FEW030 32/22 A3001 RMK AO2 T03170222"
+    single = metar.Metar.from_report(report)
+    assert single is not None
+    data, units, sans = metar.parse_many([report])[0]  # type: ignore
+    assert data == single.data
+    assert units == single.units
+    assert sans == single.sanitization
+
+
+def test_parse_many_workers() -> None:
+    """Test bulk parsing in a process pool."""
+    reports = [
+        "KJFK 032151Z 16008KT 10SM FEW034 FEW130 BKN250 27/23 A3013 RMK AO2 SLP201",
+        "",
+        "PHNL 032153Z 06012KT 10SM FEW030 28/18 A3002",
+    ]
+    results = metar.parse_many(reports, workers=2, chunksize=1)
+    assert results[0] == metar.parse_many(reports[:1])[0]
+    assert isinstance(results[1], exceptions.BadStation)
+    data, *_ = results[2]  # type: ignore
+    assert isinstance(data, structs.MetarData)
+    assert data.station == "PHNL"
@@ -5,6 +5,7 @@
 # stdlib
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 from typing import Any
 
@@ -202,6 +203,41 @@ def test_make_number_literal() -> None:
     assert number.spoken == "one zero zero"
 
 
+def test_make_number_cached() -> None:
+    """Test repeat Numbers are shared, immutable, and build speech on first read."""
+    core._make_number.cache_clear()
+    number = core.make_number("1234")
+    assert number is core.make_number("1234")
+    assert callable(number.__dict__["spoken"])
+    assert number.spoken == "one two three four"
+    assert number.__dict__["spoken"] == "one two three four"
+    with pytest.raises(FrozenInstanceError):
+        number.value = 1  # type: ignore
+    assert core.make_number("1234", literal=True) is not number
+
+
+def test_replace_number() -> None:
+    """Test Number copies keep speech deferred until read."""
+    core._make_number.cache_clear()
+    number = core.make_number("P6000")
+    assert number is not None
+    copied = core.replace_number(number, value=None, speak_prefix="decreasing ")
+    assert callable(number.__dict__["spoken"])
+    assert callable(copied.__dict__["spoken"])
+    assert copied == Number("P6000", None, "decreasing greater than six thousand")
+    fraction = core.replace_number(core.make_fraction("1/2"), repr="M1/2")
+    assert isinstance(fraction, Fraction)
+    assert fraction.repr == "M1/2"
+    assert fraction.spoken == "one half"
+
+
+def test_make_number_special_override() -> None:
+    """Test caller special values take priority over cached Numbers."""
+    special = {"CLM": (5, "five")}
+    assert core.make_number("CLM", special=special) == Number("CLM", 5, "five")
+    assert core.make_number("CLM") == Number("CLM", 0, "calm")
+
+
 @pytest.mark.parametrize(
     ("string", "targets", "index"),
     [
@@ -362,6 +398,30 @@ def test_make_cloud(cloud: str, out: list[Any]) -> None:
         assert getattr(ret_cloud, key) == out[i]
 
 
+def test_make_cloud_cached() -> None:
+    """Test repeat Clouds are shared and immutable."""
+    core.make_cloud.cache_clear()
+    cloud = core.make_cloud("BKN020CB")
+    assert cloud is core.make_cloud("BKN020CB")
+    assert core.make_cloud.cache_info().hits == 1
+    with pytest.raises(FrozenInstanceError):
+        cloud.base = 30  # type: ignore
+    assert cloud == structs.Cloud("BKN020CB", "BKN", 20, None, "CB")
+
+
+@pytest.mark.parametrize(
+    "item",
+    ["", "////", "UNKN", "241755Z", "2418/2524", "M04", "27015G25KT", "180V240", "FL350", "R04/P6000FT", "BKN020"],
+)
+def test_classify(item: str) -> None:
+    """Test that the cached token kinds agree with each uncached check."""
+    kinds = core.classify(item)
+    assert kinds is core.classify(item)
+    for kind, value in kinds._asdict().items():
+        assert value is getattr(core, f"_is_{kind}")(item)
+        assert value is getattr(core, f"is_{kind}")(item)
+
+
 @pytest.mark.parametrize(
     ("wx", "clouds"),
     [
@@ -9,6 +9,7 @@ from pathlib import Path
 import pytest
 
 # module
+from avwx.parsing.sanitization.base import sanitize_string_with
 from avwx.parsing.sanitization.metar import clean_metar_list, clean_metar_string
 from avwx.parsing.sanitization.taf import clean_taf_list
 from avwx.structs import Sanitization
@@ -37,6 +38,25 @@ def test_sanitize_empty_report_string() -> None:
     assert clean_metar_string("  MVP=", Sanitization()) == "MVP"
 
 
+@pytest.mark.parametrize(
+    ("replacements", "line", "fixed", "removed", "replaced"),
+    [
+        ({".": "", "CALMKT ": "CALM "}, "KJFK CALM.KT 10SM", "KJFK CALM 10SM", ["."], {"CALMKT": "CALM"}),
+        ({"CALMKT ": "CALM ", ".": ""}, "KJFK CALM.KT 10SM", "KJFK CALMKT 10SM", ["."], {}),
+        ({"AB": "X", "A": "Y", "ABC": "Z"}, "KJFK ABC A", "KJFK XC Y", [], {"AB": "X", "A": "Y"}),
+        ({"!": "1"}, "KJFK 10SM", "KJFK 10SM", [], {}),
+    ],
+)
+def test_sanitize_string_key_order(
+    replacements: dict[str, str], line: str, fixed: str, removed: list[str], replaced: dict[str, str]
+) -> None:
+    """Test that string replacements are applied in key order."""
+    sans = Sanitization()
+    assert sanitize_string_with(replacements)(line, sans) == fixed
+    assert sans.removed == removed
+    assert sans.replaced == replaced
+
+
 def _test_list_sanitizer(cleaner: Callable, case: dict) -> None:
     """Test a function which fixes common mistakes while the report is a list."""
     line, fixed = case["report"].split(), case["fixed"].split()
@@ -5,6 +5,7 @@
 from typing import Any
 
 # library
+import httpx
 import pytest
 
 # module
@@ -45,3 +46,46 @@ class ServiceFetchTest(BaseServiceTest):
         """Test that reports are fetched from async service."""
         report = await serv.async_fetch(station)  # type: ignore
         self.validate_report(station, report)
+
+
+async def test_shared_client() -> None:
+    """Test that one client is shared per event loop until closed."""
+    clients = service.HTTPClients(http2=False)
+    client = clients.get()
+    assert clients.get() is client
+    assert client.is_closed is False
+    await clients.aclose()
+    assert client.is_closed is True
+    new_client = clients.get()
+    assert new_client is not client
+    await clients.aclose()
+
+
+def test_shared_client_per_loop() -> None:
+    """Test that clients are not shared across event loops."""
+
+    async def get() -> httpx.AsyncClient:
+        return service.CLIENTS.get()
+
+    first = service.base.run(get())
+    second = service.base.run(get())
+    assert first is not second
+    assert first.is_closed is True
+    assert second.is_closed is True
+
+
+async def test_injected_client() -> None:
+    """Test that requests reuse an injected client and its connections."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text=f"KJFK {request.url.params['ids']}")
+
+    serv = service.scrape.NoaaApi("metar")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        serv.client = client
+        for _ in range(3):
+            assert await serv.async_fetch("KJFK") == "KJFK KJFK"
+    assert len(calls) == 3
+    assert all(c.url.host == "aviationweather.gov" for c in calls)
@@ -0,0 +1,95 @@
+"""Response Cache Tests."""
+
+# stdlib
+import asyncio as aio
+
+# library
+import pytest
+
+# module
+from avwx.service.cache import MemoryStore, ResponseCache
+
+# tests
+from tests.util import slow_report, stub_service, stub_server
+
+
+async def test_memory_store() -> None:
+    """Test that the memory store expires and evicts items."""
+    store = MemoryStore(maxsize=2)
+    await store.set("a", "1", 60)
+    await store.set("b", "2", 0.05)
+    assert await store.get("a") == "1"
+    await store.set("c", "3", 60)
+    # "b" was least recently used
+    assert len(store) == 2
+    assert await store.get("b") is None
+    await aio.sleep(0.06)
+    await store.set("d", "4", 0.05)
+    await aio.sleep(0.06)
+    assert await store.get("d") is None
+    # "a" was evicted by "d"
+    assert await store.get("a") is None
+    assert await store.get("c") == "3"
+    await store.delete("c")
+    assert await store.get("c") is None
+    await store.clear()
+    assert len(store) == 0
+
+
+async def test_fetch_coalesced() -> None:
+    """Test that concurrent identical fetches share one upstream request."""
+    with stub_server(slow_report) as (root, requests):
+        service = stub_service(root)
+        service.cache = ResponseCache(ttl=60)
+        reports = await aio.gather(*[service.async_fetch(code) for code in ["KJFK"] * 10 + ["KMCO"] * 5])
+        assert reports[0].startswith("KJFK ")
+        assert reports[-1].startswith("KMCO ")
+        assert reports == [reports[0]] * 10 + [reports[-1]] * 5
+        assert len(requests) == 2
+        # Cached responses skip the network
+        assert await service.async_fetch("KJFK") == reports[0]
+        assert len(requests) == 2
+        # Different report types are cached separately
+        taf = type(service)("taf")
+        taf.cache = service.cache
+        await taf.async_fetch("KJFK")
+        assert len(requests) == 3
+        await service.cache.clear()
+        await service.async_fetch("KJFK")
+        assert len(requests) == 4
+
+
+async def test_fetch_error_not_cached() -> None:
+    """Test that failed fetches are shared by waiters but not stored."""
+    calls = 0
+
+    async def _fail() -> str:
+        nonlocal calls
+        calls += 1
+        await aio.sleep(0.01)
+        msg = "upstream down"
+        raise ConnectionError(msg)
+
+    cache = ResponseCache()
+    results = await aio.gather(*[cache.fetch("key", _fail) for _ in range(5)], return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(r, ConnectionError) for r in results)
+    with pytest.raises(ConnectionError):
+        await cache.fetch("key", _fail)
+    assert calls == 2
+
+
+async def test_fetch_caller_cancelled() -> None:
+    """Test that a cancelled caller does not cancel the shared request."""
+
+    async def _call() -> str:
+        await aio.sleep(0.05)
+        return "value"
+
+    cache = ResponseCache()
+    first = aio.ensure_future(cache.fetch("key", _call))
+    second = aio.ensure_future(cache.fetch("key", _call))
+    await aio.sleep(0.01)
+    first.cancel()
+    assert await second == "value"
+    assert await cache.store.get("key") == "value"
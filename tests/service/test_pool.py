@@ -0,0 +1,124 @@
+"""UpdatePool Tests."""
+
+# stdlib
+import threading
+import time
+
+# library
+import pytest
+
+# module
+from avwx.exceptions import InvalidRequest
+from avwx.service import UpdatePool
+
+# tests
+from tests.util import stub_metars, stub_server
+
+_REPORTS = {
+    "KJFK": "KJFK 032151Z 16008KT 10SM FEW034 BKN250 27/23 A3013",
+    "KMCO": "KMCO 032153Z 18010KT 10SM FEW030 32/22 A3001",
+    "KLGA": "KLGA 032151Z 17009KT 10SM FEW040 27/22 A3012",
+    "KBOS": "KBOS 032154Z 09010KT 10SM SCT050 22/16 A3015",
+}
+
+
+class _Tracker:
+    """Stub responder recording the most concurrent requests."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.active = 0
+        self.most = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, path: str, query: dict[str, list[str]]) -> str:
+        with self._lock:
+            self.active += 1
+            self.most = max(self.most, self.active)
+        time.sleep(float(path.strip("/") or 0) or self.delay)
+        with self._lock:
+            self.active -= 1
+        return _REPORTS.get(query["ids"][0], "")
+
+
+def test_update_pool_results() -> None:
+    """Test that results are returned in order with errors recorded."""
+    codes = ["KJFK", "KMCO", "KSFO", "KLGA"]
+    with stub_server(_Tracker()) as (root, _):
+        results = UpdatePool().update(stub_metars(root, codes))
+    assert [r.code for r in results] == codes
+    for result in results:
+        if result.code == "KSFO":
+            assert not result.ok
+            assert isinstance(result.error, InvalidRequest)
+            assert result.updated is False
+        else:
+            assert result.ok
+            assert result.updated is True
+            assert result.report.raw == _REPORTS[result.code or ""]
+            assert result.report.data is not None
+        assert result.elapsed > 0
+
+
+@pytest.mark.parametrize(("per_service", "service_limits"), [(2, None), (10, {"Stub": 2})])
+def test_update_pool_service_limit(per_service: int, service_limits: dict[str, int] | None) -> None:
+    """Test that concurrent updates per service are limited."""
+    tracker = _Tracker(delay=0.1)
+    with stub_server(tracker) as (root, requests):
+        pool = UpdatePool(per_service=per_service, per_host_rate=None, service_limits=service_limits)
+        results = pool.update(stub_metars(root, list(_REPORTS) * 2))
+    assert len(requests) == 8
+    assert all(r.ok for r in results)
+    assert tracker.most == 2
+
+
+def test_update_pool_host_rate() -> None:
+    """Test that request starts are spaced by the per-host rate."""
+    with stub_server(_Tracker()) as (root, _):
+        start = time.perf_counter()
+        UpdatePool(per_host_rate=20).update(stub_metars(root, list(_REPORTS)))
+        elapsed = time.perf_counter() - start
+    assert elapsed >= 0.15
+
+
+def test_update_pool_timeout() -> None:
+    """Test that a slow service times out without stalling other updates."""
+    with stub_server(_Tracker()) as (root, _):
+        slow = stub_metars(f"{root}/1.5", ["KJFK"], default_timeout=1)
+        fast = stub_metars(root, ["KMCO", "KLGA"])
+        results = UpdatePool().update(slow + fast)
+    assert isinstance(results[0].error, TimeoutError)
+    assert results[0].elapsed < 1.5
+    assert all(r.updated for r in results[1:])
+
+
+def test_update_pool_zero_timeout() -> None:
+    """Test that an explicit zero timeout is not replaced by the service default."""
+    with stub_server(_Tracker()) as (root, _):
+        results = UpdatePool().update(stub_metars(root, ["KJFK", "KMCO"]), timeout=0)
+    assert all(isinstance(r.error, TimeoutError) for r in results)
+
+
+def test_update_pool_host_wait_frees_slot() -> None:
+    """Test that waiting on a rate-limited host doesn't hold a global slot."""
+    finished: dict[str, float] = {}
+
+    def _record(path: str, query: dict[str, list[str]]) -> str:
+        code = query["ids"][0]
+        finished[code] = time.perf_counter()
+        return _REPORTS[code]
+
+    with stub_server(_record) as (slow_root, _), stub_server(_record) as (fast_root, _):
+        reports = stub_metars(slow_root, ["KJFK", "KMCO", "KLGA"]) + stub_metars(fast_root, ["KBOS"])
+        start = time.perf_counter()
+        results = UpdatePool(max_concurrency=1, per_host_rate=2).update(reports)
+    assert all(r.ok for r in results)
+    assert finished["KBOS"] - start < 0.5
+    assert finished["KLGA"] - start >= 1
+
+
+def test_update_pool_bad_limits() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        UpdatePool(max_concurrency=0)
+    with pytest.raises(ValueError, match="positive"):
+        UpdatePool(per_host_rate=0)
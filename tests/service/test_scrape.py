@@ -12,6 +12,8 @@ import pytest
 from avwx import exceptions, service
 
 # tests
+from tests.util import stub_server
+
 from .test_base import ServiceClassTest, ServiceFetchTest
 
 
@@ -87,6 +89,55 @@ class TestNoaaApiClass(TestStationScrape):
     service_class = service.scrape.NoaaApi
 
 
+_STUB_REPORTS = {
+    "metar": {
+        "KJFK": "KJFK 032151Z 16008KT 10SM FEW034 BKN250 27/23 A3013",
+        "EGLL": "EGLL 032150Z 24012KT 9999 SCT040 18/09 Q1016",
+        "PHNL": "PHNL 032153Z 06012KT 10SM FEW030 28/18 A3002",
+    },
+    "taf": {
+        "KJFK": "TAF KJFK 031730Z 0318/0424 17010KT P6SM FEW040\n  FM040000 19008KT P6SM SCT050",
+        "EGLL": "TAF AMD EGLL 031700Z 0318/0424 24010KT 9999 SCT040",
+    },
+}
+
+
+def _stub_noaa(path: str, query: dict[str, list[str]]) -> str:
+    reports = _STUB_REPORTS[path.rsplit("/", maxsplit=1)[-1]]
+    return "\n".join(reports[i] for i in query["ids"][0].split(",") if i in reports)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+async def test_noaa_api_fetch_many(chunk_size: int) -> None:
+    """Test fetching many stations in chunked requests."""
+    stations = ["KJFK", "egll", "PHNL", "KMCO", "KJFK"]
+    with stub_server(_stub_noaa) as (root, requests):
+        serv = service.scrape.NoaaApi("metar")
+        serv._url = root + "/api/data/{}"  # type: ignore
+        reports = await serv.async_fetch_many(stations, chunk_size=chunk_size)
+    assert reports == _STUB_REPORTS["metar"]
+    assert len(requests) == -(-4 // chunk_size)
+
+
+def test_noaa_api_fetch_many_multiline() -> None:
+    """Test splitting multi-line TAF responses by station."""
+    with stub_server(_stub_noaa) as (root, requests):
+        serv = service.scrape.NoaaApi("taf")
+        serv._url = root + "/api/data/{}"  # type: ignore
+        reports = serv.fetch_many(["KJFK", "EGLL"])
+    assert len(requests) == 1
+    assert reports == {
+        "KJFK": "TAF KJFK 031730Z 0318/0424 17010KT P6SM FEW040 FM040000 19008KT P6SM SCT050",
+        "EGLL": "TAF AMD EGLL 031700Z 0318/0424 24010KT 9999 SCT040",
+    }
+
+
+async def test_noaa_api_fetch_many_bad_station() -> None:
+    """Test that invalid stations raise before fetching."""
+    with pytest.raises(exceptions.BadStation):
+        await service.scrape.NoaaApi("metar").async_fetch_many(["KJFK", "12K"])
+
+
 @pytest.mark.parametrize(*NOAA_PARAMS)
 class TestNoaaFtp(ServiceFetchTest):
     service_class = service.scrape.NoaaFtp
@@ -1,10 +1,18 @@
 """AVWX Base class tests."""
 
+# stdlib
+import asyncio as aio
+from unittest.mock import patch
+
 # library
 import pytest
 
 # module
 from avwx import Station, base
+from avwx.current import metar
+
+# tests
+from tests.util import StubScrape, slow_report, stub_metars, stub_server
 
 
 @pytest.mark.parametrize("code", ["KMCO", "MCO"])
@@ -16,3 +24,42 @@ def test_find_station(code: str) -> None:
 
 def test_no_station() -> None:
     assert base.find_station("1 2 3 4") is None
+
+
+async def test_update_single_flight() -> None:
+    """Test that concurrent updates for the same station share one fetch and parse."""
+    with stub_server(slow_report) as (root, requests):
+        reports = stub_metars(root, ["KJFK"] * 50)
+        others = stub_metars(root, ["KMCO"] * 5)
+        with patch("avwx.current.metar.parse", wraps=metar.parse) as parse:
+            results = await aio.gather(*[r.async_update() for r in reports + others])
+            assert parse.call_count == 2
+        assert len(requests) == 2
+        assert all(results)
+        # Later rounds also make one upstream call
+        results = await aio.gather(*[r.async_update() for r in reports])
+        assert len(requests) == 3
+        assert len(set(results)) == 1
+    first = reports[0]
+    assert first.data is not None
+    for report in reports[1:]:
+        assert report.raw == first.raw
+        assert report.data is first.data
+        assert report.source == first.source
+        assert report.code == "KJFK"
+        assert report.last_updated is not None
+    assert all(r.raw and r.raw.startswith("KMCO") for r in others)
+
+
+async def test_update_single_flight_error() -> None:
+    """Test that a failed shared update raises for every caller and isn't reused."""
+    with stub_server(slow_report) as (root, requests):
+        reports = stub_metars(root, ["KJFK"] * 5)
+        for report in reports:
+            report.service.report_type = "taf"
+        with patch.object(StubScrape, "_extract", side_effect=ValueError("bad")):
+            results = await aio.gather(*[r.async_update() for r in reports], return_exceptions=True)
+        assert len(requests) == 1
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await reports[0].async_update(disable_post=True) is True
+        assert len(requests) == 2
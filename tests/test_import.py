@@ -0,0 +1,79 @@
+"""Package import tests."""
+
+from __future__ import annotations
+
+# stdlib
+import subprocess
+import sys
+
+# library
+import pytest
+
+#: Submodule attribute chains that should resolve after a plain `import avwx`
+CHAINS = (
+    "current.metar",
+    "forecast.nbm",
+    "parsing.core",
+    "parsing.sanitization.metar",
+    "parsing.speech",
+    "parsing.translate.metar",
+    "static.metar",
+    "station.station",
+)
+
+#: Libraries that should only load once a feature needs them
+DEFERRED = (
+    "dateutil",
+    "geopy",
+    "httpcore",
+    "httpx",
+    "numpy",
+    "shapely",
+    "xmltodict",
+    "avwx.static.glossary",
+)
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter so no modules are already imported."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import avwx",
+        "from avwx import Metar",
+        "from avwx.current.metar import parse",
+        "from avwx.current.airsigmet import AirSigManager",
+        "from avwx.service import Noaa",
+    ],
+)
+def test_deferred_imports(code: str) -> None:
+    """Heavy libraries should not load until a fetch or geometry call needs them."""
+    check = f"import sys\n{code}\nprint(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    assert _run(check).stdout.strip() == ""
+
+
+def test_lazy_attributes() -> None:
+    """Report classes and submodules should still resolve from the package."""
+    import avwx
+
+    assert avwx.Metar.__module__ == "avwx.current.metar"
+    assert avwx.Station.__module__ == "avwx.station.station"
+    assert avwx.station.__name__ == "avwx.station"
+    assert "Taf" in dir(avwx)
+    with pytest.raises(AttributeError):
+        _ = avwx.NotAReport
+
+
+@pytest.mark.parametrize("chain", CHAINS)
+def test_submodule_chains(chain: str) -> None:
+    """Submodules should resolve as attributes like they did when the package imported them."""
+    check = f"import avwx\nprint(avwx.{chain}.__name__)"
+    assert _run(check).stdout.strip() == f"avwx.{chain}"
@@ -5,13 +5,37 @@
 # stdlib
 from __future__ import annotations
 
-from typing import Any
+import json
+import math
+import os
+import re
+import time
+from dataclasses import FrozenInstanceError, replace
+from typing import TYPE_CHECKING, Any
 
 # library
 import pytest
 
 # module
 from avwx import exceptions, station
+from avwx.load_utils import (
+    COORD_AIRPORT,
+    COORD_FILTERS,
+    COORD_REPORTING,
+    LazyStationStore,
+    StationCodes,
+    StationStore,
+    build_code_index,
+    build_coords,
+    write_station_store,
+)
+from avwx.station import spatial
+from avwx.station.cache import CacheInfo, cache_stats, clear_caches, memoize
+from avwx.station.meta import STATIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
 
 NA_CODES = {"KJFK", "PHNL", "TNCM", "MYNN"}
 IN_CODES = {"EGLL", "MNAH", "MUHA"}
@@ -97,9 +121,9 @@ def test_nearest_params(lat: int, lon: int, n: int, airport: bool, reporting: bo
 @pytest.mark.parametrize(
     ("airport", "reports", "count"),
     [
-        (True, True, 6),
-        (True, False, 16),
-        (False, True, 6),
+        (True, True, 10),
+        (True, False, 30),
+        (False, True, 10),
         (False, False, 30),
     ],
 )
@@ -109,6 +133,31 @@ def test_nearest_filter(airport: bool, reports: bool, count: int) -> None:
     assert len(stations) == count
 
 
+@pytest.mark.parametrize("batch", [True, False])
+@pytest.mark.parametrize(("airport", "reports"), [(True, True), (True, False), (False, True), (False, False)])
+def test_nearest_many(airport: bool, reports: bool, batch: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that batch queries match single nearest queries with and without SciPy."""
+    if not batch:
+        monkeypatch.setattr(spatial.CoordTree, "batch_query", lambda *_: None)
+    points = [(30, -80), (28.43, -81.31), (51.47, -0.46), (0, -150)]
+    lats, lons = zip(*points, strict=True)
+    results = station.nearest_many(lats, lons, 5, is_airport=airport, sends_reports=reports, max_coord_distance=2)
+    assert len(results) == len(points)
+    for (lat, lon), result in zip(points, results, strict=True):
+        expected = station.nearest(lat, lon, 5, is_airport=airport, sends_reports=reports, max_coord_distance=2)
+        assert isinstance(expected, list)
+        assert [r["station"] for r in result] == [r["station"] for r in expected]
+        for got, want in zip(result, expected, strict=True):
+            for key in ("coordinate_distance", "nautical_miles", "miles", "kilometers"):
+                assert got[key] == pytest.approx(want[key])
+    assert results[-1] == []
+
+
+def test_nearest_many_length() -> None:
+    with pytest.raises(ValueError, match="zip"):
+        station.nearest_many([30, 31], [-80])
+
+
 # Test Station class
 
 BAD_STATION_CODES = {"1234", 1234, None, True, ""}
@@ -117,22 +166,45 @@ BAD_STATION_CODES = {"1234", 1234, None, True, ""}
 def test_storage_code() -> None:
     """Test ID code selection."""
     stn = station.Station.from_icao("KJFK")
-    stn.icao = "ICAO"
-    stn.iata = "IATA"
-    stn.gps = "GPS"
-    stn.local = "LOCAL"
+    stn = replace(stn, icao="ICAO", iata="IATA", gps="GPS", local="LOCAL")
     assert stn.storage_code == "ICAO"
-    stn.icao = None
+    stn = replace(stn, icao=None)
     assert stn.storage_code == "IATA"
-    stn.iata = None
+    stn = replace(stn, iata=None)
     assert stn.storage_code == "GPS"
-    stn.gps = None
+    stn = replace(stn, gps=None)
     assert stn.storage_code == "LOCAL"
-    stn.local = None
+    stn = replace(stn, local=None)
     with pytest.raises(exceptions.BadStation):
         assert stn.storage_code
 
 
+def test_station_cached() -> None:
+    """Test that repeated lookups return the same immutable Station."""
+    stn = station.Station.from_code("KJFK")
+    assert station.Station.from_icao("kjfk") is stn
+    assert station.Station.from_iata("JFK") is stn
+    with pytest.raises(FrozenInstanceError):
+        stn.name = "Test"  # type: ignore[misc]
+    assert stn.runways
+    with pytest.raises(FrozenInstanceError):
+        stn.runways[0].length_ft = 0  # type: ignore[misc]
+    assert isinstance(stn.runways, tuple)
+    with pytest.raises(AttributeError):
+        stn.runways.append(stn.runways[0])  # type: ignore[attr-defined]
+    assert station.Station.from_code("KJFK").runways == stn.runways
+    assert not hasattr(stn, "__dict__")
+
+
+def test_from_code_many() -> None:
+    """Test loading many stations at once."""
+    stations = station.Station.from_code_many(["KJFK", "JFK", "EGLL", "MAYT", "KJFK", "00A"])
+    assert list(stations) == ["KJFK", "JFK", "EGLL", "00A"]
+    assert stations["KJFK"] is stations["JFK"]
+    assert stations["EGLL"].icao == "EGLL"
+    assert stations["00A"].local == "00A"
+
+
 @pytest.mark.parametrize(
     ("icao", "name", "city"),
     [
@@ -345,3 +417,433 @@ def test_search_filter() -> None:
         assert "airport" in airport.type
     for airport in station.search("orlando", sends_reports=True):
         assert airport.reporting is True
+
+
+@pytest.mark.parametrize(
+    ("text", "code"),
+    [
+        ("atl", "KATL"),
+        ("KJFK", "KJFK"),
+        ("mco", "KMCO"),
+        ("new yo", "KJFK"),
+        ("lexington k", "KLEX"),
+        ("heathr", "EGLL"),
+    ],
+)
+def test_search_prefix(text: str, code: str) -> None:
+    """Test typeahead search by code and word prefixes."""
+    results = station.search_prefix(text)
+    assert 0 < len(results) <= 10
+    assert results[0].lookup_code == code
+
+
+def test_search_prefix_words() -> None:
+    """Test that every prefix result matches every search word."""
+    results = station.search_prefix("san fr", 50, sends_reports=False)
+    assert len(results) > 10
+    for stn in results:
+        words = " ".join(filter(None, (stn.icao, stn.iata, stn.gps, stn.local, stn.city, stn.state, stn.name)))
+        tokens = re.split(r"[\W_]+", words.lower())
+        assert any(t.startswith("san") for t in tokens)
+        assert any(t.startswith("fr") for t in tokens)
+
+
+def test_search_prefix_filter() -> None:
+    """Test prefix search result filtering."""
+    for stn in station.search_prefix("orl", 50, is_airport=True, sends_reports=False):
+        assert "airport" in stn.type
+    for stn in station.search_prefix("orl", 50):
+        assert stn.reporting is True
+    assert station.search_prefix("zzzzzz") == []
+    assert station.search_prefix(" - ") == []
+
+
+def _station_info(name: str, **kwargs: Any) -> dict[str, Any]:
+    info = {
+        "city": None,
+        "country": "US",
+        "elevation_ft": None,
+        "elevation_m": None,
+        "gps": None,
+        "iata": None,
+        "icao": None,
+        "latitude": 0.0,
+        "local": None,
+        "longitude": 0.0,
+        "name": name,
+        "note": None,
+        "reporting": False,
+        "runways": None,
+        "state": None,
+        "type": "small_airport",
+        "website": None,
+        "wiki": None,
+    }
+    return info | kwargs
+
+
+_STORE_STATIONS = {
+    "KJFK": _station_info(
+        "John F Kennedy International Airport",
+        city="New York",
+        elevation_ft=13,
+        elevation_m=4,
+        icao="KJFK",
+        iata="JFK",
+        latitude=40.639447,
+        longitude=-73.779317,
+        reporting=True,
+        runways=[
+            {
+                "length_ft": 14511,
+                "width_ft": 200,
+                "surface": "asphalt",
+                "lights": True,
+                "ident1": "13R",
+                "ident2": "31L",
+                "bearing1": 121.0,
+                "bearing2": None,
+            },
+            {
+                "length_ft": 8400,
+                "width_ft": 200,
+                "surface": None,
+                "lights": False,
+                "ident1": "4R",
+                "ident2": "22L",
+                "bearing1": None,
+                "bearing2": None,
+            },
+        ],
+    ),
+    "SBGR": _station_info("Aeroporto Internacional de São Paulo", elevation_ft=-12, elevation_m=-4, runways=[]),
+    "00A": _station_info("Total Rf Heliport", gps="00A", local="00A", latitude=-40.0702, longitude=180.0),
+}
+
+
+def test_station_store(tmp_path: Path) -> None:
+    """Test that the binary station store returns the same records as the source."""
+    path = tmp_path / "stations.bin"
+    write_station_store(_STORE_STATIONS, path)
+    store = StationStore(path)
+    assert len(store) == 3
+    assert list(store) == sorted(_STORE_STATIONS)
+    assert dict(store.items()) == _STORE_STATIONS
+    assert list(store.values()) == [_STORE_STATIONS[k] for k in sorted(_STORE_STATIONS)]
+    for key, info in _STORE_STATIONS.items():
+        assert key in store
+        assert store[key] == info
+    for key in ("", "KJF", "KJFKX", "ZZZZ", "0"):
+        assert key not in store
+        with pytest.raises(KeyError):
+            store[key]
+
+
+def test_bad_station_store(tmp_path: Path) -> None:
+    path = tmp_path / "stations.bin"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError, match="not a supported station store"):
+        StationStore(path)
+
+
+def test_lazy_station_store(tmp_path: Path) -> None:
+    """Test that the JSON source is used if the binary store is missing or outdated."""
+    lazy = LazyStationStore("stations")
+    lazy.source = tmp_path / "stations.json"
+    lazy.store = tmp_path / "stations.bin"
+    lazy.source.write_text(json.dumps(_STORE_STATIONS))
+    assert lazy._store_current is False
+    assert lazy["KJFK"] == _STORE_STATIONS["KJFK"]
+    assert isinstance(lazy._data, dict)
+    write_station_store(_STORE_STATIONS, lazy.store)
+    lazy._data = None
+    assert lazy._store_current is True
+    assert lazy["KJFK"] == _STORE_STATIONS["KJFK"]
+    assert isinstance(lazy._data, StationStore)
+    # Newer JSON source
+    mtime = lazy.store.stat().st_mtime + 10
+    os.utime(lazy.source, (mtime, mtime))
+    assert lazy._store_current is False
+
+
+def test_station_store_indexes(tmp_path: Path) -> None:
+    """Test that the store code and coordinate indexes match those built from the source."""
+    path = tmp_path / "stations.bin"
+    write_station_store(_STORE_STATIONS, path)
+    store = StationStore(path)
+    items = sorted(_STORE_STATIONS.items())
+    assert dict(store.codes) == build_code_index(items)
+    assert store.codes["JFK"] == StationCodes(icao=None, gps=None, iata="KJFK", local=None)
+    assert store.codes["00A"] == StationCodes(icao=None, gps="00A", iata=None, local="00A")
+    assert "SBGR" not in store.codes
+    assert store.coords() == build_coords(v for _, v in items)
+    assert store.coords()[0] == ("00A", -40.0702, 180.0)
+
+
+@pytest.mark.parametrize("use_store", [True, False])
+def test_lazy_station_store_indexes(tmp_path: Path, use_store: bool) -> None:
+    """Test that code and coordinate indexes are the same with or without the store."""
+    lazy = LazyStationStore("stations")
+    lazy.source = tmp_path / "stations.json"
+    lazy.store = tmp_path / "stations.bin"
+    lazy.source.write_text(json.dumps(_STORE_STATIONS, sort_keys=True))
+    if use_store:
+        write_station_store(_STORE_STATIONS, lazy.store)
+    assert dict(lazy.codes) == build_code_index(sorted(_STORE_STATIONS.items()))
+    assert lazy.coords() == build_coords(v for _, v in sorted(_STORE_STATIONS.items()))
+    assert lazy.coord_flags() == bytes((COORD_AIRPORT, COORD_AIRPORT | COORD_REPORTING, COORD_AIRPORT))
+    # Only KJFK is reporting, so filtered trees skip the closer stations
+    assert [i for i, _ in lazy.coord_tree().query(-23, -46, 3)] == [2, 1, 0]
+    assert [i for i, _ in lazy.coord_tree(COORD_REPORTING).query(-23, -46, 3)] == [1]
+    assert isinstance(lazy._data, StationStore) is use_store
+
+
+_TREE_COORDS = [
+    (0, 179.9),
+    (0, -179.9),
+    (0, 178),
+    (89.9, 0),
+    (89.9, 180),
+    (88, 90),
+    (-45, 10),
+    (-45.5, 10.5),
+    (40.64, -73.78),
+    (51.47, -0.46),
+]
+
+
+def _brute_nearest(lat: float, lon: float, k: int, max_degrees: float) -> list[tuple[int, float]]:
+    target = spatial.to_xyz(lat, lon)
+    dists = [(spatial.chord_to_degrees(math.dist(target, spatial.to_xyz(*c))), i) for i, c in enumerate(_TREE_COORDS)]
+    return [(i, d) for d, i in sorted(dists)[:k] if d <= max_degrees]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize(
+    ("lat", "lon", "k", "max_degrees", "first"),
+    [
+        (0, 180, 2, 1, 0),
+        (0, -179.95, 3, 10, 1),
+        (90, 0, 3, 5, 3),
+        (89, -90, 3, 180, 3),
+        (-45.2, 10.2, 10, 180, 6),
+        (40.7, -74, 1, 180, 8),
+    ],
+)
+def test_coord_tree(
+    lat: float,
+    lon: float,
+    k: int,
+    max_degrees: float,
+    first: int,
+    use_numpy: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that tree queries match great-circle brute force at the poles and antimeridian."""
+    if not use_numpy:
+        monkeypatch.setattr(spatial, "np", None)
+    tree = spatial.CoordTree(_TREE_COORDS, leafsize=2)
+    result = tree.query(lat, lon, k, max_degrees)
+    assert result[0][0] == first
+    expected = _brute_nearest(lat, lon, k, max_degrees)
+    assert [i for i, _ in result] == [i for i, _ in expected]
+    assert [d for _, d in result] == pytest.approx([d for _, d in expected])
+
+
+def test_coord_tree_limits() -> None:
+    tree = spatial.CoordTree(_TREE_COORDS, leafsize=2)
+    assert tree.query(0, 0, 0) == []
+    assert tree.query(0, 0, 3, max_degrees=1) == []
+    assert len(tree.query(0, 0, 100)) == len(_TREE_COORDS)
+    assert spatial.CoordTree([]).query(0, 0, 1) == []
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_coord_tree_query_many(batch: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that batch queries match single queries with and without SciPy."""
+    tree = spatial.CoordTree(_TREE_COORDS, leafsize=2, ids=[i * 10 for i in range(len(_TREE_COORDS))])
+    if not batch:
+        monkeypatch.setattr(tree, "_batch", None, raising=False)
+    else:
+        assert tree._batch_tree() is not None
+    points = [(0, 180), (89, 1), (40, -74), (-89, 45), (1, 2)]
+    for k, max_degrees in ((1, 180), (3, 180), (3, 1), (100, 180)):
+        results = tree.query_many(points, k, max_degrees)
+        for (lat, lon), result in zip(points, results, strict=True):
+            expected = tree.query(lat, lon, k, max_degrees)
+            assert [i for i, _ in result] == [i for i, _ in expected]
+            assert [d for _, d in result] == pytest.approx([d for _, d in expected])
+    assert tree.query_many(points, 0) == [[]] * len(points)
+    assert tree.query_many([]) == []
+    np = pytest.importorskip("numpy")
+    assert tree.query_many(np.array(points), 3) == tree.query_many(points, 3)
+    assert tree.query_many(np.empty((0, 2))) == []
+
+
+def test_coord_tree_serialize(tmp_path: Path) -> None:
+    """Test that a saved tree returns the same results."""
+    tree = spatial.CoordTree(_TREE_COORDS, leafsize=2)
+    path = tmp_path / "coords.tree"
+    tree.save(path)
+    loaded = spatial.CoordTree.load(path)
+    assert len(loaded) == len(tree)
+    for lat, lon in ((0, 180), (90, 0), (40, -74)):
+        assert loaded.query(lat, lon, 5) == tree.query(lat, lon, 5)
+    assert loaded.to_bytes() == tree.to_bytes()
+    with pytest.raises(ValueError, match="not a supported coordinate tree"):
+        spatial.CoordTree.from_bytes(b"\0" * 32)
+    with pytest.raises(ValueError, match="truncated"):
+        spatial.CoordTree.from_bytes(tree.to_bytes()[:-1])
+
+
+@pytest.mark.parametrize("required", COORD_FILTERS)
+def test_station_store_coord_tree(tmp_path: Path, required: int) -> None:
+    """Test that the store's filtered coordinate trees match the store's coordinates."""
+    path = tmp_path / "stations.bin"
+    write_station_store(_STORE_STATIONS, path)
+    store = StationStore(path)
+    coords, flags = store.coords(), store.coord_flags()
+    tree = store.coord_tree(required)
+    assert len(tree) == sum(f & required == required for f in flags)
+    # Tree arrays are views of the mapped file rather than copies
+    assert tree._xs.obj is store._map  # type: ignore[attr-defined]
+    for index, (_, lat, lon) in enumerate(coords):
+        nodes = tree.query(lat, lon, len(coords))
+        assert all(flags[i] & required == required for i, _ in nodes)
+        if flags[index] & required == required:
+            assert nodes[0][0] == index
+            assert nodes[0][1] == pytest.approx(0, abs=1e-6)
+
+
+def test_coord_tree_ids() -> None:
+    """Test that a subset tree returns the given ids."""
+    ids = [3, 8, 9]
+    tree = spatial.CoordTree([_TREE_COORDS[i] for i in ids], ids=ids)
+    assert [i for i, _ in tree.query(40.7, -74, 3)] == [8, 3, 9]
+
+
+# Test station caches
+
+
+def test_memoize_bounds() -> None:
+    """Test that memoized results are bounded and counted."""
+    calls: list[int] = []
+
+    @memoize(maxsize=2)
+    def double(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    assert [double(1), double(2), double(1), double(3), double(2)] == [2, 4, 2, 6, 4]
+    assert calls == [1, 2, 3, 2]
+    assert double.cache_info() == CacheInfo(hits=1, misses=4, evictions=2, expired=0, size=2, maxsize=2)
+    assert cache_stats()[f"{__name__}.test_memoize_bounds.<locals>.double"] == double.cache_info()
+    clear_caches()
+    assert len(double.cache) == 0
+
+
+def test_memoize_same_name() -> None:
+    """Test that functions sharing a name keep separate registry entries."""
+
+    @memoize()
+    def search(value: int) -> int:
+        return value
+
+    search(1)
+    stats = cache_stats()
+    assert stats[f"{__name__}.test_memoize_same_name.<locals>.search"] == search.cache_info()
+    assert "avwx.station.search.search" in stats
+    clear_caches()
+    assert len(search.cache) == 0
+
+
+def test_memoize_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that memoized results expire after the ttl."""
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    calls: list[str] = []
+
+    @memoize(ttl=10)
+    def echo(value: str) -> str:
+        calls.append(value)
+        return value
+
+    echo("a")
+    now += 5
+    echo("a")
+    assert calls == ["a"]
+    now += 10
+    echo("a")
+    assert calls == ["a", "a"]
+    assert echo.cache_info().expired == 1
+
+
+def test_memoize_precision() -> None:
+    """Test that nearby float arguments share a cache entry."""
+    calls: list[tuple[float, float]] = []
+
+    @memoize(precision=2)
+    def point(lat: float, lon: float, *, name: str = "") -> tuple[float, float]:  # noqa: ARG001
+        calls.append((lat, lon))
+        return lat, lon
+
+    assert point(30.001, -80.004) == (30.0, -80.0)
+    assert point(29.998, -79.996, name="") == (30.0, -80.0)
+    assert point(29.998, -79.996) == (30.0, -80.0)
+    assert calls == [(30.0, -80.0), (30.0, -80.0)]
+
+
+def test_station_caches() -> None:
+    """Test that station lookups use the shared caches."""
+    clear_caches()
+    station.nearest(30, -80, 3)
+    station.nearest(30, -80, 3)
+    stats = cache_stats()
+    assert stats["avwx.station.station._query_filter"].hits >= 1
+    assert stats["avwx.station.station._query_filter"].size == 1
+    assert "avwx.station.search.search" in stats
+
+
+# Test station data reload
+
+
+@pytest.fixture
+def restore_stations() -> Iterator[None]:
+    """Reload the package station data after the test."""
+    yield
+    station.reload()
+
+
+@pytest.mark.usefixtures("restore_stations")
+@pytest.mark.parametrize("use_store", [True, False])
+def test_reload(tmp_path: Path, use_store: bool) -> None:
+    """Test that reloading replaces station data, indexes, and caches."""
+    klex = station.Station.from_code("KLEX")
+    assert station.search_prefix("KLEX")[0] is klex
+    assert station.nearest(38.04, -84.61)["station"] is klex  # type: ignore[call-overload]
+    info = _STORE_STATIONS | {"KLEX": _station_info("New Lexington", icao="KLEX", latitude=38, longitude=-84.6)}
+    path = tmp_path / "stations.json"
+    path.write_text(json.dumps(info))
+    if use_store:
+        path = path.with_suffix(".bin")
+        write_station_store(info, path)
+    station.reload(path)
+    assert len(STATIONS) == 4
+    assert station.Station.from_code("KLEX").name == "New Lexington"
+    assert station.search_prefix("new lex", sends_reports=False)[0].name == "New Lexington"
+    nearest = station.nearest(38.04, -84.61, sends_reports=False)
+    assert isinstance(nearest, dict)
+    assert nearest["station"].name == "New Lexington"
+    with pytest.raises(exceptions.BadStation):
+        station.Station.from_code("KMCO")
+    assert isinstance(STATIONS._data, StationStore) is use_store
+
+
+def test_reload_swap() -> None:
+    """Test that a prepared store replaces the current data at once."""
+    prepared = STATIONS.prepare()
+    assert prepared._data is not STATIONS._data
+    assert prepared._trees is not None
+    assert len(prepared._trees) == len(COORD_FILTERS)
+    coords, tree = prepared.coord_index()
+    assert len(tree) == len(coords) == len(prepared)
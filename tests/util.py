@@ -4,16 +4,21 @@
 from __future__ import annotations
 
 import json
-from contextlib import suppress
+import threading
+import time
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import parse_qs, urlparse
 
 # module
-from avwx import structs
+from avwx import Metar, structs
+from avwx.service.scrape import StationScrape
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
 
 def assert_number(
@@ -94,3 +99,76 @@ def round_coordinates(data: Any) -> Any:
     elif isinstance(data, list):
         data = [round_coordinates(i) for i in data]
     return data
+
+
+@contextmanager
+def stub_server(respond: Callable[[str, dict[str, list[str]]], str | None]) -> Iterator[tuple[str, list[str]]]:
+    """Run a local HTTP server answering GET requests with respond(path, query).
+
+    A None response is returned as a 500 server error.
+
+    Yields the server root URL and the list of requested paths with queries.
+    """
+    requests: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requests.append(self.path)
+            url = urlparse(self.path)
+            text = respond(url.path, parse_qs(url.query))
+            body = b"" if text is None else text.encode()
+            self.send_response(500 if text is None else 200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class StubScrape(StationScrape):
+    """Station scraper that returns the stub server response as the report."""
+
+    _url: ClassVar[str] = ""
+
+    def _make_url(self, station: str) -> tuple[str, dict]:
+        return self._url, {"ids": station}
+
+    def _extract(self, raw: str, station: str) -> str:
+        if not raw:
+            msg = f"No report for {station}"
+            raise self._make_err(msg)
+        return raw
+
+
+def stub_service(url: str, report_type: str = "metar", **attrs: Any) -> StubScrape:
+    """Return a StubScrape fetching from a stub server URL with extra class attributes."""
+    return type("Stub", (StubScrape,), {"_url": url, **attrs})(report_type)
+
+
+def stub_metars(url: str, codes: list[str], **attrs: Any) -> list[Metar]:
+    """Return Metar objects for each code sharing one StubScrape service."""
+    service = stub_service(url, **attrs)
+    reports = []
+    for code in codes:
+        report = Metar(code)
+        report.service = service
+        reports.append(report)
+    return reports
+
+
+def slow_report(path: str, query: dict[str, list[str]]) -> str:  # noqa: ARG001
+    """Stub server response with a current METAR for the requested station after a short delay."""
+    time.sleep(0.1)
+    # Recent timestamp so Metar doesn't check NOAA for a newer report
+    timestamp = datetime.now(tz=timezone.utc).strftime(r"%d%H%MZ")
+    return f"{query['ids'][0]} {timestamp} 16008KT 10SM FEW034 BKN250 27/23 A3013"
@@ -0,0 +1,55 @@
+"""Benchmark cached AirSigObservation geometry against per-call construction."""
+
+# ruff: noqa: INP001,T201
+
+# stdlib
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+# library
+from shapely.geometry import Point, Polygon
+
+# module
+from avwx.current.airsigmet import AirSigmet
+
+REPORT = (
+    "WSPR31 SPJC 270529 SPIM SIGMET 3 VALID 270530/270830 SPJC- SPIM LIMA FIR "
+    "EMBD TS OBS AT 0510Z WI S0406 W07103 - S0358 W07225 - S0235 W07432 - "
+    "S0114 W07503 - S0406 W07103 TOP FL410 MOV SW NC="
+)
+CHECKS = 10_000
+
+
+def main() -> None:
+    """Run the point-in-polygon benchmark."""
+    sigmet = AirSigmet.from_report(REPORT)
+    if sigmet is None or sigmet.data is None or sigmet.data.observation is None:
+        msg = "Unable to parse benchmark report"
+        raise ValueError(msg)
+    obs = sigmet.data.observation
+    rand = random.Random(42)  # noqa: S311
+    pairs = [(rand.uniform(-5, 0), rand.uniform(-76, -70)) for _ in range(CHECKS)]
+
+    def per_call() -> int:
+        return sum(Point(*p).within(Polygon([c.pair for c in obs.coords])) for p in pairs)
+
+    def cached() -> int:
+        return sum(Point(*p).within(obs.poly) for p in pairs)
+
+    def prepared() -> int:
+        return sum(obs.prepared_poly.contains(Point(*p)) for p in pairs)  # type: ignore
+
+    if not per_call() == cached() == prepared():
+        msg = "Benchmark paths disagree"
+        raise ValueError(msg)
+    for name, func in (("per-call", per_call), ("cached", cached), ("prepared", prepared)):
+        seconds = timeit(func, number=5) / 5
+        print(f"{name:>10}: {seconds * 1000:8.2f} ms per {CHECKS} checks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Check package import times against budgets using `python -X importtime`."""
+
+# ruff: noqa: INP001,T201
+
+# stdlib
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.absolute()
+
+#: Cumulative import time budgets in microseconds
+BUDGETS = {
+    "avwx": 25_000,
+    "avwx.current.metar": 250_000,
+}
+
+
+def cumulative_us(module: str) -> int:
+    """Return the cumulative import time of a module in a fresh interpreter."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    ).stderr
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and cumulative.strip().isdigit():
+            return int(cumulative)
+    msg = f"{module} not found in import time output"
+    raise ValueError(msg)
+
+
+def main() -> int:
+    """Print best of three import times and return non-zero if any are over budget."""
+    over = 0
+    for module, budget in BUDGETS.items():
+        best = min(cumulative_us(module) for _ in range(3))
+        status = "ok" if best < budget else "OVER"
+        over += best >= budget
+        print(f"{module}: {best / 1000:.1f} ms (budget {budget / 1000:.0f} ms) {status}")
+    return int(over > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Profile METAR parsing over a generated 5000 report corpus."""
+
+# ruff: noqa: INP001,T201,S311
+
+# stdlib
+import cProfile
+import pstats
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+# module
+from avwx.current.metar import parse
+from avwx.parsing import core
+
+STATIONS = ("KJFK", "KMCO", "KLAX", "KORD", "PHNL", "EGLL", "EDDF", "LFPG", "RJTT", "YSSY", "CYYZ", "KDEN")
+WX = ("", "", "", "-RA", "BR", "HZ", "+TSRA", "VCSH", "-SN BR", "FG")
+CLOUDS = ("FEW", "SCT", "BKN", "OVC")
+SIZE = 5000
+
+
+def _na(rng: random.Random, station: str) -> str:
+    clouds = " ".join(f"{rng.choice(CLOUDS)}{rng.randrange(5, 250, 5):03}" for _ in range(rng.randint(0, 3))) or "CLR"
+    temp = rng.randint(-15, 35)
+    dew = temp - rng.randint(0, 10)
+    fmt = lambda v: f"M{-v:02}" if v < 0 else f"{v:02}"  # noqa: E731
+    wind = f"{rng.randrange(0, 360, 10):03}{rng.randint(0, 25):02}" + (f"G{rng.randint(26, 40)}" if rng.random() < 0.2 else "")
+    vis = rng.choice(("10SM", "10SM", "5SM", "1/2SM", "3SM", "2 1/2SM"))
+    slp = rng.randint(0, 999)
+    return (
+        f"{station} {rng.randint(1, 28):02}{rng.randint(0, 23):02}{rng.choice((51, 53, 56))}Z {wind}KT {vis} "
+        f"{rng.choice(WX)} {clouds} {fmt(temp)}/{fmt(dew)} A{rng.randint(2950, 3050)} "
+        f"RMK AO2 SLP{slp:03} T{int(temp < 0)}{abs(temp) * 10:03}{int(dew < 0)}{abs(dew) * 10:03}"
+    )
+
+
+def _in(rng: random.Random, station: str) -> str:
+    clouds = " ".join(f"{rng.choice(CLOUDS)}{rng.randrange(5, 100, 5):03}" for _ in range(rng.randint(0, 3))) or "NSC"
+    temp = rng.randint(-15, 35)
+    dew = temp - rng.randint(0, 10)
+    fmt = lambda v: f"M{-v:02}" if v < 0 else f"{v:02}"  # noqa: E731
+    vis = rng.choice(("9999", "9999", "CAVOK", "4000", "0800"))
+    if vis == "CAVOK":
+        clouds = ""
+    return (
+        f"{station} {rng.randint(1, 28):02}{rng.randint(0, 23):02}{rng.choice((20, 50))}Z "
+        f"{rng.randrange(0, 360, 10):03}{rng.randint(0, 25):02}KT {vis} {rng.choice(WX)} {clouds} "
+        f"{fmt(temp)}/{fmt(dew)} Q{rng.randint(990, 1035)} {rng.choice(('NOSIG', 'BECMG 4000 BR', ''))}"
+    )
+
+
+def corpus(size: int = SIZE, seed: int = 0) -> list[tuple[str, str]]:
+    """Return a repeatable list of station, report pairs."""
+    rng = random.Random(seed)
+    reports = []
+    for _ in range(size):
+        station = rng.choice(STATIONS)
+        make = _na if station[0] in "KPC" else _in
+        reports.append((station, " ".join(make(rng, station).split())))
+    return reports
+
+
+def main() -> None:
+    """Print parse throughput and the top profiled functions."""
+    reports = corpus()
+    start = time.perf_counter()
+    for station, report in reports:
+        parse(station, report)
+    elapsed = time.perf_counter() - start
+    print(f"Parsed {len(reports)} METARs in {elapsed:.2f} s ({len(reports) / elapsed:.0f}/s)")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for station, report in reports:
+        parse(station, report)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats("tottime").print_stats(25)
+    for func in (core.classify, core.make_cloud, core._make_number):  # noqa: SLF001
+        print(f"{func.__name__}: {func.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark report string and list sanitization throughput over the test case corpus."""
+
+# ruff: noqa: INP001,T201
+
+# stdlib
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+# module
+from avwx.parsing.sanitization.metar import clean_metar_list, clean_metar_string
+from avwx.parsing.sanitization.taf import clean_taf_list, clean_taf_string
+from avwx.structs import Sanitization
+
+DATA_PATH = Path(__file__).parent.parent / "tests" / "parsing" / "data"
+CASES = {
+    "metar": (clean_metar_string, clean_metar_list, DATA_PATH / "sanitize_metar_list_cases.json"),
+    "taf": (clean_taf_string, clean_taf_list, DATA_PATH / "sanitize_taf_list_cases.json"),
+}
+RUNS = 2000
+
+
+def throughput(func: Callable, reports: list) -> float:
+    """Return sanitized reports per second."""
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        for report in reports:
+            func(report.copy() if isinstance(report, list) else report, Sanitization())
+    return RUNS * len(reports) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print string and list sanitization throughput for each report type."""
+    print(f"{'report':>6} {'string':>16} {'list':>16}")
+    for name, (clean_string, clean_list, path) in CASES.items():
+        reports = [case["report"] for case in json.load(path.open())]
+        strings = throughput(clean_string, reports)
+        lists = throughput(clean_list, [report.split() for report in reports])
+        print(f"{name:>6} {strings:10.0f} rpt/s {lists:10.0f} rpt/s")
+
+
+if __name__ == "__main__":
+    main()
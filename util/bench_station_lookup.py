@@ -0,0 +1,53 @@
+"""Benchmark the first Station.from_code call on a cold process."""
+
+# ruff: noqa: INP001,T201,S603
+
+# stdlib
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.absolute()
+RUNS = 5
+
+# Runs in a fresh interpreter so nothing is loaded or cached yet
+SCRIPT = """
+import sys, time
+from pathlib import Path
+sys.path.insert(0, {root!r})
+from avwx.station.meta import STATIONS
+from avwx.station.station import Station
+if {json}:
+    STATIONS.store = Path("/nonexistent")
+start = time.perf_counter()
+Station.from_code("KJFK")
+first = time.perf_counter() - start
+start = time.perf_counter()
+Station.from_code("JFK")
+Station.from_code("00A")
+second = (time.perf_counter() - start) / 2
+print(first, second)
+"""
+
+
+def cold_start(*, json: bool) -> tuple[float, float]:
+    """Return the median first and warm lookup times in seconds."""
+    times = []
+    for _ in range(RUNS):
+        script = SCRIPT.format(root=str(ROOT), json=json)
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True)
+        first, second = output.stdout.split()
+        times.append((float(first), float(second)))
+    return statistics.median(t[0] for t in times), statistics.median(t[1] for t in times)
+
+
+def main() -> None:
+    """Compare the JSON source against the binary station store."""
+    for name, json in (("JSON", True), ("Store", False)):
+        first, warm = cold_start(json=json)
+        print(f"{name:>5}: first {first * 1000:8.2f} ms, warm {warm * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
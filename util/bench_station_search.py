@@ -0,0 +1,56 @@
+"""Benchmark station text and typeahead search latency."""
+
+# ruff: noqa: INP001,T201
+
+# stdlib
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+# module
+from avwx.station.search import _INDEX, search, search_prefix
+
+QUERIES = [
+    "KJFK",
+    "MCO",
+    "EGL",
+    "k",
+    "orlando",
+    "san fr",
+    "lexington ky",
+    "danville powell field",
+    "frankfurt",
+    "xyzzy",
+]
+RUNS = 50
+
+
+def latency(func: Callable, text: str) -> float:
+    """Return the median call time in seconds, skipping any result cache."""
+    call = getattr(func, "__wrapped__", func)
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        call(text)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Print search and search_prefix latency for common query shapes."""
+    start = time.perf_counter()
+    _INDEX.value  # noqa: B018
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{'query':>24} {'search':>10} {'prefix':>10}")
+    for text in QUERIES:
+        fuzzy = latency(search, text)
+        prefix = latency(search_prefix, text)
+        print(f"{text:>24} {fuzzy * 1e6:8.0f}us {prefix * 1e6:8.0f}us")
+
+
+if __name__ == "__main__":
+    main()